@@ -6,6 +6,7 @@ using the system keyring for credential storage.
 """
 
 from .keyring_auth import KeyringAuthFixed
+from .remember_me import RememberMe
 from .session_manager import SessionManager
 
-__all__ = ['KeyringAuthFixed', 'SessionManager']
\ No newline at end of file
+__all__ = ['KeyringAuthFixed', 'RememberMe', 'SessionManager']
\ No newline at end of file
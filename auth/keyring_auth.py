@@ -1,12 +1,22 @@
 import keyring
+import bcrypt
 import hashlib
 import secrets
 import json
+import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, Tuple
 import re
 import platform
 
+from config.app_paths import AppPaths
+from diagnostics.tracing import span, traced
+
+log = logging.getLogger(__name__)
+
 # Separate service names to avoid Windows Credential Manager conflicts
 USER_SERVICE_NAME = "SentinelApp-Users"
 SESSION_SERVICE_NAME = "SentinelApp-Sessions"
@@ -17,6 +27,15 @@ SESSION_PREFIX = "session"
 SESSION_EXPIRY_HOURS = 24
 SESSION_EXPIRY_SECONDS = SESSION_EXPIRY_HOURS * 3600
 
+# Keyring cannot enumerate entries, so usernames and their last update time
+# are tracked in a local index file (no credentials are stored in it)
+USER_INDEX_FILE = "user_index.json"
+_index_lock = threading.Lock()
+
+# Legacy password upgrades (bcrypt hashing + keyring write) run here, off the login path;
+# the thread is only started by the first upgrade
+_upgrade_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PasswordUpgrade")
+
 class KeyringAuthFixed:
     @staticmethod
     def _hash_password(password: str) -> str:
@@ -104,7 +123,37 @@ class KeyringAuthFixed:
         return success
 
     @staticmethod
-    def register_user(username: str, fullname: str, phone: str, email: str, password: str) -> Tuple[bool, str]:
+    def _load_user_index() -> Dict[str, float]:
+        try:
+            with open(AppPaths.data_path(USER_INDEX_FILE), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _update_user_index(username: str, updated_at: Optional[float]) -> None:
+        """Record (or with updated_at=None, remove) a user in the local index"""
+        with _index_lock:
+            index = KeyringAuthFixed._load_user_index()
+            if updated_at is None:
+                index.pop(username, None)
+            else:
+                index[username] = updated_at
+            path = AppPaths.data_path(USER_INDEX_FILE)
+            with open(path + ".tmp", "w") as f:
+                json.dump(index, f)
+            os.replace(path + ".tmp", path)
+
+    @staticmethod
+    def list_users() -> Dict[str, float]:
+        """Return {username: updated_at} for all locally stored users"""
+        with _index_lock:
+            return KeyringAuthFixed._load_user_index()
+
+    @staticmethod
+    @traced("auth.register_user", "auth")
+    def register_user(username: str, fullname: str, phone: str, email: str, password: str,
+                      password_bcrypt: Optional[str] = None) -> Tuple[bool, str]:
         """Register a new user with improved validation"""
         try:
             # Clean and validate inputs
@@ -124,19 +173,12 @@ class KeyringAuthFixed:
             if existing_user:
                 return False, "Username already exists"
 
-            # Create user data
-            user_data = {
-                "username": username,
-                "fullname": fullname,
-                "phone": phone,
-                "email": email,
-                "password_hash": KeyringAuthFixed._hash_password(password),
-                "created_at": KeyringAuthFixed._get_timestamp()
-            }
-
-            # Store user data with separate service name
-            user_key = f"{USER_DATA_PREFIX}_{username}"
-            keyring.set_password(USER_SERVICE_NAME, user_key, json.dumps(user_data))
+            # Create and store user data
+            user_data = KeyringAuthFixed.build_user_record(
+                username, fullname, phone, email, KeyringAuthFixed._hash_password(password),
+                password_bcrypt=password_bcrypt
+            )
+            KeyringAuthFixed.store_user_record(user_data)
 
             return True, "User registered successfully"
 
@@ -144,6 +186,39 @@ class KeyringAuthFixed:
             return False, f"Registration failed: {str(e)}"
 
     @staticmethod
+    def build_user_record(username: str, fullname: str, phone: str, email: str, password_hash: Optional[str],
+                          password_bcrypt: Optional[str] = None) -> Dict[str, Any]:
+        """Build the stored user record from already hashed passwords.
+
+        password_bcrypt is the same hash MongoDB stores; keeping it locally lets
+        the record be synced between the two stores.
+        """
+        user_data = {
+            "username": KeyringAuthFixed._clean_username(username),
+            "fullname": fullname,
+            "phone": phone,
+            "email": email,
+            "created_at": KeyringAuthFixed._get_timestamp(),
+            "updated_at": time.time()
+        }
+        if password_hash:
+            user_data["password_hash"] = password_hash
+        if password_bcrypt:
+            user_data["password_bcrypt"] = password_bcrypt
+        return user_data
+
+    @staticmethod
+    def store_user_record(user_data: Dict[str, Any]) -> None:
+        """Write a user record to the keyring (overwrites any existing entry)"""
+        user_data.setdefault("updated_at", time.time())
+        # Store user data with separate service name
+        user_key = f"{USER_DATA_PREFIX}_{user_data['username']}"
+        with span("keyring.set_password", "keyring"):
+            keyring.set_password(USER_SERVICE_NAME, user_key, json.dumps(user_data))
+        KeyringAuthFixed._update_user_index(user_data["username"], user_data["updated_at"])
+
+    @staticmethod
+    @traced("auth.authenticate_user", "auth")
     def authenticate_user(username: str, password: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
         """Authenticate user with improved session management"""
         try:
@@ -153,33 +228,72 @@ class KeyringAuthFixed:
             if not user_data:
                 return False, "User not found", None
 
-            password_hash = KeyringAuthFixed._hash_password(password)
-            if user_data["password_hash"] != password_hash:
+            if "password_hash" in user_data:
+                password_ok = user_data["password_hash"] == KeyringAuthFixed._hash_password(password)
+            elif user_data.get("password_bcrypt"):
+                # Records pulled from MongoDB only carry the bcrypt hash
+                with span("bcrypt.checkpw", "auth"):
+                    password_ok = bcrypt.checkpw(password.encode('utf-8'), user_data["password_bcrypt"].encode('utf-8'))
+            else:
+                password_ok = False
+            if not password_ok:
                 return False, "Incorrect password", None
 
-            # Generate and store session with expiration
-            token = KeyringAuthFixed._generate_token()
-            session_data = KeyringAuthFixed._create_session_data(token)
+            if not user_data.get("password_bcrypt"):
+                # Upgrade records created before the bcrypt hash was kept locally,
+                # so the user sync can push them to MongoDB
+                _upgrade_executor.submit(KeyringAuthFixed._upgrade_legacy_record, username, password)
 
-            session_key = f"{SESSION_PREFIX}_{username}"
-            keyring.set_password(SESSION_SERVICE_NAME, session_key, session_data)
+            # Generate and store session with expiration
+            KeyringAuthFixed.start_session(username)
 
             # Remove password hash from returned data
             user_data_safe = user_data.copy()
-            del user_data_safe["password_hash"]
+            user_data_safe.pop("password_hash", None)
+            user_data_safe.pop("password_bcrypt", None)
 
             return True, "Authentication successful", user_data_safe
 
         except Exception as e:
             return False, f"Authentication failed: {str(e)}", None
 
+    @staticmethod
+    @traced("auth.upgrade_legacy_record", "auth")
+    def _upgrade_legacy_record(username: str, password: str) -> None:
+        """Add the bcrypt hash to a legacy record (background thread, after a successful login)"""
+        try:
+            user_data = KeyringAuthFixed.get_user(username)
+            # Re-read: the record may have been upgraded or its password changed meanwhile
+            if not user_data or user_data.get("password_bcrypt") or \
+                    user_data.get("password_hash") != KeyringAuthFixed._hash_password(password):
+                return
+            with span("bcrypt.hashpw", "auth"):
+                user_data["password_bcrypt"] = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+            user_data["updated_at"] = time.time()
+            KeyringAuthFixed.store_user_record(user_data)
+        except Exception as e:
+            log.warning("Could not upgrade password record for %s: %s", username, e)
+
+    @staticmethod
+    def start_session(username: str) -> str:
+        """Store a new expiring session for an authenticated user; returns its token"""
+        username = KeyringAuthFixed._clean_username(username)
+        token = KeyringAuthFixed._generate_token()
+        session_data = KeyringAuthFixed._create_session_data(token)
+
+        session_key = f"{SESSION_PREFIX}_{username}"
+        with span("keyring.set_password", "keyring", entry="session"):
+            keyring.set_password(SESSION_SERVICE_NAME, session_key, session_data)
+        return token
+
     @staticmethod
     def get_user(username: str) -> Optional[Dict[str, Any]]:
         """Get user data by username"""
         try:
             username = KeyringAuthFixed._clean_username(username)
             user_key = f"{USER_DATA_PREFIX}_{username}"
-            user_data_json = keyring.get_password(USER_SERVICE_NAME, user_key)
+            with span("keyring.get_password", "keyring", entry="user"):
+                user_data_json = keyring.get_password(USER_SERVICE_NAME, user_key)
 
             if user_data_json:
                 return json.loads(user_data_json)
@@ -193,7 +307,8 @@ class KeyringAuthFixed:
         try:
             username = KeyringAuthFixed._clean_username(username)
             session_key = f"{SESSION_PREFIX}_{username}"
-            session_data = keyring.get_password(SESSION_SERVICE_NAME, session_key)
+            with span("keyring.get_password", "keyring", entry="session"):
+                session_data = keyring.get_password(SESSION_SERVICE_NAME, session_key)
 
             if not session_data:
                 return False
@@ -266,6 +381,7 @@ class KeyringAuthFixed:
             # Delete user data
             user_key = f"{USER_DATA_PREFIX}_{username}"
             KeyringAuthFixed._force_delete_credential(USER_SERVICE_NAME, user_key)
+            KeyringAuthFixed._update_user_index(username, None)
 
             # Delete session
             KeyringAuthFixed.logout_user(username)
@@ -0,0 +1,140 @@
+"""
+"Remember Me" sessions.
+
+Remembering a user stores a random token in the keyring together with the
+device it was issued on and its expiry. A small local file (no secrets)
+names the remembered user and holds a SHA-256 verifier of the token, so
+start-up can tell from the file alone whether there is anything to check.
+Verification is then a single keyring read: the entry must exist, belong
+to this device, match the verifier and not have expired. Logging out or
+logging in without the box ticked forgets the session.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import secrets
+import time
+import uuid
+from typing import Optional
+
+import keyring
+
+from config.app_paths import AppPaths
+from diagnostics.tracing import span, traced
+from .keyring_auth import KeyringAuthFixed, SESSION_SERVICE_NAME
+
+log = logging.getLogger(__name__)
+
+REMEMBER_PREFIX = "remember"
+REMEMBER_FILE = "remember_me.json"
+REMEMBER_DAYS = float(os.getenv('SENTINEL_REMEMBER_DAYS', '30'))
+
+_device_id: Optional[str] = None
+
+
+def device_id() -> str:
+    """Stable identifier of this machine (hashed; nothing identifying is stored)"""
+    global _device_id
+    if _device_id is None:
+        machine = ""
+        for path in ("/etc/machine-id", "/var/lib/dbus/machine-id"):
+            try:
+                with open(path, "r") as f:
+                    machine = f.read().strip()
+                break
+            except OSError:
+                continue
+        raw = f"{platform.node()}|{platform.system()}|{machine or uuid.getnode()}"
+        _device_id = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return _device_id
+
+
+def _verifier(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class RememberMe:
+    @staticmethod
+    def _entry_key(username: str) -> str:
+        return f"{REMEMBER_PREFIX}_{username}"
+
+    @staticmethod
+    @traced("auth.remember", "auth")
+    def remember(username: str) -> None:
+        """Issue a device-bound remember-me session for an authenticated user"""
+        username = KeyringAuthFixed._clean_username(username)
+        # Only one user is remembered per device; revoke the previous one's keyring entry
+        RememberMe.forget()
+        token = secrets.token_urlsafe(32)
+        expires_at = time.time() + REMEMBER_DAYS * 86400
+        entry = {"token": token, "device": device_id(), "expires_at": expires_at}
+        with span("keyring.set_password", "keyring", entry="remember"):
+            keyring.set_password(SESSION_SERVICE_NAME, RememberMe._entry_key(username), json.dumps(entry))
+
+        path = AppPaths.data_path(REMEMBER_FILE)
+        with open(path + ".tmp", "w") as f:
+            json.dump({"username": username, "expires_at": expires_at, "device": entry["device"],
+                       "verifier": _verifier(token)}, f)
+        os.replace(path + ".tmp", path)
+
+    @staticmethod
+    def candidate() -> Optional[str]:
+        """Remembered username if the local record is present, unexpired and from this device.
+
+        Reads only the local file, never the keyring; call verify() before trusting it.
+        """
+        try:
+            with open(AppPaths.data_path(REMEMBER_FILE), "r") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if record.get("device") != device_id() or record.get("expires_at", 0) <= time.time():
+            return None
+        return record.get("username")
+
+    @staticmethod
+    @traced("auth.remember_verify", "auth")
+    def verify(username: str) -> bool:
+        """Check the remembered session against the keyring (one read); forgets it if invalid"""
+        try:
+            with open(AppPaths.data_path(REMEMBER_FILE), "r") as f:
+                record = json.load(f)
+            with span("keyring.get_password", "keyring", entry="remember"):
+                raw = keyring.get_password(SESSION_SERVICE_NAME, RememberMe._entry_key(username))
+            entry = json.loads(raw) if raw else None
+        except Exception as exc:
+            log.debug("Remember-me check failed: %s", exc)
+            return False
+
+        valid = (
+            entry is not None
+            and record.get("username") == username
+            and entry.get("device") == device_id() == record.get("device")
+            and _verifier(entry.get("token", "")) == record.get("verifier")
+            and entry.get("expires_at", 0) > time.time()
+        )
+        if not valid:
+            log.info("Remembered session for %s is no longer valid", username)
+            RememberMe.forget(username)
+        return valid
+
+    @staticmethod
+    def forget(username: Optional[str] = None) -> None:
+        """Drop the remembered session (of username, or whoever is remembered)"""
+        path = AppPaths.data_path(REMEMBER_FILE)
+        try:
+            with open(path, "r") as f:
+                remembered = json.load(f).get("username")
+        except (OSError, ValueError):
+            return
+        if username is not None and remembered != KeyringAuthFixed._clean_username(username):
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        if remembered:
+            KeyringAuthFixed._force_delete_credential(SESSION_SERVICE_NAME, RememberMe._entry_key(remembered))
@@ -0,0 +1,21 @@
+import os
+
+# Project root (the directory containing main.py), independent of the working directory
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class AppPaths:
+    # Per-user directory for local state (checkpoints, caches, logs, snapshots)
+    DATA_DIR = os.getenv('SENTINEL_DATA_DIR', os.path.join(os.path.expanduser('~'), '.sentinel_ai'))
+
+    @classmethod
+    def data_path(cls, *parts) -> str:
+        """Return a path inside DATA_DIR, creating its parent directory"""
+        path = os.path.join(cls.DATA_DIR, *parts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    @staticmethod
+    def project_path(*parts) -> str:
+        """Return a path relative to the project root"""
+        return os.path.join(PROJECT_ROOT, *parts)
@@ -1,8 +1,41 @@
 import os
+import json
+import logging
 from dotenv import load_dotenv
 
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
+# Optional wire compressors (zlib ships with Python)
+try:
+    import zstandard  # noqa: F401
+    ZSTD_AVAILABLE = True
+except Exception:
+    ZSTD_AVAILABLE = False
+try:
+    import snappy  # noqa: F401
+    SNAPPY_AVAILABLE = True
+except Exception:
+    SNAPPY_AVAILABLE = False
+
+# MongoClient options a tuning profile may set, with their expected types
+PROFILE_OPTIONS = {
+    'minPoolSize': int,
+    'maxPoolSize': int,
+    'maxIdleTimeMS': int,
+    'connectTimeoutMS': int,
+    'socketTimeoutMS': int,
+    'serverSelectionTimeoutMS': int,
+    'waitQueueTimeoutMS': int,
+    'retryWrites': bool,
+    'retryReads': bool,
+    'compressors': str,
+    'zlibCompressionLevel': int,
+    'w': (int, str),
+    'journal': bool,
+}
+
 class DatabaseConfig:
     # MongoDB Settings
     MONGODB_CONNECTION_STRING = os.getenv('MONGODB_CONNECTION_STRING', 'mongodb://localhost:27017/')
@@ -13,12 +46,122 @@ class DatabaseConfig:
     # Connection Pool Settings
     MONGODB_MAX_POOL_SIZE = int(os.getenv('MONGODB_MAX_POOL_SIZE', '10'))
     MONGODB_CONNECT_TIMEOUT = int(os.getenv('MONGODB_CONNECT_TIMEOUT', '10000'))
+
+    # Command/pool monitoring (see database/monitoring.py)
+    MONGODB_MONITORING = os.getenv('MONGODB_MONITORING', '1') == '1'
+    MONGODB_SLOW_MS = float(os.getenv('MONGODB_SLOW_MS', '500'))
+    # Metrics are written here on exit when set (*.json for JSON, else Prometheus text)
+    MONGODB_METRICS_PATH = os.getenv('MONGODB_METRICS_PATH', '')
+
+    # Keyring <-> MongoDB user sync (seconds between incremental runs, 0 disables)
+    USER_SYNC_INTERVAL = int(os.getenv('USER_SYNC_INTERVAL', '300'))
+    USER_SYNC_PAGE_SIZE = int(os.getenv('USER_SYNC_PAGE_SIZE', '200'))
+
+    # Login activity write-behind buffer (flush after N events or T seconds)
+    LOGIN_ACTIVITY_MAX_PENDING = int(os.getenv('LOGIN_ACTIVITY_MAX_PENDING', '50'))
+    LOGIN_ACTIVITY_FLUSH_INTERVAL = float(os.getenv('LOGIN_ACTIVITY_FLUSH_INTERVAL', '30'))
     
+    # Connection tuning profiles, picked per collection accessor (database/connection.py).
+    # MONGODB_PROFILE_OVERRIDES takes JSON, e.g. {"batch": {"maxPoolSize": 20}}
+    MONGODB_COMPRESSORS = os.getenv('MONGODB_COMPRESSORS', 'zstd,snappy,zlib')
+    DEFAULT_PROFILE = 'interactive'
+    TUNING_PROFILES = {
+        # UI-triggered reads/writes: keep a warm connection, fail fast
+        'interactive': {
+            'minPoolSize': 1,
+            'maxPoolSize': MONGODB_MAX_POOL_SIZE,
+            'maxIdleTimeMS': 300000,
+            'connectTimeoutMS': MONGODB_CONNECT_TIMEOUT,
+            'serverSelectionTimeoutMS': 5000,
+            'retryWrites': True,
+            'retryReads': True,
+            'compressors': MONGODB_COMPRESSORS,
+        },
+        # Bulk import/export and sync: wider pool, patient timeouts, no idle warm connections
+        'batch': {
+            'minPoolSize': 0,
+            'maxPoolSize': 20,
+            'maxIdleTimeMS': 60000,
+            'connectTimeoutMS': 20000,
+            'serverSelectionTimeoutMS': 30000,
+            'socketTimeoutMS': 120000,
+            'retryWrites': True,
+            'retryReads': True,
+            'compressors': MONGODB_COMPRESSORS,
+            'zlibCompressionLevel': 6,
+        },
+        # Best-effort background writes (token snapshots, login activity): small pool,
+        # quick give-up on bad networks and a relaxed write concern
+        'offline_tolerant': {
+            'minPoolSize': 0,
+            'maxPoolSize': 2,
+            'maxIdleTimeMS': 30000,
+            'connectTimeoutMS': 5000,
+            'serverSelectionTimeoutMS': 2000,
+            'socketTimeoutMS': 10000,
+            'retryWrites': True,
+            'compressors': MONGODB_COMPRESSORS,
+            'w': 1,
+            'journal': False,
+        },
+    }
+
     @classmethod
-    def get_connection_params(cls):
-        return {
-            'host': cls.MONGODB_CONNECTION_STRING,
-            'maxPoolSize': cls.MONGODB_MAX_POOL_SIZE,
-            'connectTimeoutMS': cls.MONGODB_CONNECT_TIMEOUT,
-            'serverSelectionTimeoutMS': 5000
-        }
\ No newline at end of file
+    def validate_profiles(cls):
+        """Apply MONGODB_PROFILE_OVERRIDES and check every profile; raises ValueError"""
+        overrides = os.getenv('MONGODB_PROFILE_OVERRIDES')
+        if overrides:
+            try:
+                overrides = json.loads(overrides)
+            except ValueError as e:
+                raise ValueError(f"MONGODB_PROFILE_OVERRIDES is not valid JSON: {e}")
+            for name, options in overrides.items():
+                cls.TUNING_PROFILES.setdefault(name, {}).update(options)
+
+        for name, options in cls.TUNING_PROFILES.items():
+            for key, value in options.items():
+                expected = PROFILE_OPTIONS.get(key)
+                if expected is None:
+                    raise ValueError(f"Tuning profile '{name}': unknown option '{key}'")
+                # bool is an int subclass; keep the two apart
+                if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+                    raise ValueError(f"Tuning profile '{name}': '{key}' has invalid value {value!r}")
+                if expected is int and value < 0:
+                    raise ValueError(f"Tuning profile '{name}': '{key}' must not be negative")
+            if options.get('minPoolSize', 0) > options.get('maxPoolSize', 100):
+                raise ValueError(f"Tuning profile '{name}': minPoolSize exceeds maxPoolSize")
+            if not -1 <= options.get('zlibCompressionLevel', -1) <= 9:
+                raise ValueError(f"Tuning profile '{name}': zlibCompressionLevel must be -1..9")
+            unknown = set(filter(None, options.get('compressors', '').split(','))) - {'zstd', 'snappy', 'zlib'}
+            if unknown:
+                raise ValueError(f"Tuning profile '{name}': unsupported compressors {sorted(unknown)}")
+            if isinstance(options.get('w'), str) and options['w'] != 'majority':
+                raise ValueError(f"Tuning profile '{name}': w must be an integer or 'majority'")
+
+    @staticmethod
+    def _available_compressors(compressors: str) -> str:
+        available = []
+        for name in filter(None, compressors.split(',')):
+            if (name == 'zstd' and not ZSTD_AVAILABLE) or (name == 'snappy' and not SNAPPY_AVAILABLE):
+                continue
+            available.append(name)
+        return ','.join(available)
+
+    @classmethod
+    def get_connection_params(cls, profile: str = None):
+        profile = profile or cls.DEFAULT_PROFILE
+        if profile not in cls.TUNING_PROFILES:
+            raise ValueError(f"Unknown MongoDB tuning profile: {profile}")
+        params = {'host': cls.MONGODB_CONNECTION_STRING}
+        params.update(cls.TUNING_PROFILES[profile])
+        if 'compressors' in params:
+            # Skip compressors whose Python package is missing rather than failing the handshake
+            compressors = cls._available_compressors(params['compressors'])
+            if compressors:
+                params['compressors'] = compressors
+            else:
+                del params['compressors']
+        return params
+
+
+DatabaseConfig.validate_profiles()
\ No newline at end of file
@@ -0,0 +1,153 @@
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+from config.app_paths import AppPaths
+
+
+class LoggingConfig:
+    # Root level and per-logger overrides, e.g. "services.meet_service=DEBUG,pymongo=WARNING"
+    LOG_LEVEL = os.getenv('SENTINEL_LOG_LEVEL', 'INFO').upper()
+    LOG_LEVELS = os.getenv('SENTINEL_LOG_LEVELS', 'pymongo=WARNING,urllib3=WARNING,googleapiclient=WARNING')
+    CONSOLE_LEVEL = os.getenv('SENTINEL_LOG_CONSOLE_LEVEL', 'WARNING').upper()
+
+    # Rotating file sink (empty SENTINEL_LOG_FILE disables it)
+    LOG_FILE = os.getenv('SENTINEL_LOG_FILE', os.path.join(AppPaths.DATA_DIR, 'logs', 'sentinel.log'))
+    LOG_FILE_MAX_BYTES = int(os.getenv('SENTINEL_LOG_FILE_MAX_BYTES', str(5 * 1024 * 1024)))
+    LOG_FILE_BACKUPS = int(os.getenv('SENTINEL_LOG_FILE_BACKUPS', '3'))
+
+    # At most RATE_LIMIT_BURST identical messages per logger per RATE_LIMIT_WINDOW seconds
+    RATE_LIMIT_WINDOW = float(os.getenv('SENTINEL_LOG_RATE_WINDOW', '10'))
+    RATE_LIMIT_BURST = int(os.getenv('SENTINEL_LOG_RATE_BURST', '5'))
+
+    FORMAT = '%(asctime)s %(levelname)-7s [%(threadName)s] %(name)s: %(message)s'
+
+    @classmethod
+    def module_levels(cls) -> Dict[str, int]:
+        levels = {}
+        for item in filter(None, (part.strip() for part in cls.LOG_LEVELS.split(','))):
+            name, _, level = item.partition('=')
+            level = logging.getLevelName(level.strip().upper())
+            if isinstance(level, int):
+                levels[name.strip()] = level
+        return levels
+
+
+class RateLimitFilter(logging.Filter):
+    """Drops repeats of the same message template beyond a burst per time window.
+
+    Keyed on the unformatted template, so the check costs a dict lookup and
+    never formats the message. The next record that gets through after a
+    suppression carries a `suppressed` count, appended by the formatter.
+    """
+
+    def __init__(self, window: float, burst: int):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._state: Dict[tuple, list] = {}  # key -> [window_start, count, suppressed]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.burst <= 0:
+            return True
+        key = (record.name, record.levelno, record.msg if isinstance(record.msg, str) else id(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            state = self._state.get(key)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                self._state[key] = [now, 1, 0]
+                if len(self._state) > 10000:
+                    self._state.clear()
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            state[1] += 1
+            if state[1] > self.burst:
+                state[2] += 1
+                return False
+            return True
+
+
+class _Formatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            text += f" [{suppressed} similar messages suppressed]"
+        return text
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records without formatting them on the calling thread.
+
+    The stock QueueHandler.prepare() formats the message (and traceback)
+    before enqueueing, which puts that cost on the GUI thread. The queue is
+    in-process, so the record can be handed to the listener as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging() -> None:
+    """Route all logging through a queue drained by a background listener thread.
+
+    Safe to call more than once; only the first call configures logging.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    formatter = _Formatter(LoggingConfig.FORMAT)
+    sinks = []
+
+    console = logging.StreamHandler(sys.stderr)
+    console.setLevel(LoggingConfig.CONSOLE_LEVEL)
+    console.setFormatter(formatter)
+    sinks.append(console)
+
+    if LoggingConfig.LOG_FILE:
+        try:
+            os.makedirs(os.path.dirname(LoggingConfig.LOG_FILE), exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(
+                LoggingConfig.LOG_FILE, maxBytes=LoggingConfig.LOG_FILE_MAX_BYTES,
+                backupCount=LoggingConfig.LOG_FILE_BACKUPS, encoding='utf-8', delay=True
+            )
+            file_handler.setFormatter(formatter)
+            sinks.append(file_handler)
+        except OSError as exc:
+            print(f"⚠️  Could not open log file {LoggingConfig.LOG_FILE}: {exc}")
+
+    queue_handler = _DeferredQueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(RateLimitFilter(LoggingConfig.RATE_LIMIT_WINDOW, LoggingConfig.RATE_LIMIT_BURST))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(LoggingConfig.LOG_LEVEL)
+    for name, level in LoggingConfig.module_levels().items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = logging.handlers.QueueListener(queue_handler.queue, *sinks, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Drain the queue and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,55 @@
+import threading
+from typing import Dict
+
+from pymongo import MongoClient
+from config.database_config import DatabaseConfig
+from database.monitoring import get_event_listeners
+
+# One MongoClient per tuning profile and process: pymongo clients are
+# thread-safe and own the connection pool, so creating one per call pays
+# DNS/TLS setup every time.
+_clients: Dict[str, MongoClient] = {}
+_lock = threading.Lock()
+
+
+def get_client(profile: str = None) -> MongoClient:
+    """Return the shared MongoClient for a tuning profile, creating it on first use"""
+    profile = profile or DatabaseConfig.DEFAULT_PROFILE
+    client = _clients.get(profile)
+    if client is None:
+        with _lock:
+            client = _clients.get(profile)
+            if client is None:
+                params = DatabaseConfig.get_connection_params(profile)
+                if DatabaseConfig.MONGODB_MONITORING:
+                    params['event_listeners'] = get_event_listeners(slow_ms=DatabaseConfig.MONGODB_SLOW_MS)
+                client = _clients[profile] = MongoClient(**params)
+    return client
+
+
+def get_database(profile: str = None):
+    return get_client(profile)[DatabaseConfig.MONGODB_DATABASE]
+
+
+def get_collection(name: str, profile: str = None):
+    return get_database(profile)[name]
+
+
+def users_collection(profile: str = 'interactive'):
+    return get_collection(DatabaseConfig.MONGODB_COLLECTION_USERS, profile)
+
+
+def tokens_collection(profile: str = 'offline_tolerant'):
+    # Token snapshots are best-effort: relaxed write concern, quick give-up offline
+    return get_collection(DatabaseConfig.MONGODB_COLLECTION_TOKENS, profile)
+
+
+def close_client() -> None:
+    """Close every shared client (safe to call more than once)"""
+    with _lock:
+        for client in _clients.values():
+            try:
+                client.close()
+            except Exception:
+                pass
+        _clients.clear()
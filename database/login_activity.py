@@ -0,0 +1,126 @@
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from pymongo import UpdateOne
+from config.database_config import DatabaseConfig
+from database.connection import users_collection
+
+log = logging.getLogger(__name__)
+
+
+class LoginActivityRecorder:
+    """Write-behind buffer for login activity on the users collection.
+
+    record_login() only touches an in-memory dict, so the login path never
+    waits on MongoDB. Pending events are coalesced per user and flushed as a
+    single bulk_write of $set last_login / $inc login_count updates when the
+    buffer reaches max_pending events, every flush_interval seconds, and on stop().
+    """
+
+    def __init__(self, max_pending: int = None, flush_interval: float = None):
+        self.max_pending = max_pending or DatabaseConfig.LOGIN_ACTIVITY_MAX_PENDING
+        self.flush_interval = flush_interval or DatabaseConfig.LOGIN_ACTIVITY_FLUSH_INTERVAL
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_events = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record_login(self, username: str, when: Optional[datetime] = None) -> None:
+        when = when or datetime.utcnow()
+        with self._lock:
+            entry = self._pending.setdefault(username, {"last_login": when, "count": 0})
+            entry["last_login"] = max(entry["last_login"], when)
+            entry["count"] += 1
+            self._pending_events += 1
+            full = self._pending_events >= self.max_pending
+        if full:
+            self._wake.set()
+
+    def _requeue(self, batch: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            for username, entry in batch.items():
+                current = self._pending.get(username)
+                if current:
+                    current["last_login"] = max(current["last_login"], entry["last_login"])
+                    current["count"] += entry["count"]
+                else:
+                    self._pending[username] = entry
+                self._pending_events += entry["count"]
+
+    def flush(self) -> int:
+        """Write all pending events in one bulk_write. Returns the number of users updated."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._pending_events = 0
+            if not batch:
+                return 0
+
+            ops = [
+                UpdateOne({"username": username},
+                          {"$set": {"last_login": entry["last_login"]},
+                           "$inc": {"login_count": entry["count"]}})
+                for username, entry in batch.items()
+            ]
+            try:
+                result = users_collection('offline_tolerant').bulk_write(ops, ordered=False)
+                log.debug("Flushed login activity for %d users (%d matched)", len(ops), result.matched_count)
+                return len(ops)
+            except Exception as exc:
+                # Keep the events for the next attempt rather than dropping them
+                log.warning("Login activity flush failed, will retry: %s", exc)
+                self._requeue(batch)
+                return 0
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="LoginActivityFlush", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the flush thread and write whatever is still buffered"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            self.flush()
+
+
+_recorder: Optional[LoginActivityRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_login_recorder() -> LoginActivityRecorder:
+    """Return the process-wide recorder, starting its flush thread on first use"""
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = LoginActivityRecorder()
+                _recorder.start()
+    return _recorder
+
+
+def stop_login_recorder() -> None:
+    """Flush and stop the process-wide recorder if it was started"""
+    global _recorder
+    with _recorder_lock:
+        recorder, _recorder = _recorder, None
+    if recorder is not None:
+        recorder.stop()
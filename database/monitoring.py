@@ -0,0 +1,257 @@
+"""
+MongoDB client instrumentation.
+
+pymongo event listeners that feed an in-process metrics registry:
+per-command latency histograms and failure counts, heartbeat round-trips,
+server/topology changes, connection setup times and pool checkout waits.
+Slow commands are logged. The registry can be queried with snapshot() or
+written to a JSON or Prometheus text file with dump().
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+from pymongo import monitoring
+
+from diagnostics import tracing
+from diagnostics.histogram import LatencyHistogram
+
+log = logging.getLogger(__name__)
+
+
+class MongoMetrics:
+    """Thread-safe registry of latency histograms and counters"""
+
+    def __init__(self, slow_ms: float = 500):
+        self.slow_ms = slow_ms
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._counters: Dict[Tuple[str, str], int] = {}
+
+    def observe(self, metric: str, label: str, ms: float) -> None:
+        with self._lock:
+            hist = self._histograms.get((metric, label))
+            if hist is None:
+                hist = self._histograms[(metric, label)] = LatencyHistogram()
+            hist.observe(ms)
+
+    def increment(self, counter: str, label: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[(counter, label)] = self._counters.get((counter, label), 0) + amount
+
+    def histogram(self, metric: str, label: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            hist = self._histograms.get((metric, label))
+            return hist.snapshot() if hist else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all metrics as plain dicts: {"histograms": {metric: {label: ...}}, "counters": ...}"""
+        with self._lock:
+            histograms: Dict[str, Dict[str, Any]] = {}
+            for (metric, label), hist in self._histograms.items():
+                histograms.setdefault(metric, {})[label] = hist.snapshot()
+            counters: Dict[str, Dict[str, int]] = {}
+            for (counter, label), value in self._counters.items():
+                counters.setdefault(counter, {})[label] = value
+        return {"histograms": histograms, "counters": counters}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def to_prometheus(self) -> str:
+        snap = self.snapshot()
+        lines: List[str] = []
+        for metric, labels in sorted(snap["histograms"].items()):
+            name = f"sentinel_mongo_{metric}_ms"
+            lines.append(f"# TYPE {name} histogram")
+            for label, hist in sorted(labels.items()):
+                cumulative = 0
+                for le, n in hist["buckets"].items():
+                    cumulative += n
+                    lines.append(f'{name}_bucket{{name="{label}",le="{le}"}} {cumulative}')
+                lines.append(f'{name}_sum{{name="{label}"}} {hist["sum_ms"]}')
+                lines.append(f'{name}_count{{name="{label}"}} {hist["count"]}')
+        for counter, labels in sorted(snap["counters"].items()):
+            name = f"sentinel_mongo_{counter}_total"
+            lines.append(f"# TYPE {name} counter")
+            for label, value in sorted(labels.items()):
+                lines.append(f'{name}{{name="{label}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str) -> None:
+        """Write metrics to path: JSON for *.json, Prometheus text format otherwise"""
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        if path.endswith(".json"):
+            content = json.dumps(self.snapshot(), indent=2)
+        else:
+            content = self.to_prometheus()
+        with open(path + ".tmp", "w") as f:
+            f.write(content)
+        os.replace(path + ".tmp", path)
+
+
+_metrics = MongoMetrics()
+
+
+def get_metrics() -> MongoMetrics:
+    return _metrics
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """Per-command latency, failures and slow-operation log"""
+
+    def __init__(self, metrics: MongoMetrics):
+        self.metrics = metrics
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        ms = event.duration_micros / 1000.0
+        self.metrics.observe("command_duration", event.command_name, ms)
+        # Command events are published on the thread that ran the operation
+        tracing.record_complete(f"mongo.{event.command_name}", ms / 1000.0, "mongo")
+        if ms >= self.metrics.slow_ms:
+            log.warning("Slow MongoDB command %s on %s: %.1f ms (request_id=%s)",
+                        event.command_name, event.connection_id, ms, event.request_id)
+
+    def failed(self, event):
+        ms = event.duration_micros / 1000.0
+        self.metrics.observe("command_duration", event.command_name, ms)
+        tracing.record_complete(f"mongo.{event.command_name}", ms / 1000.0, "mongo", failed=True)
+        self.metrics.increment("command_failures", event.command_name)
+        log.warning("MongoDB command %s failed after %.1f ms: %s",
+                    event.command_name, ms, event.failure.get("errmsg", event.failure))
+
+
+class ServerMetricsListener(monitoring.ServerListener):
+    """Server discovery: time from opening a server to it becoming selectable"""
+
+    def __init__(self, metrics: MongoMetrics):
+        self.metrics = metrics
+        self._opened: Dict[Any, float] = {}
+        self._lock = threading.Lock()
+
+    def opened(self, event):
+        with self._lock:
+            self._opened[event.server_address] = time.perf_counter()
+        self.metrics.increment("server_opened", str(event.server_address))
+
+    def description_changed(self, event):
+        new_type = event.new_description.server_type_name
+        self.metrics.increment("server_description_changes", new_type)
+        if event.new_description.is_server_type_known:
+            with self._lock:
+                started = self._opened.pop(event.server_address, None)
+            if started is not None:
+                self.metrics.observe("server_discovery", str(event.server_address),
+                                     (time.perf_counter() - started) * 1000)
+        elif event.previous_description.is_server_type_known:
+            log.warning("MongoDB server %s became %s", event.server_address, new_type)
+
+    def closed(self, event):
+        with self._lock:
+            self._opened.pop(event.server_address, None)
+        self.metrics.increment("server_closed", str(event.server_address))
+
+
+class HeartbeatMetricsListener(monitoring.ServerHeartbeatListener):
+    """Heartbeat round-trips approximate network latency to each server"""
+
+    def __init__(self, metrics: MongoMetrics):
+        self.metrics = metrics
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self.metrics.observe("heartbeat", str(event.connection_id), event.duration * 1000)
+
+    def failed(self, event):
+        self.metrics.observe("heartbeat", str(event.connection_id), event.duration * 1000)
+        self.metrics.increment("heartbeat_failures", str(event.connection_id))
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Pool checkout waits and connection establishment (DNS/TCP/TLS/handshake) times"""
+
+    def __init__(self, metrics: MongoMetrics):
+        self.metrics = metrics
+        self._checkout_started = threading.local()
+        self._created: Dict[Tuple[Any, int], float] = {}
+        self._lock = threading.Lock()
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self.metrics.increment("pool_cleared", str(event.address))
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        with self._lock:
+            self._created[(event.address, event.connection_id)] = time.perf_counter()
+        self.metrics.increment("connections_created", str(event.address))
+
+    def connection_ready(self, event):
+        with self._lock:
+            started = self._created.pop((event.address, event.connection_id), None)
+        if started is not None:
+            self.metrics.observe("connection_setup", str(event.address), (time.perf_counter() - started) * 1000)
+
+    def connection_closed(self, event):
+        with self._lock:
+            self._created.pop((event.address, event.connection_id), None)
+        self.metrics.increment("connections_closed", str(event.reason))
+
+    def connection_check_out_started(self, event):
+        # Checkout events for one operation are delivered on the requesting thread
+        self._checkout_started.value = time.perf_counter()
+
+    def connection_check_out_failed(self, event):
+        self._record_wait(event)
+        self.metrics.increment("checkout_failures", str(event.reason))
+
+    def connection_checked_out(self, event):
+        self._record_wait(event)
+
+    def connection_checked_in(self, event):
+        pass
+
+    def _record_wait(self, event):
+        started = getattr(self._checkout_started, "value", None)
+        if started is not None:
+            self._checkout_started.value = None
+            self.metrics.observe("pool_checkout_wait", str(event.address), (time.perf_counter() - started) * 1000)
+
+
+_listeners: Optional[List[Any]] = None
+_listeners_lock = threading.Lock()
+
+
+def get_event_listeners(slow_ms: float = None) -> List[Any]:
+    """Return the shared listener set, so every client reports into one registry"""
+    global _listeners
+    with _listeners_lock:
+        if slow_ms is not None:
+            _metrics.slow_ms = slow_ms
+        if _listeners is None:
+            _listeners = [
+                CommandMetricsListener(_metrics),
+                ServerMetricsListener(_metrics),
+                HeartbeatMetricsListener(_metrics),
+                PoolMetricsListener(_metrics),
+            ]
+        return _listeners
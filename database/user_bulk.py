@@ -0,0 +1,304 @@
+"""
+Bulk user import/export.
+
+Streams users from CSV or JSONL, hashes passwords across a process pool and
+writes them to the local keyring store and to MongoDB in batches. Progress is
+checkpointed after every batch so an interrupted import can be resumed.
+
+The checkpoint also lists rows that reached the keyring but not MongoDB. A
+resumed import retries those against MongoDB (from the local record)
+instead of reporting them as existing users.
+
+Usage:
+    python -m database.user_bulk import users.csv [--batch-size 200] [--workers 4] [--resume]
+    python -m database.user_bulk export users.jsonl
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+import bcrypt
+from bson import ObjectId
+
+from auth.keyring_auth import KeyringAuthFixed
+from database.user_service import UserService
+
+log = logging.getLogger(__name__)
+
+REQUIRED_FIELDS = ("username", "fullname", "phone", "email", "password")
+DEFAULT_BATCH_SIZE = 200
+
+
+def _hash_password(password: str) -> Tuple[str, bytes]:
+    """Compute the keyring and MongoDB password hashes (runs in a worker process)"""
+    return KeyringAuthFixed._hash_password(password), bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+
+
+def _iter_rows(path: str, fmt: str) -> Iterator[Dict[str, Any]]:
+    """Yield input rows one at a time without loading the whole file"""
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            for row in csv.DictReader(f):
+                yield row
+        else:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as exc:
+                    yield {"_error": f"Invalid JSON on line {line_no}: {exc}"}
+
+
+def _batches(iterable, size: int) -> Iterator[List]:
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _validate_row(row: Dict[str, Any]) -> Optional[str]:
+    """Return an error message for an invalid row, None if it can be imported"""
+    if "_error" in row:
+        return row["_error"]
+    values = {field: str(row.get(field) or "").strip() for field in REQUIRED_FIELDS}
+    if not all(values.values()):
+        return "All fields are required"
+    if not KeyringAuthFixed._validate_email(values["email"]):
+        return "Invalid email format"
+    if not KeyringAuthFixed._validate_password(values["password"]):
+        return "Password must be at least 6 characters"
+    return None
+
+
+class _Checkpoint:
+    """Tracks how many input rows have been fully processed.
+
+    local_only maps row numbers (as strings, for JSON) to usernames written to
+    the keyring whose MongoDB insert has not succeeded yet.
+    """
+
+    def __init__(self, path: str, source: str):
+        self.path = path
+        self.source = os.path.abspath(source)
+        self.rows_done = 0
+        self.imported = 0
+        self.failed = 0
+        self.local_only: Dict[str, str] = {}
+
+    def load(self) -> None:
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("source") != self.source:
+            log.warning("Checkpoint %s belongs to %s, ignoring", self.path, data.get("source"))
+            return
+        self.rows_done = data.get("rows_done", 0)
+        self.imported = data.get("imported", 0)
+        self.failed = data.get("failed", 0)
+        self.local_only = data.get("local_only", {})
+
+    def save(self) -> None:
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "source": self.source,
+                "rows_done": self.rows_done,
+                "imported": self.imported,
+                "failed": self.failed,
+                "local_only": self.local_only,
+                "updated_at": datetime.utcnow().isoformat()
+            }, f)
+        os.replace(tmp_path, self.path)
+
+
+def _doc_from_local(username: str) -> Optional[Dict[str, Any]]:
+    """MongoDB document for a user already written to the keyring, with the same password hash"""
+    local = KeyringAuthFixed.get_user(username)
+    if not local or not local.get("password_bcrypt"):
+        return None
+    return UserService.build_user_doc(username, local.get("fullname", ""), local.get("phone", ""),
+                                      local.get("email", ""), local["password_bcrypt"].encode('utf-8'))
+
+
+def _saved(ok: bool, message: str) -> bool:
+    # A retried row may have reached MongoDB before the previous run stopped
+    return ok or message == "Username already exists in database"
+
+
+def _retry_local_only(checkpoint: "_Checkpoint", user_service: UserService, batch_size: int) -> None:
+    """Retry MongoDB inserts of rows from completed batches that were only written to the keyring"""
+    retry = [(row, name) for row, name in checkpoint.local_only.items() if int(row) <= checkpoint.rows_done]
+    for batch in _batches(retry, batch_size):
+        docs, rows = [], []
+        for row, username in batch:
+            doc = _doc_from_local(username)
+            if doc is None:
+                checkpoint.local_only.pop(row)
+                continue
+            docs.append(doc)
+            rows.append(row)
+        for row, (ok, message) in zip(rows, user_service.save_users(docs)):
+            if _saved(ok, message):
+                del checkpoint.local_only[row]
+                # Reported as failed by the run that wrote it locally
+                checkpoint.imported += 1
+                checkpoint.failed -= 1
+        checkpoint.save()
+    if retry:
+        log.info("Retried %d rows missing from MongoDB; %d still missing", len(retry), len(checkpoint.local_only))
+
+
+def import_users(path: str, fmt: Optional[str] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                 workers: Optional[int] = None, resume: bool = False,
+                 checkpoint_path: Optional[str] = None, errors_path: Optional[str] = None) -> Dict[str, int]:
+    """Import users from a CSV/JSONL file. Returns counts of imported and failed rows."""
+    fmt = fmt or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    checkpoint = _Checkpoint(checkpoint_path or f"{path}.checkpoint.json", path)
+    if resume:
+        checkpoint.load()
+        log.info("Resuming import of %s after row %d", path, checkpoint.rows_done)
+
+    workers = workers or os.cpu_count() or 1
+    user_service = UserService()
+    if resume:
+        _retry_local_only(checkpoint, user_service, batch_size)
+    rows = islice(enumerate(_iter_rows(path, fmt), start=1), checkpoint.rows_done, None)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool, \
+            open(errors_path or f"{path}.errors.jsonl", "a" if resume else "w", encoding="utf-8") as errors:
+
+        def report(row_no: int, username: str, message: str) -> None:
+            errors.write(json.dumps({"row": row_no, "username": username, "error": message}) + "\n")
+            checkpoint.failed += 1
+
+        for batch in _batches(rows, batch_size):
+            valid = []  # (row number, row)
+            seen = set()
+            for row_no, row in batch:
+                error = _validate_row(row)
+                username = KeyringAuthFixed._clean_username(str(row.get("username") or ""))
+                if not error and username in seen:
+                    error = "Duplicate username in batch"
+                if error:
+                    report(row_no, username, error)
+                    continue
+                seen.add(username)
+                valid.append((row_no, row))
+
+            hashes = pool.map(_hash_password, [str(row["password"]).strip() for _, row in valid],
+                              chunksize=max(1, len(valid) // (4 * workers)))
+
+            # Local credential store first, mirroring SignupPage
+            docs, doc_rows = [], []
+            retried = set()  # rows that may already be in MongoDB from the interrupted run
+            for (row_no, row), (password_hash, bcrypt_hash) in zip(valid, hashes):
+                username = KeyringAuthFixed._clean_username(str(row["username"]))
+                fields = [str(row[field]).strip() for field in ("fullname", "phone", "email")]
+                try:
+                    if KeyringAuthFixed.get_user(username):
+                        # Written locally by an interrupted run of this import: only MongoDB is left
+                        doc = _doc_from_local(username) if str(row_no) in checkpoint.local_only else None
+                        if doc is None:
+                            report(row_no, username, "Username already exists")
+                            continue
+                        retried.add(row_no)
+                    else:
+                        KeyringAuthFixed.store_user_record(
+                            KeyringAuthFixed.build_user_record(username, *fields, password_hash,
+                                                               password_bcrypt=bcrypt_hash.decode('utf-8'))
+                        )
+                        doc = UserService.build_user_doc(username, *fields, bcrypt_hash)
+                except Exception as exc:
+                    report(row_no, username, f"Registration failed: {exc}")
+                    continue
+                checkpoint.local_only[str(row_no)] = username
+                docs.append(doc)
+                doc_rows.append(row_no)
+            # Record the keyring writes before MongoDB, so a crash in between can be resumed
+            checkpoint.save()
+
+            for row_no, doc, (ok, message) in zip(doc_rows, docs, user_service.save_users(docs)):
+                if ok or (row_no in retried and _saved(ok, message)):
+                    del checkpoint.local_only[str(row_no)]
+                    checkpoint.imported += 1
+                else:
+                    # Stays in local_only and is retried by --resume
+                    report(row_no, doc["username"], f"Account created locally but database save failed: {message}")
+
+            errors.flush()
+            checkpoint.rows_done = batch[-1][0]
+            checkpoint.save()
+            log.info("Processed %d rows (%d imported, %d failed)",
+                     checkpoint.rows_done, checkpoint.imported, checkpoint.failed)
+
+    return {"rows": checkpoint.rows_done, "imported": checkpoint.imported, "failed": checkpoint.failed}
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='replace')
+    raise TypeError(f"Unserializable value: {type(value).__name__}")
+
+
+def export_users(path: str, batch_size: int = 500) -> int:
+    """Export users to JSONL by cursor. Password hashes are never exported."""
+    count = 0
+    with open(path, "w", encoding="utf-8") as out:
+        for doc in UserService().iter_users(batch_size=batch_size):
+            out.write(json.dumps(doc, default=_json_default) + "\n")
+            count += 1
+    return count
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sentinel AI bulk user import/export")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_import = sub.add_parser("import", help="Import users from CSV or JSONL")
+    p_import.add_argument("path")
+    p_import.add_argument("--format", choices=("csv", "jsonl"))
+    p_import.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    p_import.add_argument("--workers", type=int, default=None, help="Hashing processes (default: CPU count)")
+    p_import.add_argument("--resume", action="store_true", help="Continue from the last checkpoint")
+    p_import.add_argument("--checkpoint", help="Checkpoint file (default: <path>.checkpoint.json)")
+    p_import.add_argument("--errors", help="Per-row error report (default: <path>.errors.jsonl)")
+
+    p_export = sub.add_parser("export", help="Export users to JSONL")
+    p_export.add_argument("path")
+    p_export.add_argument("--batch-size", type=int, default=500)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.command == "import":
+        summary = import_users(args.path, fmt=args.format, batch_size=args.batch_size, workers=args.workers,
+                               resume=args.resume, checkpoint_path=args.checkpoint, errors_path=args.errors)
+        print(f"[SUCCESS] Imported {summary['imported']} users, {summary['failed']} failed "
+              f"({summary['rows']} rows processed)")
+        return 0 if summary["failed"] == 0 else 1
+
+    count = export_users(args.path, batch_size=args.batch_size)
+    print(f"[SUCCESS] Exported {count} users to {args.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,45 +1,105 @@
-from pymongo import MongoClient
+from pymongo.errors import BulkWriteError
 from datetime import datetime
+from typing import Dict, Any, Iterator, List, Tuple
 import bcrypt
 from config.database_config import DatabaseConfig
+from database.connection import users_collection
+from diagnostics.tracing import span, traced
 
 class UserService:
     def __init__(self):
         self.config = DatabaseConfig()
-    
-    def save_user(self, username, fullname, phone, email, password):
-        client = None
+
+    @staticmethod
+    def build_user_doc(username, fullname, phone, email, hashed_password) -> Dict[str, Any]:
+        """Build a users document from an already bcrypt-hashed password"""
+        now = datetime.utcnow()
+        return {
+            'username': username,
+            'fullname': fullname,
+            'phone': phone,
+            'email': email,
+            'password': hashed_password,
+            'created_at': now,
+            'updated_at': now,
+            'is_active': True,
+            'last_login': None
+        }
+
+    @traced("UserService.save_user", "mongo")
+    def save_user(self, username, fullname, phone, email, password, hashed_password=None):
         try:
-            connection_params = self.config.get_connection_params()
-            client = MongoClient(**connection_params)
-            
-            db = client[self.config.MONGODB_DATABASE]
-            users_collection = db[self.config.MONGODB_COLLECTION_USERS]
-            
+            collection = users_collection()
+
             # Check if user already exists
-            if users_collection.find_one({"username": username}):
+            if collection.find_one({"username": username}):
                 return False, "Username already exists in database"
-            
-            # Hash password
-            hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-            
-            user_doc = {
-                'username': username,
-                'fullname': fullname,
-                'phone': phone,
-                'email': email,
-                'password': hashed_password,
-                'created_at': datetime.utcnow(),
-                'is_active': True,
-                'last_login': None
-            }
-            
-            result = users_collection.insert_one(user_doc)
-            
+
+            # Hash password (callers that already hashed it pass hashed_password)
+            if hashed_password is None:
+                with span("bcrypt.hashpw", "auth"):
+                    hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+
+            user_doc = self.build_user_doc(username, fullname, phone, email, hashed_password)
+
+            result = collection.insert_one(user_doc)
+
             return True, f"User saved successfully with ID: {result.inserted_id}"
-            
+
         except Exception as e:
             return False, f"Database error: {str(e)}"
+
+    def save_users(self, user_docs: List[Dict[str, Any]]) -> List[Tuple[bool, str]]:
+        """Insert a batch of user documents with one insert_many call.
+
+        Returns one (success, message) pair per input document, in order.
+        Usernames that already exist are reported without aborting the batch.
+        """
+        results: List[Tuple[bool, str]] = [(True, "")] * len(user_docs)
+        if not user_docs:
+            return results
+        try:
+            collection = users_collection('batch')
+
+            # One round trip to find duplicates instead of a find_one per row
+            usernames = [doc['username'] for doc in user_docs]
+            existing = {
+                doc['username'] for doc in
+                collection.find({"username": {"$in": usernames}}, {"username": 1, "_id": 0})
+            }
+
+            pending = []  # (input index, doc)
+            for i, doc in enumerate(user_docs):
+                if doc['username'] in existing:
+                    results[i] = (False, "Username already exists in database")
+                else:
+                    pending.append((i, doc))
+            if not pending:
+                return results
+
+            try:
+                result = collection.insert_many([doc for _, doc in pending], ordered=False)
+                for (i, _), inserted_id in zip(pending, result.inserted_ids):
+                    results[i] = (True, f"User saved successfully with ID: {inserted_id}")
+            except BulkWriteError as bwe:
+                failed = {err['index']: err.get('errmsg', 'write error') for err in bwe.details.get('writeErrors', [])}
+                for pos, (i, doc) in enumerate(pending):
+                    if pos in failed:
+                        results[i] = (False, f"Database error: {failed[pos]}")
+                    else:
+                        results[i] = (True, f"User saved successfully with ID: {doc.get('_id')}")
+            return results
+
+        except Exception as e:
+            return [(False, f"Database error: {str(e)}") if ok else (ok, msg) for ok, msg in results]
+
+    def iter_users(self, batch_size: int = 500, include_password: bool = False) -> Iterator[Dict[str, Any]]:
+        """Stream user documents through a server-side cursor"""
+        collection = users_collection('batch')
+        projection = None if include_password else {'password': 0}
+        cursor = collection.find({}, projection, batch_size=batch_size).sort('_id', 1)
+        try:
+            for doc in cursor:
+                yield doc
         finally:
-            if client:
-                client.close()
\ No newline at end of file
+            cursor.close()
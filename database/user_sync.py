@@ -0,0 +1,323 @@
+"""
+Incremental sync between the local keyring user store and the MongoDB users collection.
+
+Each side keeps an updated_at timestamp per user. The engine remembers a
+watermark per side and only exchanges records changed since the last run.
+Conflicts are resolved by the newest updated_at; on a tie MongoDB wins.
+
+Watermarks are client clocks, so a write stamped earlier than an already
+processed one can be missed by incremental runs; full_resync() covers that.
+
+Users created before updated_at existed have none in MongoDB and would
+never match an incremental query. The first run on a client is therefore
+a full pass over MongoDB, which also backfills updated_at (from
+created_at) on such documents.
+
+Usage:
+    python -m database.user_sync [--full] [--page-size 200]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterator, List, Optional
+
+from pymongo import UpdateOne
+
+from auth.keyring_auth import KeyringAuthFixed
+from config.app_paths import AppPaths
+from config.database_config import DatabaseConfig
+from database.connection import users_collection
+
+log = logging.getLogger(__name__)
+
+SYNC_STATE_FILE = os.path.join("sync", "user_sync_state.json")
+SYNCED_FIELDS = ("fullname", "phone", "email")
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _dt_to_ms(value: Optional[datetime]) -> int:
+    # MongoDB stores datetimes with millisecond precision, so compare in ms
+    if not value:
+        return 0
+    delta = value.replace(tzinfo=None) - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000 + delta.microseconds // 1000
+
+
+def _ms_to_dt(ms: int) -> datetime:
+    return _EPOCH + timedelta(milliseconds=ms)
+
+
+def _local_ms(user_data: Dict[str, Any]) -> int:
+    return int(float(user_data.get("updated_at") or 0) * 1000)
+
+
+def _remote_bcrypt(doc: Dict[str, Any]) -> Optional[str]:
+    password = doc.get("password")
+    if isinstance(password, bytes):
+        return password.decode('utf-8')
+    return password
+
+
+class UserSyncEngine:
+    """Two-way, watermark-based sync of user records"""
+
+    def __init__(self, page_size: int = None, state_path: str = None):
+        self.page_size = page_size or DatabaseConfig.USER_SYNC_PAGE_SIZE
+        self._state_path = state_path or AppPaths.data_path(SYNC_STATE_FILE)
+        self._run_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ----- state -----
+
+    def _load_state(self) -> Dict[str, int]:
+        try:
+            with open(self._state_path, "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        return {"local_watermark": state.get("local_watermark", 0),
+                "remote_watermark": state.get("remote_watermark", 0),
+                "initial_pass_done": state.get("initial_pass_done", False)}
+
+    def _save_state(self, state: Dict[str, int]) -> None:
+        tmp_path = self._state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self._state_path)
+
+    # ----- record comparison / conversion -----
+
+    @staticmethod
+    def _same(local: Dict[str, Any], remote: Dict[str, Any]) -> bool:
+        if any((local.get(field) or "") != (remote.get(field) or "") for field in SYNCED_FIELDS):
+            return False
+        return local.get("password_bcrypt") == _remote_bcrypt(remote)
+
+    @staticmethod
+    def _resolve(local: Optional[Dict[str, Any]], remote: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Return 'pull', 'push' or None (already in sync)"""
+        if local is None:
+            return "pull"
+        if remote is None:
+            return "push"
+        if UserSyncEngine._same(local, remote):
+            return None
+        # Newest wins; ties go to MongoDB so every client picks the same side
+        return "push" if _local_ms(local) > _dt_to_ms(remote.get("updated_at")) else "pull"
+
+    @staticmethod
+    def _pull(local: Optional[Dict[str, Any]], remote: Dict[str, Any]) -> None:
+        remote_bcrypt = _remote_bcrypt(remote)
+        user_data = KeyringAuthFixed.build_user_record(
+            remote["username"], *(remote.get(field) or "" for field in SYNCED_FIELDS),
+            password_hash=None, password_bcrypt=remote_bcrypt
+        )
+        if local:
+            user_data["created_at"] = local.get("created_at", user_data["created_at"])
+            # The legacy hash is only valid while the password is unchanged
+            if local.get("password_hash") and local.get("password_bcrypt") == remote_bcrypt:
+                user_data["password_hash"] = local["password_hash"]
+        elif remote.get("created_at"):
+            user_data["created_at"] = _dt_to_ms(remote["created_at"]) // 1000
+        # Keep the remote timestamp so the record is not seen as a new local change
+        user_data["updated_at"] = _dt_to_ms(remote.get("updated_at")) / 1000
+        KeyringAuthFixed.store_user_record(user_data)
+
+    @staticmethod
+    def _push_op(local: Dict[str, Any], remote: Optional[Dict[str, Any]]) -> Optional[UpdateOne]:
+        update = {field: local.get(field) for field in SYNCED_FIELDS}
+        update["updated_at"] = _ms_to_dt(_local_ms(local))
+        if local.get("password_bcrypt"):
+            update["password"] = local["password_bcrypt"].encode('utf-8')
+        elif remote is None:
+            log.warning("User %s has no portable password hash yet; not creating it in MongoDB", local["username"])
+            return None
+        return UpdateOne(
+            {"username": local["username"]},
+            {"$set": update,
+             "$setOnInsert": {"created_at": datetime.utcfromtimestamp(local.get("created_at") or 0),
+                              "is_active": True, "last_login": None}},
+            upsert=True
+        )
+
+    @staticmethod
+    def _backfill_op(remote: Dict[str, Any]) -> UpdateOne:
+        """Give a legacy document an updated_at, so incremental queries can see its later changes.
+
+        created_at rather than now, so the backfill does not win conflicts against local edits.
+        """
+        created_at = remote.get("created_at")
+        remote["updated_at"] = created_at if isinstance(created_at, datetime) else _EPOCH
+        return UpdateOne({"_id": remote["_id"], "updated_at": {"$exists": False}},
+                         {"$set": {"updated_at": remote["updated_at"]}})
+
+    # ----- paging -----
+
+    def _iter_remote_pages(self, since_ms: Optional[int]) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of remote users, keyset-paginated on (updated_at, _id) or _id"""
+        col = users_collection('batch')
+        if since_ms is None:
+            sort, last = [("_id", 1)], None
+            while True:
+                query = {"_id": {"$gt": last}} if last is not None else {}
+                page = list(col.find(query).sort(sort).limit(self.page_size))
+                if not page:
+                    return
+                yield page
+                last = page[-1]["_id"]
+        else:
+            sort = [("updated_at", 1), ("_id", 1)]
+            last_ts, last_id = _ms_to_dt(since_ms), None
+            while True:
+                if last_id is None:
+                    query = {"updated_at": {"$gt": last_ts}}
+                else:
+                    query = {"$or": [{"updated_at": {"$gt": last_ts}},
+                                     {"updated_at": last_ts, "_id": {"$gt": last_id}}]}
+                page = list(col.find(query).sort(sort).limit(self.page_size))
+                if not page:
+                    return
+                yield page
+                last_ts, last_id = page[-1]["updated_at"], page[-1]["_id"]
+
+    def _iter_local_pages(self, since_ms: Optional[int]) -> Iterator[List[str]]:
+        entries = sorted(KeyringAuthFixed.list_users().items(), key=lambda item: item[1])
+        usernames = [name for name, ts in entries if since_ms is None or int(ts * 1000) > since_ms]
+        for i in range(0, len(usernames), self.page_size):
+            yield usernames[i:i + self.page_size]
+
+    # ----- sync passes -----
+
+    def _sync(self, full: bool) -> Dict[str, int]:
+        with self._run_lock:
+            stats = {"pulled": 0, "pushed": 0, "unchanged": 0, "skipped": 0, "backfilled": 0}
+            state = self._load_state()
+            col = users_collection('batch')
+
+            # Pull remote changes into the keyring; the first run reads everything
+            remote_full = full or not state["initial_pass_done"]
+            for page in self._iter_remote_pages(None if remote_full else state["remote_watermark"]):
+                ops, backfills = [], []
+                for remote in page:
+                    if remote.get("updated_at") is None:
+                        backfills.append(self._backfill_op(remote))
+                    if KeyringAuthFixed._clean_username(remote["username"]) != remote["username"]:
+                        # Legacy document saved under a non-normalized username
+                        stats["skipped"] += 1
+                        continue
+                    local = KeyringAuthFixed.get_user(remote["username"])
+                    action = self._resolve(local, remote)
+                    if action == "pull":
+                        self._pull(local, remote)
+                        stats["pulled"] += 1
+                    elif action == "push":
+                        op = self._push_op(local, remote)
+                        if op:
+                            ops.append(op)
+                    else:
+                        stats["unchanged"] += 1
+                if ops or backfills:
+                    col.bulk_write(ops + backfills, ordered=False)
+                    stats["pushed"] += len(ops)
+                    stats["backfilled"] += len(backfills)
+                state["remote_watermark"] = max(state["remote_watermark"],
+                                                max(_dt_to_ms(doc.get("updated_at")) for doc in page))
+                self._save_state(state)
+            if not state["initial_pass_done"]:
+                state["initial_pass_done"] = True
+                self._save_state(state)
+
+            # Push local changes to MongoDB
+            for usernames in self._iter_local_pages(None if full else state["local_watermark"]):
+                remotes = {doc["username"]: doc for doc in col.find({"username": {"$in": usernames}})}
+                ops = []
+                page_max = state["local_watermark"]
+                for username in usernames:
+                    local = KeyringAuthFixed.get_user(username)
+                    if local is None:
+                        stats["skipped"] += 1
+                        continue
+                    page_max = max(page_max, _local_ms(local))
+                    remote = remotes.get(username)
+                    action = self._resolve(local, remote)
+                    if action == "push":
+                        op = self._push_op(local, remote)
+                        if op:
+                            ops.append(op)
+                        else:
+                            stats["skipped"] += 1
+                    elif action == "pull":
+                        self._pull(local, remote)
+                        stats["pulled"] += 1
+                    else:
+                        stats["unchanged"] += 1
+                if ops:
+                    col.bulk_write(ops, ordered=False)
+                    stats["pushed"] += len(ops)
+                state["local_watermark"] = page_max
+                self._save_state(state)
+
+            log.info("User sync (%s): %s", "full" if full else "incremental", stats)
+            return stats
+
+    def run_once(self) -> Dict[str, int]:
+        """Exchange records changed since the last run"""
+        return self._sync(full=False)
+
+    def full_resync(self) -> Dict[str, int]:
+        """Compare every record on both sides, streaming them in pages"""
+        return self._sync(full=True)
+
+    # ----- background -----
+
+    def start(self, interval: int = None, delay: float = None) -> None:
+        """Run incremental syncs every `interval` seconds on a daemon thread.
+
+        The first run is after `delay` seconds (default: shortly after start-up).
+        """
+        interval = DatabaseConfig.USER_SYNC_INTERVAL if interval is None else interval
+        if interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        delay = min(interval, 10) if delay is None else delay
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, args=(interval, delay), name="UserSync", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self, interval: int, delay: float) -> None:
+        while not self._stop.wait(delay):
+            try:
+                self.run_once()
+            except Exception as exc:
+                log.warning("User sync failed: %s", exc)
+            delay = interval
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sync local users with MongoDB")
+    parser.add_argument("--full", action="store_true", help="Compare every record instead of changes only")
+    parser.add_argument("--page-size", type=int, default=None)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    engine = UserSyncEngine(page_size=args.page_size)
+    stats = engine.full_resync() if args.full else engine.run_once()
+    print(f"[SUCCESS] Pulled {stats['pulled']}, pushed {stats['pushed']}, "
+          f"unchanged {stats['unchanged']}, skipped {stats['skipped']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
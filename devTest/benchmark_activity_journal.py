@@ -0,0 +1,64 @@
+import sys
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.activity_journal import ActivityJournal
+
+# Append throughput, reopen time and newest-first page reads on a journal
+# with EVENTS entries (what the Recent Activity feed does while scrolling).
+
+EVENTS = 1_000_000
+PAGE = 128
+SERVICES = ["Zoom", "Gmail", "GMeet", "Spotify", "YouTube", "Discord"]
+
+
+def benchmark_activity_journal():
+    directory = tempfile.mkdtemp(prefix="activity-bench-")
+    try:
+        journal = ActivityJournal(directory, retention_days=0)
+        started = time.perf_counter()
+        for i in range(EVENTS):
+            journal.append("connect", SERVICES[i % len(SERVICES)], f"Connected #{i}", "bench")
+            if i % 10_000 == 9_999:
+                journal.flush()
+        journal.flush()
+        elapsed = time.perf_counter() - started
+        print(f"Append + batched fsync: {EVENTS / elapsed:,.0f} events/s")
+        journal.close()
+
+        started = time.perf_counter()
+        journal = ActivityJournal(directory, retention_days=0)
+        print(f"Reopen: {(time.perf_counter() - started) * 1000:.1f} ms")
+        journal.close()
+
+        tracemalloc.start()
+        journal = ActivityJournal(directory, retention_days=0)
+        print(f"Index memory: {tracemalloc.get_traced_memory()[0] / 2**20:.1f} MiB")
+        tracemalloc.stop()
+
+        end = journal.end_seq
+        reads = []
+        for _ in range(1000):
+            top = random.randrange(PAGE, end)
+            started = time.perf_counter()
+            journal.read_range(top - PAGE, top)
+            reads.append((time.perf_counter() - started) * 1000)
+        reads.sort()
+        print(f"Random page read ({PAGE} events): median {reads[len(reads) // 2]:.3f} ms, "
+              f"p95 {reads[int(len(reads) * 0.95)]:.3f} ms")
+
+        started = time.perf_counter()
+        journal.seek_time(time.time() - 1)
+        print(f"seek_time: {(time.perf_counter() - started) * 1000:.3f} ms")
+        journal.close()
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    benchmark_activity_journal()
@@ -0,0 +1,131 @@
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication, QWidget, QFrame, QLabel, QVBoxLayout, QGridLayout
+
+from services.catalog import catalog
+from ui.models import ServiceCatalogModel
+from ui.styles import StyleManager
+from ui.views.dashboard import STAT_CARDS
+from ui.widgets import FlowGridLayout, ServiceCatalogView
+
+# Frame time while the window is resized continuously across the compact
+# breakpoint (1200 px), for the two responsive parts of the dashboard:
+# - the statistics cards: rebuilding a QGridLayout when the column count
+#   changes (what a naive responsive grid would do) vs. the dashboard's
+#   FlowGridLayout reflowing the existing cards;
+# - the service catalog: ServiceCatalogView relaying out delegate-painted
+#   cards, with the catalog padded to SERVICES entries.
+# Run with QT_QPA_PLATFORM=offscreen on headless machines.
+
+SERVICES = 200
+COMPACT_WIDTH = 1200
+WIDTHS = list(range(1400, 700, -10)) + list(range(700, 1400, 10))
+
+
+def build_stat_card(title):
+    # Same structure as DashboardPage.create_statistics_section
+    card = QFrame()
+    card.setObjectName("stat_card")
+    layout = QVBoxLayout(card)
+    layout.setContentsMargins(18, 15, 18, 15)
+    layout.setSpacing(4)
+    value = QLabel("–")
+    value.setObjectName("stat_value")
+    caption = QLabel(title)
+    caption.setObjectName("stat_title")
+    layout.addWidget(value)
+    layout.addWidget(caption)
+    return card
+
+
+class RebuildingStats(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.setObjectName("dashboard")
+        self._outer = QVBoxLayout(self)
+        self._grid_host = None
+        self._columns = 0
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        columns = 2 if self.width() < COMPACT_WIDTH else 4
+        if columns != self._columns:
+            self._columns = columns
+            if self._grid_host is not None:
+                self._outer.removeWidget(self._grid_host)
+                self._grid_host.deleteLater()
+            self._grid_host = QFrame()
+            self._grid_host.setObjectName("stats_section")
+            grid = QGridLayout(self._grid_host)
+            for i, (_key, title) in enumerate(STAT_CARDS):
+                grid.addWidget(build_stat_card(title), i // columns, i % columns)
+            self._outer.addWidget(self._grid_host)
+
+
+class ReflowingStats(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.setObjectName("dashboard")
+        outer = QVBoxLayout(self)
+        host = QFrame()
+        host.setObjectName("stats_section")
+        # As in the dashboard: compact mode caps the grid at two columns
+        self._grid = FlowGridLayout(host, min_column_width=180, max_columns=4, spacing=20,
+                                    compact_max_columns=2)
+        for _key, title in STAT_CARDS:
+            self._grid.addWidget(build_stat_card(title))
+        outer.addWidget(host)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._grid.set_compact(self.width() < COMPACT_WIDTH)
+
+
+class CatalogPage(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.setObjectName("dashboard")
+        outer = QVBoxLayout(self)
+        # The registered services, then placeholders up to SERVICES
+        self._model = ServiceCatalogModel(catalog(f"Service {i}" for i in range(SERVICES))[:SERVICES], self)
+        self._view = ServiceCatalogView()
+        self._view.setModel(self._model)
+        outer.addWidget(self._view)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._view.set_compact(self.width() < COMPACT_WIDTH)
+
+
+def measure(app, widget):
+    widget.resize(WIDTHS[0], 900)
+    widget.show()
+    app.processEvents()
+    frames = []
+    for width in WIDTHS:
+        started = time.perf_counter()
+        widget.resize(width, 900)
+        app.processEvents()
+        widget.repaint()
+        frames.append((time.perf_counter() - started) * 1000)
+    widget.close()
+    frames.sort()
+    return frames[len(frames) // 2], frames[int(len(frames) * 0.95)], frames[-1]
+
+
+def benchmark_resize():
+    app = QApplication.instance() or QApplication(sys.argv)
+    StyleManager.apply(app)
+    for name, widget in (("Stats: rebuild", RebuildingStats()),
+                         ("Stats: reflow", ReflowingStats()),
+                         (f"Catalog ({SERVICES} cards)", CatalogPage())):
+        median, p95, worst = measure(app, widget)
+        print(f"{name:<22} frame time: median {median:.2f} ms, p95 {p95:.2f} ms, max {worst:.2f} ms "
+              f"({len(WIDTHS)} resize steps)")
+
+
+if __name__ == "__main__":
+    benchmark_resize()
@@ -0,0 +1,88 @@
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication, QWidget, QFrame, QLabel, QPushButton, QVBoxLayout, QGridLayout
+
+from ui.assets import asset_text
+from ui.styles import StyleManager, THEMES, _VARIABLE
+
+# Polish time of a dashboard-sized widget tree: per-page and inline sheets
+# (previous behaviour) vs. one application-level sheet.
+# Run with QT_QPA_PLATFORM=offscreen on headless machines.
+
+PAGES = 20
+
+
+def read_qss(name):
+    return _VARIABLE.sub(lambda m: THEMES["dark"][m.group(1)], asset_text(f"ui/qss/{name}"))
+
+
+def build_page(inline):
+    page = QWidget()
+    page.setObjectName("dashboard")
+    layout = QVBoxLayout(page)
+    for section in ("dashboard_header", "quick_actions", "connection_section", "activity_section"):
+        frame = QFrame()
+        frame.setObjectName(section)
+        grid = QGridLayout(frame)
+        for i in range(6):
+            card = QFrame()
+            card.setObjectName("service_card")
+            card_layout = QVBoxLayout(card)
+            icon = QLabel("🎥")
+            icon.setObjectName("service_icon")
+            if inline:
+                icon.setStyleSheet("font-size: 40px;")
+            else:
+                icon.setProperty("fallback", True)
+            card_layout.addWidget(icon)
+            for name in ("service_name", "service_status"):
+                label = QLabel(name)
+                label.setObjectName(name)
+                card_layout.addWidget(label)
+            for name in ("connect_btn", "disconnect_btn"):
+                button = QPushButton(name)
+                button.setObjectName(name)
+                card_layout.addWidget(button)
+            grid.addWidget(card, i // 3, i % 3)
+        layout.addWidget(frame)
+    return page
+
+
+def run(app, inline):
+    timings = []
+    for _ in range(PAGES):
+        started = time.perf_counter()
+        page = build_page(inline)
+        if inline:
+            page.setStyleSheet(read_qss("dashboard.qss"))
+        page.show()
+        app.processEvents()
+        timings.append((time.perf_counter() - started) * 1000)
+        page.close()
+        page.deleteLater()
+        app.processEvents()
+    timings.sort()
+    return timings[len(timings) // 2], timings[-1]
+
+
+def benchmark_stylesheet():
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    app.setStyleSheet(read_qss("style.qss"))
+    before = run(app, inline=True)
+
+    started = time.perf_counter()
+    StyleManager.apply(app)
+    apply_ms = (time.perf_counter() - started) * 1000
+    after = run(app, inline=False)
+
+    print(f"Per-page + inline sheets: median {before[0]:.1f} ms, max {before[1]:.1f} ms per page")
+    print(f"Application-level sheet:  median {after[0]:.1f} ms, max {after[1]:.1f} ms per page "
+          f"(one-time apply {apply_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    benchmark_stylesheet()
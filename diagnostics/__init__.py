@@ -0,0 +1,10 @@
+"""
+Sentinel AI Diagnostics Module
+
+This module provides in-process instrumentation used to investigate
+slowness reports: span tracing, on-demand profiling, UI stall detection and related tooling.
+"""
+
+from . import tracing
+
+__all__ = ['tracing']
@@ -0,0 +1,169 @@
+"""
+Leak tracking across login/logout cycles.
+
+With SENTINEL_MEMTRACK set (to 1, or to the number of traceback frames to
+keep), tracemalloc is started at launch and a checkpoint is taken at
+login, dashboard-ready and logout. Each checkpoint records a tracemalloc
+snapshot, live thread counts and live QObject/widget counts by class, and
+is compared with the same phase of the previous cycle: the top growing
+allocation sites and the classes whose instance counts grew are logged.
+Checkpoint summaries are appended to DATA_DIR/memtrack/<session>.jsonl.
+"""
+
+import gc
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Dict, Any, Optional
+
+from config.app_paths import AppPaths
+
+log = logging.getLogger(__name__)
+
+MEMTRACK_ENV = "SENTINEL_MEMTRACK"
+
+
+class _Checkpoint:
+    def __init__(self, snapshot, threads: Counter, widgets: Counter, qobjects: Counter):
+        self.snapshot = snapshot
+        self.threads = threads
+        self.widgets = widgets
+        self.qobjects = qobjects
+
+
+def _thread_counts() -> Counter:
+    # Collapse numbered names ("ThreadPoolExecutor-3_0", "Thread-12") into one bucket
+    counts = Counter()
+    for thread in threading.enumerate():
+        counts[thread.name.rstrip("0123456789_-").split("-")[0] or thread.name] += 1
+    return counts
+
+
+def _qt_counts():
+    """Live widgets (C++ side) and Python-wrapped QObjects, by class name"""
+    from PyQt5.QtCore import QObject
+    from PyQt5.QtWidgets import QApplication
+
+    widgets = Counter(type(w).__name__ for w in QApplication.allWidgets()) if QApplication.instance() else Counter()
+    qobjects = Counter(type(o).__name__ for o in gc.get_objects() if isinstance(o, QObject))
+    return widgets, qobjects
+
+
+def _growth(current: Counter, previous: Counter, top: int) -> Dict[str, int]:
+    delta = Counter(current)
+    delta.subtract(previous)
+    return {name: n for name, n in delta.most_common(top) if n > 0}
+
+
+class MemoryTracker:
+    """Takes per-phase checkpoints and diffs them against the previous cycle"""
+
+    def __init__(self, frames: int = 10, top: int = 15):
+        self.frames = frames
+        self.top = top
+        self.cycle = 0
+        self._previous: Dict[str, _Checkpoint] = {}
+        self._lock = threading.Lock()
+        self._report_path: Optional[str] = None
+
+    @property
+    def enabled(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self._report_path = AppPaths.data_path("memtrack", f"{time.strftime('%Y%m%d-%H%M%S')}.jsonl")
+        log.info("Memory tracking enabled (%d frames); reports in %s", self.frames, self._report_path)
+
+    def stop(self) -> None:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._previous.clear()
+
+    def checkpoint(self, phase: str) -> Optional[Dict[str, Any]]:
+        """Record a checkpoint; phase "login" starts a new cycle. No-op when disabled."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            if phase == "login":
+                self.cycle += 1
+            gc.collect()
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ))
+            widgets, qobjects = _qt_counts()
+            current = _Checkpoint(snapshot, _thread_counts(), widgets, qobjects)
+            previous = self._previous.get(phase)
+            self._previous[phase] = current
+
+            traced, peak = tracemalloc.get_traced_memory()
+            report: Dict[str, Any] = {
+                "time": time.time(),
+                "cycle": self.cycle,
+                "phase": phase,
+                "traced_kb": round(traced / 1024, 1),
+                "peak_kb": round(peak / 1024, 1),
+                "threads": dict(current.threads),
+                "widgets": sum(widgets.values()),
+                "qobjects": sum(qobjects.values()),
+            }
+            if previous is not None:
+                report["growth"] = {
+                    "sites": [
+                        {"site": str(stat.traceback[0]), "size_kb": round(stat.size_diff / 1024, 1),
+                         "count": stat.count_diff}
+                        for stat in snapshot.compare_to(previous.snapshot, "lineno")[:self.top]
+                        if stat.size_diff > 0
+                    ],
+                    "threads": _growth(current.threads, previous.threads, self.top),
+                    "widgets": _growth(widgets, previous.widgets, self.top),
+                    "qobjects": _growth(qobjects, previous.qobjects, self.top),
+                }
+
+        self._log_report(report)
+        self._write_report(report)
+        return report
+
+    def _log_report(self, report: Dict[str, Any]) -> None:
+        log.info("memtrack cycle %d %s: traced=%.0f KB peak=%.0f KB threads=%d widgets=%d qobjects=%d",
+                 report["cycle"], report["phase"], report["traced_kb"], report["peak_kb"],
+                 sum(report["threads"].values()), report["widgets"], report["qobjects"])
+        growth = report.get("growth")
+        if not growth:
+            return
+        lines = [f"  +{site['size_kb']} KB ({site['count']:+d} blocks) {site['site']}" for site in growth["sites"]]
+        for key in ("threads", "widgets", "qobjects"):
+            if growth[key]:
+                lines.append(f"  {key} grew: " + ", ".join(f"{name} +{n}" for name, n in growth[key].items()))
+        if lines:
+            log.info("memtrack growth since previous %s:\n%s", report["phase"], "\n".join(lines))
+
+    def _write_report(self, report: Dict[str, Any]) -> None:
+        if not self._report_path:
+            return
+        try:
+            with open(self._report_path, "a") as f:
+                f.write(json.dumps(report) + "\n")
+        except OSError as exc:
+            log.warning("Could not write memtrack report: %s", exc)
+
+
+_tracker: Optional[MemoryTracker] = None
+
+
+def get_memory_tracker() -> MemoryTracker:
+    """Shared tracker; started on first use when SENTINEL_MEMTRACK is set"""
+    global _tracker
+    if _tracker is None:
+        setting = os.getenv(MEMTRACK_ENV, "")
+        _tracker = MemoryTracker(frames=int(setting) if setting.isdigit() and int(setting) > 1 else 10)
+        if setting and setting.lower() not in ("0", "false", "no"):
+            _tracker.start()
+    return _tracker
@@ -0,0 +1,170 @@
+"""
+On-demand profiling from inside the running app.
+
+A capture runs cProfile on the thread that starts it plus a stack-sampler
+thread that periodically samples every thread with sys._current_frames().
+Stopping it writes <name>-<timestamp>.pstats (open with pstats/snakeviz)
+and <name>-<timestamp>.collapsed (folded stacks for flamegraph.pl,
+speedscope or inferno) to the profiles directory.
+
+SENTINEL_PROFILE selects what gets profiled:
+    actions      every user action wrapped in profile_action()
+    startup:N    the first N seconds after start-up
+The dashboard's System Settings menu can arm the next action or profile a
+time window at runtime.
+"""
+
+import contextlib
+import cProfile
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+from config.app_paths import AppPaths
+
+log = logging.getLogger(__name__)
+
+PROFILE_ENV = "SENTINEL_PROFILE"
+SAMPLE_INTERVAL_MS = float(os.getenv("SENTINEL_PROFILE_SAMPLE_MS", "5"))
+
+_mode = os.getenv(PROFILE_ENV, "")
+_armed_next = False
+_active_lock = threading.Lock()
+_active: Optional["ProfileCapture"] = None
+
+
+class StackSampler(threading.Thread):
+    """Samples the Python stacks of all threads into collapsed-stack counts"""
+
+    def __init__(self, interval_ms: float = None):
+        super().__init__(name="StackSampler", daemon=True)
+        self.interval = (interval_ms or SAMPLE_INTERVAL_MS) / 1000.0
+        self.samples: Counter = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)).replace(";", "_"))
+                self.samples[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join(1.0)
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class ProfileCapture:
+    """One capture: cProfile on the starting thread plus an all-thread sampler"""
+
+    def __init__(self, name: str, output_dir: str = None, sample_interval_ms: float = None):
+        self.name = "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+        self.output_dir = output_dir or os.path.join(AppPaths.DATA_DIR, "profiles")
+        self._profile = cProfile.Profile()
+        self._sampler = StackSampler(sample_interval_ms)
+        self._started = 0.0
+
+    def start(self) -> "ProfileCapture":
+        self._started = time.perf_counter()
+        self._sampler.start()
+        self._profile.enable()
+        return self
+
+    def stop(self) -> Dict[str, str]:
+        """Stop profiling (on the thread that called start) and write the output files"""
+        self._profile.disable()
+        self._sampler.stop()
+        elapsed = time.perf_counter() - self._started
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"{self.name}-{time.strftime('%Y%m%d-%H%M%S')}")
+        paths = {"pstats": base + ".pstats", "collapsed": base + ".collapsed"}
+        self._profile.dump_stats(paths["pstats"])
+        with open(paths["collapsed"], "w") as f:
+            f.write(self._sampler.collapsed())
+        log.info("Profile '%s' (%.2f s, %d samples) written to %s.{pstats,collapsed}",
+                 self.name, elapsed, sum(self._sampler.samples.values()), base)
+        return paths
+
+
+def start_capture(name: str) -> Optional[ProfileCapture]:
+    """Start a capture unless one is already running (profilers do not nest)"""
+    global _active
+    with _active_lock:
+        if _active is not None:
+            return None
+        _active = ProfileCapture(name)
+    try:
+        return _active.start()
+    except Exception:
+        with _active_lock:
+            _active = None
+        raise
+
+
+def stop_capture(capture: ProfileCapture) -> Optional[Dict[str, str]]:
+    global _active
+    try:
+        return capture.stop()
+    except Exception as exc:
+        log.warning("Could not write profile '%s': %s", capture.name, exc)
+        return None
+    finally:
+        with _active_lock:
+            if _active is capture:
+                _active = None
+
+
+def arm_next_action() -> None:
+    """Profile the next action wrapped in profile_action()"""
+    global _armed_next
+    _armed_next = True
+
+
+def startup_window_seconds() -> float:
+    """Seconds requested with SENTINEL_PROFILE=startup:N (0 if not requested)"""
+    if _mode.startswith("startup"):
+        _, _, seconds = _mode.partition(":")
+        try:
+            return float(seconds or 10)
+        except ValueError:
+            return 10.0
+    return 0.0
+
+
+@contextlib.contextmanager
+def profile_action(name: str):
+    """Profile the enclosed block if action profiling is on or armed; otherwise a no-op"""
+    global _armed_next
+    if _mode != "actions" and not _armed_next:
+        yield
+        return
+    _armed_next = False
+    capture = start_capture(name)
+    try:
+        yield
+    finally:
+        if capture:
+            stop_capture(capture)
+
+
+def wrap_action(name: str, fn: Callable) -> Callable:
+    """Return fn wrapped in profile_action(), for work submitted to executors"""
+    def run(*args, **kwargs):
+        with profile_action(name):
+            return fn(*args, **kwargs)
+    return run
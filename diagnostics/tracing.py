@@ -0,0 +1,195 @@
+"""
+Lightweight span tracing exportable to the Chrome trace format.
+
+Wrap hot paths in ``with span("name"):`` (or ``@traced()``); nested spans
+nest by time on each thread. Work handed to executors keeps its parent
+context when the callable goes through ``wrap()``; a flow arrow links the
+submitting span to the worker span in the viewer.
+
+Tracing is off unless SENTINEL_TRACE is set (to the output file written at
+exit) or enable() is called, e.g. from the hidden "Export trace" action.
+Open the file in chrome://tracing or https://ui.perfetto.dev.
+"""
+
+import atexit
+import contextvars
+import functools
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+TRACE_ENV = "SENTINEL_TRACE"
+MAX_EVENTS = int(os.getenv("SENTINEL_TRACE_MAX_EVENTS", "200000"))
+
+_enabled = bool(os.getenv(TRACE_ENV))
+_events = deque(maxlen=MAX_EVENTS)
+_thread_names: Dict[int, str] = {}
+_flow_ids = itertools.count(1)
+_current: contextvars.ContextVar = contextvars.ContextVar("sentinel_trace_span", default=None)
+_pid = os.getpid()
+
+
+def _now_us() -> float:
+    return time.perf_counter_ns() / 1000.0
+
+
+def _tid() -> int:
+    tid = threading.get_ident()
+    if tid not in _thread_names:
+        _thread_names[tid] = threading.current_thread().name
+    return tid
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def clear() -> None:
+    _events.clear()
+
+
+class _Span:
+    __slots__ = ("name", "cat", "args", "_start", "_token")
+
+    def __init__(self, name: str, cat: str, args: Dict[str, Any]):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        parent = _current.get()
+        if parent is not None:
+            self.args["parent"] = parent.name
+        self._token = _current.set(self)
+        self._start = _now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = _now_us()
+        _current.reset(self._token)
+        if exc_type is not None:
+            self.args["error"] = f"{exc_type.__name__}: {exc}"
+        _events.append({"name": self.name, "cat": self.cat, "ph": "X", "ts": self._start,
+                        "dur": end - self._start, "pid": _pid, "tid": _tid(), "args": self.args})
+        return False
+
+    def set(self, **args) -> None:
+        """Attach extra arguments to the span (shown in the viewer)"""
+        self.args.update(args)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name: str, cat: str = "app", **args):
+    """Context manager timing a block; a shared no-op when tracing is off"""
+    if not _enabled:
+        return _NOOP
+    return _Span(name, cat, args)
+
+
+def traced(name: Optional[str] = None, cat: str = "app"):
+    """Decorator form of span(); defaults to the function's qualified name"""
+    def decorator(fn):
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(span_name, cat, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_complete(name: str, duration_s: float, cat: str = "app", **args) -> None:
+    """Record an already-finished operation that ended now (e.g. from event listeners)"""
+    if not _enabled:
+        return
+    end = _now_us()
+    parent = _current.get()
+    if parent is not None:
+        args["parent"] = parent.name
+    _events.append({"name": name, "cat": cat, "ph": "X", "ts": end - duration_s * 1e6,
+                    "dur": duration_s * 1e6, "pid": _pid, "tid": _tid(), "args": args})
+
+
+def wrap(fn: Callable) -> Callable:
+    """Bind fn to the current trace context so it can run on another thread"""
+    if not _enabled:
+        return fn
+    ctx = contextvars.copy_context()
+    parent = _current.get()
+    flow_id = None
+    if parent is not None:
+        flow_id = next(_flow_ids)
+        _events.append({"name": parent.name, "cat": "flow", "ph": "s", "id": flow_id,
+                        "ts": _now_us(), "pid": _pid, "tid": _tid()})
+
+    @functools.wraps(fn)
+    def run_in_context(*args, **kwargs):
+        def call():
+            if flow_id is None:
+                return fn(*args, **kwargs)
+            with _Span(getattr(fn, "__qualname__", "task"), "worker", {}):
+                _events.append({"name": parent.name, "cat": "flow", "ph": "f", "bp": "e", "id": flow_id,
+                                "ts": _now_us(), "pid": _pid, "tid": _tid()})
+                return fn(*args, **kwargs)
+        return ctx.run(call)
+    return run_in_context
+
+
+def export_chrome_trace(path: str) -> int:
+    """Write recorded events as Chrome trace JSON. Returns the number of events written."""
+    events = list(_events)
+    metadata = [{"name": "thread_name", "ph": "M", "pid": _pid, "tid": tid, "args": {"name": name}}
+                for tid, name in list(_thread_names.items())]
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+    log.info("Wrote %d trace events to %s", len(events), path)
+    return len(events)
+
+
+def _export_at_exit() -> None:
+    path = os.getenv(TRACE_ENV)
+    if path and _events:
+        try:
+            export_chrome_trace(path)
+        except Exception as exc:
+            log.warning("Could not write trace to %s: %s", path, exc)
+
+
+atexit.register(_export_at_exit)
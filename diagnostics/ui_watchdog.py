@@ -0,0 +1,104 @@
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Dict, Any, Optional
+
+from PyQt5.QtCore import QObject, QTimer
+
+from diagnostics.histogram import LatencyHistogram
+
+log = logging.getLogger(__name__)
+
+# Stalls longer than this are logged with the main thread's stack (0 disables the watchdog)
+STALL_THRESHOLD_MS = int(os.getenv('SENTINEL_STALL_THRESHOLD_MS', '250'))
+HEARTBEAT_MS = int(os.getenv('SENTINEL_STALL_HEARTBEAT_MS', '50'))
+
+
+class UIWatchdog(QObject):
+    """Detects event-loop stalls on the Qt main thread.
+
+    A QTimer on the main thread records a heartbeat every HEARTBEAT_MS. A
+    background thread checks the heartbeat age; once it exceeds the threshold
+    the main thread's Python stack is captured with sys._current_frames() and
+    logged while the stall is still in progress. When heartbeats resume, the
+    stall duration is added to a fixed-bucket histogram.
+    """
+
+    def __init__(self, threshold_ms: int = None, heartbeat_ms: int = None, max_recent: int = 20, parent=None):
+        super().__init__(parent)
+        self.threshold_ms = STALL_THRESHOLD_MS if threshold_ms is None else threshold_ms
+        self.heartbeat_ms = heartbeat_ms or HEARTBEAT_MS
+        self._histogram = LatencyHistogram()
+        self._recent = deque(maxlen=max_recent)  # (ended_at, duration_ms, stack)
+        self._lock = threading.Lock()
+        self._main_ident = threading.main_thread().ident
+        self._last_beat = time.monotonic()
+        self._stall_stack: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.heartbeat_ms)
+        self._timer.timeout.connect(self._beat)
+
+    def start(self) -> None:
+        if self.threshold_ms <= 0 or self._thread:
+            return
+        # Must be started from the Qt main thread: that is the thread sampled
+        self._main_ident = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._timer.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._monitor, name="UIWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._stop.set()
+        if self._thread:
+            self._thread.join(1.0)
+            self._thread = None
+        summary = self.snapshot()
+        if summary["stalls"]["count"]:
+            log.info("UI stalls this session: %s", summary["stalls"])
+
+    def _beat(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            # Time beyond the expected heartbeat interval is time the loop was blocked
+            stalled_ms = (now - self._last_beat) * 1000 - self.heartbeat_ms
+            self._last_beat = now
+            stack, self._stall_stack = self._stall_stack, None
+            if stalled_ms >= self.threshold_ms:
+                self._histogram.observe(stalled_ms)
+                self._recent.append((time.time(), stalled_ms, stack))
+        if stack is not None:
+            log.warning("UI thread unblocked after %.0f ms", stalled_ms)
+
+    def _monitor(self) -> None:
+        poll = max(self.threshold_ms / 4000.0, 0.01)
+        while not self._stop.wait(poll):
+            with self._lock:
+                age_ms = (time.monotonic() - self._last_beat) * 1000
+                already_captured = self._stall_stack is not None
+            if age_ms < self.threshold_ms + self.heartbeat_ms or already_captured:
+                continue
+            frame = sys._current_frames().get(self._main_ident)
+            stack = "".join(traceback.format_stack(frame)) if frame else "<main thread stack unavailable>"
+            with self._lock:
+                self._stall_stack = stack
+            log.warning("UI thread stalled for %.0f ms; main thread stack:\n%s", age_ms, stack)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Stall histogram plus the most recent stalls (duration and captured stack)"""
+        with self._lock:
+            return {
+                "threshold_ms": self.threshold_ms,
+                "stalls": self._histogram.snapshot(),
+                "recent": [{"ended_at": ended_at, "duration_ms": round(ms, 1), "stack": stack}
+                           for ended_at, ms, stack in self._recent],
+            }
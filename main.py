@@ -1,16 +1,54 @@
 import sys
 import os
+import time
+
+# Reference point for time-to-dashboard on remembered (warm) starts
+PROCESS_STARTED = time.perf_counter()
+
+# A second launch hands its arguments to the running instance and exits
+# before importing the rest of the application
+from ui.single_instance import InstanceServer, forward_to_running_instance, parse_arguments
+
+if __name__ == '__main__':
+    LAUNCH_REQUEST = parse_arguments(sys.argv[1:])
+    if forward_to_running_instance(LAUNCH_REQUEST):
+        sys.exit(0)
+
 import logging
-from PyQt5.QtWidgets import QApplication, QStackedWidget
-from PyQt5.QtGui import QIcon
+import threading
+from config.logging_config import setup_logging
+from PyQt5.QtWidgets import QApplication, QStackedWidget, QAction, QWidget
+from PyQt5.QtCore import QTimer, pyqtSignal
+from auth.keyring_auth import KeyringAuthFixed
+from auth.remember_me import RememberMe
 from ui.views.signup_page import SignupPage
 from ui.views.login_page import LoginPage
 from ui.views.dashboard import DashboardPage
+from ui.styles import StyleManager
+from ui.assets import load_icon
+from database.user_sync import UserSyncEngine
+from database.login_activity import get_login_recorder, stop_login_recorder
+from database.monitoring import get_metrics
+from database.connection import close_client
+from services.warmup import start_warmup
+from services.activity_journal import close_activity_journal, record_activity
+from services.connector_worker import stop_connector_worker
+from config.database_config import DatabaseConfig
+from config.app_paths import AppPaths
+from diagnostics import tracing, profiler
+from diagnostics.ui_watchdog import UIWatchdog
+from diagnostics.memory_tracker import get_memory_tracker
 
-logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+# Delay after the login page is shown before the dashboard is built in the background (-1 disables)
+DASHBOARD_PREWARM_MS = int(os.getenv('SENTINEL_DASHBOARD_PREWARM_MS', '300'))
 
 
 class MainApp(QStackedWidget):
+    # Emitted from the remember-me check thread with the verified username
+    remembered_session = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
 
@@ -23,29 +61,179 @@ class MainApp(QStackedWidget):
 
         self.setCurrentWidget(self.login_page)
 
+        # The active dashboard, and one built ahead of time for the next login
+        self.dashboard = None
+        self._prewarmed_dashboard = None
+        self._schedule_prewarm()
+        self.remembered_session.connect(self._on_remembered_session)
+
+        # Files and services requested on the command line, handled once a user is logged in
+        self._pending_files = []
+        self._pending_connects = []
+
+        # Hidden diagnostics action: the first press starts tracing, later presses export it
+        trace_action = QAction(self)
+        trace_action.setShortcut("Ctrl+Alt+Shift+T")
+        trace_action.triggered.connect(self.toggle_trace_export)
+        self.addAction(trace_action)
+
+    def toggle_trace_export(self):
+        if not tracing.is_enabled():
+            tracing.enable()
+            log.info("Tracing enabled; press Ctrl+Alt+Shift+T again to export")
+            return
+        path = AppPaths.data_path("traces", f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        tracing.export_chrome_trace(path)
+
     def show_login(self):
         self.setCurrentWidget(self.login_page)
+        if self.dashboard is not None:
+            self._retire_dashboard()
+
+    def save_state(self):
+        """Save the active dashboard's snapshot (on quit)"""
+        if self.dashboard is not None:
+            self.dashboard.save_snapshot()
 
     def show_signup(self):
         self.setCurrentWidget(self.signup_page)
 
-    def show_dashboard(self, username):
-        self.dashboard = DashboardPage(main_app=self, username=username)
-        self.addWidget(self.dashboard)
-        self.setCurrentWidget(self.dashboard)
+    def _schedule_prewarm(self):
+        if DASHBOARD_PREWARM_MS >= 0:
+            QTimer.singleShot(DASHBOARD_PREWARM_MS, self.prewarm_dashboard)
+
+    def prewarm_dashboard(self):
+        """Build the user-independent dashboard (widgets, pixmaps, services) while the login page is idle"""
+        # Also reached from the start-up timer after a remembered session is already on the dashboard
+        if self._prewarmed_dashboard is not None or self.dashboard is not None:
+            return
+        with tracing.span("MainApp.prewarm_dashboard", "ui"):
+            page = DashboardPage(main_app=self)
+            self.addWidget(page)
+        self._prewarmed_dashboard = page
+        # Polish and lay out in a later event-loop turn, keeping each step short
+        QTimer.singleShot(0, lambda: self._polish_dashboard(page))
+
+    def _polish_dashboard(self, page):
+        if page is not self._prewarmed_dashboard:
+            return
+        with tracing.span("MainApp.polish_dashboard", "ui"):
+            page.resize(self.size())
+            for widget in page.findChildren(QWidget):
+                widget.ensurePolished()
+            page.layout().activate()
+
+    def _retire_dashboard(self):
+        """Discard the logged-out dashboard (a fresh one is prewarmed for the next login)"""
+        page, self.dashboard = self.dashboard, None
+        self.removeWidget(page)
+        page.shutdown()
+        page.deleteLater()
+        self._schedule_prewarm()
+
+    def try_remembered_session(self):
+        """Skip the login page if this device has a valid remembered session.
+
+        The local record decides whether there is anything to check; the
+        check itself is one keyring read on a background thread while the
+        dashboard is built.
+        """
+        username = RememberMe.candidate()
+        if username is None:
+            return
+        QTimer.singleShot(0, self.prewarm_dashboard)
+
+        def verify():
+            if not RememberMe.verify(username):
+                return
+            try:
+                KeyringAuthFixed.start_session(username)
+            except Exception as exc:
+                log.warning("Could not store session for remembered user %s: %s", username, exc)
+                return
+            self.remembered_session.emit(username)
+
+        threading.Thread(target=verify, name="RememberMe", daemon=True).start()
+
+    def _on_remembered_session(self, username):
+        # The user may have logged in (or signed up) by hand in the meantime
+        if self.dashboard is not None or self.currentWidget() is not self.login_page:
+            return
+        get_login_recorder().record_login(username)
+        record_activity("login", message="Remembered session", username=username)
+        self.show_dashboard(username, started=PROCESS_STARTED, label="remembered", session_verified=True)
+
+    def handle_launch_request(self, request, activate=True):
+        """Act on a command line, from this launch or forwarded by a later one"""
+        if activate:
+            self.showNormal() if self.isMinimized() else self.show()
+            self.raise_()
+            self.activateWindow()
+        self._pending_files.extend(request.get("files", ()))
+        self._pending_connects.extend(request.get("connect", ()))
+        self._run_pending_requests()
+
+    def _run_pending_requests(self):
+        if self.dashboard is None or self.currentWidget() is not self.dashboard:
+            return
+        files, self._pending_files = self._pending_files, []
+        connects, self._pending_connects = self._pending_connects, []
+        for path in files:
+            self.dashboard.open_file(path)
+        for service in connects:
+            self.dashboard.request_connect(service)
+
+    def show_dashboard(self, username, started=None, label=None, session_verified=False):
+        get_memory_tracker().checkpoint("login")
+        started = started if started is not None else time.perf_counter()
+        with tracing.span("MainApp.show_dashboard", "ui"), profiler.profile_action("show_dashboard"):
+            page, self._prewarmed_dashboard = self._prewarmed_dashboard, None
+            prewarmed = page is not None
+            if page is None:
+                page = DashboardPage(main_app=self)
+                self.addWidget(page)
+            if not page.bind_user(username, session_verified=session_verified):
+                self._prewarmed_dashboard = page
+                return
+            self.dashboard = page
+            page.measure_first_paint(started, label or ("prewarmed" if prewarmed else "cold"))
+            self.setCurrentWidget(page)
+        # After the first paint of the dashboard
+        QTimer.singleShot(0, lambda: get_memory_tracker().checkpoint("dashboard_ready"))
+        QTimer.singleShot(0, self._run_pending_requests)
 
 
 if __name__ == '__main__':
+    # Queue-based logging: handlers run on a listener thread, never on the GUI thread
+    setup_logging()
+    # SENTINEL_MEMTRACK: start tracemalloc before the app allocates anything
+    get_memory_tracker()
+
+    # SENTINEL_PROFILE=startup:N profiles the first N seconds of start-up
+    startup_capture = profiler.start_capture("startup") if profiler.startup_window_seconds() else None
+
     app = QApplication(sys.argv)
     app.setApplicationName("Sentinel AI")
 
+    # Later launches forward their arguments here instead of starting a second process
+    instance_server = InstanceServer()
+    if not instance_server.listen():
+        # Another instance finished starting while this one was; hand over after all
+        sys.exit(0 if forward_to_running_instance(LAUNCH_REQUEST) else 1)
+    app.aboutToQuit.connect(instance_server.close)
+
+    # Keyring, MongoDB and Google transport cold starts run in the background from here on
+    warmup = start_warmup()
+
+    # Log main-thread stacks whenever the event loop stalls (SENTINEL_STALL_THRESHOLD_MS)
+    ui_watchdog = UIWatchdog()
+    ui_watchdog.start()
+    app.aboutToQuit.connect(ui_watchdog.stop)
+
+    # One merged, themed stylesheet for every page; views never call setStyleSheet()
     try:
-        style_path = os.path.join("ui", "qss", "style.qss")
-        with open(style_path, "r") as file:
-            style = file.read()
-            app.setStyleSheet(style)
-    except FileNotFoundError:
-        print("⚠️  Warning: style.qss not found. Running without styles.")
+        with tracing.span("StyleManager.apply", "ui"):
+            StyleManager.apply(app)
     except Exception as e:
         print(f"⚠️  Error loading stylesheet: {e}")
 
@@ -54,10 +242,9 @@ if __name__ == '__main__':
     window.setMinimumSize(800, 600)  # Set minimum size instead of fixed
     window.resize(1400, 1200)  # Default size
 
-    try:
-        window.setWindowIcon(QIcon("assets/icon.png"))
-    except Exception as e:
-        print("⚠️  Could not load icon:", e)
+    icon = load_icon("assets/icon.png")
+    if icon is not None:
+        window.setWindowIcon(icon)
 
     screen = app.primaryScreen().availableGeometry()
     x = (screen.width() - window.width()) // 2
@@ -65,4 +252,40 @@ if __name__ == '__main__':
     window.move(x, y)
 
     window.show()
+    window.try_remembered_session()
+    instance_server.request_received.connect(window.handle_launch_request)
+    window.handle_launch_request(LAUNCH_REQUEST, activate=False)
+
+    if startup_capture:
+        QTimer.singleShot(int(profiler.startup_window_seconds() * 1000),
+                          lambda: profiler.stop_capture(startup_capture))
+
+    # Reconcile keyring and MongoDB users in the background, once Mongo has warmed up
+    user_sync = UserSyncEngine()
+
+    def start_user_sync(mongo_ready):
+        if app.closingDown():
+            return
+        error = mongo_ready.exception()
+        if error is None:
+            user_sync.start()
+        else:
+            # Unreachable now; the first sync waits a full interval instead of failing right away
+            log.warning("MongoDB warm-up failed (%r); deferring user sync", error)
+            user_sync.start(delay=DatabaseConfig.USER_SYNC_INTERVAL)
+
+    warmup.ready("mongo").add_done_callback(start_user_sync)
+    app.aboutToQuit.connect(user_sync.stop)
+    # Flush buffered login activity before exiting
+    app.aboutToQuit.connect(stop_login_recorder)
+    # Last-known dashboard state for the next launch
+    app.aboutToQuit.connect(window.save_state)
+    # Write any activity events still waiting for their batched fsync
+    app.aboutToQuit.connect(close_activity_journal)
+    # Let the connector worker process (SENTINEL_CONNECTOR_MODE=process) exit
+    app.aboutToQuit.connect(stop_connector_worker)
+    if DatabaseConfig.MONGODB_METRICS_PATH:
+        app.aboutToQuit.connect(lambda: get_metrics().dump(DatabaseConfig.MONGODB_METRICS_PATH))
+    app.aboutToQuit.connect(close_client)
+
     sys.exit(app.exec_())
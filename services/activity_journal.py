@@ -0,0 +1,554 @@
+"""
+Append-only activity journal.
+
+Activity events (service connects/disconnects, logins, logouts, file
+uploads) are written to segment files in DATA_DIR/activity. Every record
+has the same size, so event number seq lives at a known offset of a known
+segment and any page of the feed is one read, however long the history.
+
+- Appends only touch memory; a writer thread writes pending records in one
+  write() and one fsync() per batch (every FLUSH_INTERVAL seconds or
+  BATCH_SIZE events, and on close()).
+- A segment is sealed after SEGMENT_RECORDS records and gets a .idx
+  sidecar (per-service and per-user offsets and a sparse time index), so
+  opening the journal only scans the active segment.
+- In memory: per-service and per-user arrays of seqs and a sparse
+  (timestamp, seq) index every TIME_INDEX_STRIDE events.
+- Compaction deletes sealed segments older than RETENTION_DAYS, and the
+  oldest ones beyond MAX_SEGMENTS.
+"""
+
+import bisect
+import glob
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from config.app_paths import AppPaths
+
+log = logging.getLogger(__name__)
+
+JOURNAL_DIR = os.getenv('SENTINEL_ACTIVITY_DIR', os.path.join(AppPaths.DATA_DIR, 'activity'))
+RETENTION_DAYS = float(os.getenv('SENTINEL_ACTIVITY_RETENTION_DAYS', '90'))
+MAX_SEGMENTS = int(os.getenv('SENTINEL_ACTIVITY_MAX_SEGMENTS', '0'))   # 0 = no limit
+FLUSH_INTERVAL = float(os.getenv('SENTINEL_ACTIVITY_FLUSH_INTERVAL', '1.0'))
+BATCH_SIZE = 256
+SEGMENT_RECORDS = 16384          # 4 MiB segments
+TIME_INDEX_STRIDE = 256
+COMPACT_INTERVAL = 3600.0
+MAX_OPEN_SEGMENTS = 16           # read descriptors kept open
+
+# crc32, seq, timestamp, kind, service, username, message: 256 bytes
+_RECORD = struct.Struct("<IQd16s48s32s140s")
+RECORD_SIZE = _RECORD.size
+
+# Segments are binary; without this Windows opens them in text mode
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+class ActivityEvent(NamedTuple):
+    seq: int
+    timestamp: float
+    kind: str          # connect, disconnect, error, login, logout, upload
+    service: str
+    username: str
+    message: str
+
+
+def _encode(event: ActivityEvent) -> bytes:
+    body = _RECORD.pack(
+        0, event.seq, event.timestamp,
+        event.kind.encode("utf-8")[:16], event.service.encode("utf-8")[:48],
+        event.username.encode("utf-8")[:32], event.message.encode("utf-8")[:140],
+    )
+    return struct.pack("<I", zlib.crc32(body[4:])) + body[4:]
+
+
+def _decode(raw: bytes) -> Optional[ActivityEvent]:
+    crc, seq, ts, kind, service, username, message = _RECORD.unpack(raw)
+    if crc != zlib.crc32(raw[4:]):
+        return None
+
+    def text(value: bytes) -> str:
+        # Fields are NUL-padded and may end in a cut multi-byte character
+        return value.rstrip(b"\0").decode("utf-8", "ignore")
+
+    return ActivityEvent(seq, ts, text(kind), text(service), text(username), text(message))
+
+
+def _read_array(f, typecode: str, n: int) -> array:
+    values = array(typecode)
+    values.fromfile(f, n)
+    return values
+
+
+class _Segment:
+    def __init__(self, path: str, first_seq: int, count: int = 0, first_ts: float = 0.0, last_ts: float = 0.0):
+        self.path = path
+        self.first_seq = first_seq
+        self.count = count
+        self.first_ts = first_ts
+        self.last_ts = last_ts
+
+    @property
+    def end_seq(self) -> int:
+        return self.first_seq + self.count
+
+    @property
+    def index_path(self) -> str:
+        return self.path[:-len(".log")] + ".idx"
+
+
+class ActivityJournal:
+    """Segmented append-only event log with batched fsync and in-memory indexes"""
+
+    def __init__(self, directory: str = None, retention_days: float = None, max_segments: int = None,
+                 flush_interval: float = None):
+        self.directory = directory or JOURNAL_DIR
+        self.retention_days = RETENTION_DAYS if retention_days is None else retention_days
+        self.max_segments = MAX_SEGMENTS if max_segments is None else max_segments
+        self.flush_interval = flush_interval or FLUSH_INTERVAL
+
+        self._lock = threading.Lock()          # state below, and reads
+        self._flush_lock = threading.Lock()    # one writer (flush/compact) at a time
+        self._segments: List[_Segment] = []
+        self._segment_starts: List[int] = []
+        self._write_fd: Optional[int] = None
+        self._read_fds: "OrderedDict[str, int]" = OrderedDict()
+        self._unflushed: List[ActivityEvent] = []
+        self._flushed_seq = 0
+        self._next_seq = 0
+        self._last_ts = 0.0
+
+        self._service_index: Dict[str, array] = {}
+        self._user_index: Dict[str, array] = {}
+        self._time_keys = array("d")
+        self._time_seqs = array("Q")
+
+        self._listeners: List[Callable[[], None]] = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_compact = 0.0
+
+        self._load()
+
+    # Loading
+
+    def _load(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        paths = sorted(glob.glob(os.path.join(self.directory, "seg-*.log")))
+        started = time.perf_counter()
+        for i, path in enumerate(paths):
+            first_seq = int(os.path.basename(path)[4:-4])
+            segment = _Segment(path, first_seq)
+            sealed = i < len(paths) - 1
+            if not (sealed and self._load_index(segment)):
+                self._scan(segment, truncate=not sealed)
+                if sealed:
+                    self._write_index(segment)
+            self._segments.append(segment)
+            self._segment_starts.append(first_seq)
+
+        if self._segments:
+            last = self._segments[-1]
+            self._next_seq = self._flushed_seq = last.end_seq
+            self._last_ts = last.last_ts
+        log.debug("Activity journal opened: %d segments, %d events, %.1f ms",
+                  len(self._segments), self.count(), (time.perf_counter() - started) * 1000)
+
+    def _load_index(self, segment: _Segment) -> bool:
+        try:
+            with open(segment.index_path, "rb") as f:
+                header = json.loads(f.readline())
+                if header["count"] != os.path.getsize(segment.path) // RECORD_SIZE:
+                    return False
+                services = {}
+                for service, n in header["services"]:
+                    services[service] = _read_array(f, "Q", n)
+                # Sidecars from before the user index lack "users" and are rebuilt by a scan
+                users = {}
+                for username, n in header["users"]:
+                    users[username] = _read_array(f, "Q", n)
+                time_keys = _read_array(f, "d", header["times"])
+                time_seqs = _read_array(f, "Q", header["times"])
+        except (OSError, ValueError, KeyError, EOFError):
+            return False
+        segment.count = header["count"]
+        segment.first_ts = header["first_ts"]
+        segment.last_ts = header["last_ts"]
+        for service, seqs in services.items():
+            self._service_index.setdefault(service, array("Q")).extend(seqs)
+        for username, seqs in users.items():
+            self._user_index.setdefault(username, array("Q")).extend(seqs)
+        self._time_keys.extend(time_keys)
+        self._time_seqs.extend(time_seqs)
+        return True
+
+    def _scan(self, segment: _Segment, truncate: bool) -> None:
+        """Index a segment from its records; for the active one, drop a torn or corrupt tail"""
+        valid = 0
+        with open(segment.path, "rb") as f:
+            while True:
+                raw = f.read(RECORD_SIZE)
+                if len(raw) < RECORD_SIZE:
+                    break
+                event = _decode(raw)
+                if event is None or event.seq != segment.first_seq + valid:
+                    break
+                self._index_event(event)
+                if valid == 0:
+                    segment.first_ts = event.timestamp
+                segment.last_ts = event.timestamp
+                valid += 1
+        segment.count = valid
+        if truncate and os.path.getsize(segment.path) != valid * RECORD_SIZE:
+            log.warning("Truncating activity segment %s to %d valid records", segment.path, valid)
+            os.truncate(segment.path, valid * RECORD_SIZE)
+
+    def _write_index(self, segment: _Segment) -> None:
+        """Sidecar for a sealed segment: a JSON header line, then the raw index arrays"""
+        start, end = segment.first_seq, segment.end_seq
+
+        def in_segment(index: Dict[str, array]) -> List[Tuple[str, array]]:
+            entries = []
+            for key, seqs in index.items():
+                lo, hi = bisect.bisect_left(seqs, start), bisect.bisect_left(seqs, end)
+                if hi > lo:
+                    entries.append((key, seqs[lo:hi]))
+            return entries
+
+        services, users = in_segment(self._service_index), in_segment(self._user_index)
+        lo, hi = bisect.bisect_left(self._time_seqs, start), bisect.bisect_left(self._time_seqs, end)
+        header = {"count": segment.count, "first_ts": segment.first_ts, "last_ts": segment.last_ts,
+                  "services": [[service, len(seqs)] for service, seqs in services],
+                  "users": [[username, len(seqs)] for username, seqs in users], "times": hi - lo}
+        tmp = segment.index_path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            for _, seqs in services + users:
+                seqs.tofile(f)
+            self._time_keys[lo:hi].tofile(f)
+            self._time_seqs[lo:hi].tofile(f)
+        os.replace(tmp, segment.index_path)
+
+    def _index_event(self, event: ActivityEvent) -> None:
+        if event.service:
+            self._service_index.setdefault(event.service, array("Q")).append(event.seq)
+        if event.username:
+            self._user_index.setdefault(event.username, array("Q")).append(event.seq)
+        if event.seq % TIME_INDEX_STRIDE == 0:
+            self._time_keys.append(event.timestamp)
+            self._time_seqs.append(event.seq)
+
+    # Writing
+
+    def append(self, kind: str, service: str = "", message: str = "", username: str = "",
+               timestamp: float = None) -> int:
+        """Record an event and return its seq; safe to call from any thread, never blocks on disk"""
+        with self._lock:
+            # Timestamps never go backwards, so the time index stays sorted
+            ts = max(timestamp or time.time(), self._last_ts)
+            event = ActivityEvent(self._next_seq, ts, kind, service, username, message)
+            self._next_seq += 1
+            self._last_ts = ts
+            self._unflushed.append(event)
+            self._index_event(event)
+            full = len(self._unflushed) >= BATCH_SIZE
+        if full:
+            self._wake.set()
+        for listener in list(self._listeners):
+            try:
+                listener()
+            except Exception:
+                log.exception("Activity journal listener failed")
+        return event.seq
+
+    def flush(self) -> int:
+        """Write and fsync all pending events. Returns the number written."""
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._unflushed)
+            if not batch:
+                return 0
+            rotated = False
+            try:
+                start = 0
+                while start < len(batch):
+                    segment = self._active_segment(batch[start].seq)
+                    room = SEGMENT_RECORDS - segment.count
+                    chunk = batch[start:start + room]
+                    os.write(self._write_fd, b"".join(_encode(event) for event in chunk))
+                    os.fsync(self._write_fd)
+                    with self._lock:
+                        if segment.count == 0:
+                            segment.first_ts = chunk[0].timestamp
+                        segment.count += len(chunk)
+                        segment.last_ts = chunk[-1].timestamp
+                        del self._unflushed[:len(chunk)]
+                        self._flushed_seq = chunk[-1].seq + 1
+                    if segment.count >= SEGMENT_RECORDS:
+                        self._seal(segment)
+                        rotated = True
+                    start += len(chunk)
+            except OSError as exc:
+                # Unwritten events stay queued for the next attempt
+                log.warning("Activity journal flush failed, will retry: %s", exc)
+            if rotated:
+                self._compact_locked()
+            return len(batch)
+
+    def _active_segment(self, seq: int) -> _Segment:
+        if self._write_fd is not None:
+            return self._segments[-1]
+        if self._segments and self._segments[-1].count < SEGMENT_RECORDS:
+            segment = self._segments[-1]
+        else:
+            path = os.path.join(self.directory, f"seg-{seq:012d}.log")
+            segment = _Segment(path, seq)
+            with self._lock:
+                self._segments.append(segment)
+                self._segment_starts.append(seq)
+        self._write_fd = os.open(segment.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | _O_BINARY, 0o600)
+        return segment
+
+    def _seal(self, segment: _Segment) -> None:
+        os.close(self._write_fd)
+        self._write_fd = None
+        with self._lock:
+            self._write_index(segment)
+
+    # Reading
+
+    @property
+    def start_seq(self) -> int:
+        """Oldest retained event"""
+        with self._lock:
+            return self._segments[0].first_seq if self._segments else self._flushed_seq
+
+    @property
+    def end_seq(self) -> int:
+        """One past the newest event"""
+        return self._next_seq
+
+    def count(self) -> int:
+        return self.end_seq - self.start_seq
+
+    def read(self, seq: int) -> Optional[ActivityEvent]:
+        events = self.read_range(seq, seq + 1)
+        return events[0] if events else None
+
+    def read_range(self, start: int, stop: int) -> List[ActivityEvent]:
+        """Events with start <= seq < stop, oldest first (missing or compacted ones are skipped)"""
+        events: List[ActivityEvent] = []
+        with self._lock:
+            start = max(start, self._segments[0].first_seq if self._segments else start)
+            disk_stop = min(stop, self._flushed_seq)
+            seq = start
+            while seq < disk_stop:
+                i = bisect.bisect_right(self._segment_starts, seq) - 1
+                if i < 0:
+                    break
+                segment = self._segments[i]
+                end = min(disk_stop, segment.end_seq)
+                if end <= seq:
+                    seq = self._segments[i + 1].first_seq if i + 1 < len(self._segments) else disk_stop
+                    continue
+                raw = self._read_at(self._read_fd(segment), (end - seq) * RECORD_SIZE,
+                                    (seq - segment.first_seq) * RECORD_SIZE)
+                for offset in range(0, len(raw) - RECORD_SIZE + 1, RECORD_SIZE):
+                    event = _decode(raw[offset:offset + RECORD_SIZE])
+                    if event is not None:
+                        events.append(event)
+                seq = end
+            if stop > self._flushed_seq and self._unflushed:
+                first = self._unflushed[0].seq
+                events.extend(self._unflushed[max(0, start - first):max(0, stop - first)])
+        return events
+
+    @staticmethod
+    def _read_at(fd: int, size: int, offset: int) -> bytes:
+        # lseek + read rather than os.pread, which Windows lacks; callers hold
+        # self._lock, so the shared descriptor's position is not raced
+        os.lseek(fd, offset, os.SEEK_SET)
+        chunks = []
+        while size > 0:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def _read_fd(self, segment: _Segment) -> int:
+        fd = self._read_fds.pop(segment.path, None)
+        if fd is None:
+            fd = os.open(segment.path, os.O_RDONLY | _O_BINARY)
+            if len(self._read_fds) >= MAX_OPEN_SEGMENTS:
+                os.close(self._read_fds.popitem(last=False)[1])
+        self._read_fds[segment.path] = fd
+        return fd
+
+    def service_seqs(self, service: str, start: int = 0) -> array:
+        """Seqs (>= start) of the retained events for one service, oldest first (a copy)"""
+        with self._lock:
+            seqs = self._service_index.get(service, array("Q"))
+            return seqs[bisect.bisect_left(seqs, start):]
+
+    def user_seqs(self, username: str, start: int = 0) -> array:
+        """Seqs (>= start) of the retained events recorded for one user, oldest first (a copy)"""
+        with self._lock:
+            seqs = self._user_index.get(username, array("Q"))
+            return seqs[bisect.bisect_left(seqs, start):]
+
+    def services(self) -> List[str]:
+        with self._lock:
+            return sorted(service for service, seqs in self._service_index.items() if seqs)
+
+    def seek_time(self, timestamp: float) -> int:
+        """Seq of the first event at or after timestamp (end_seq if there is none)"""
+        with self._lock:
+            i = bisect.bisect_right(self._time_keys, timestamp) - 1
+            seq = self._time_seqs[i] if i >= 0 else (self._segments[0].first_seq if self._segments else 0)
+        while True:
+            events = self.read_range(seq, seq + TIME_INDEX_STRIDE)
+            for event in events:
+                if event.timestamp >= timestamp:
+                    return event.seq
+            if not events or seq + TIME_INDEX_STRIDE >= self.end_seq:
+                return self.end_seq
+            seq += TIME_INDEX_STRIDE
+
+    # Listeners
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Called (on the appending thread) after every append"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    # Retention
+
+    def compact(self, now: float = None) -> int:
+        """Delete sealed segments past the retention policy. Returns the number removed."""
+        with self._flush_lock:
+            return self._compact_locked(now)
+
+    def _compact_locked(self, now: float = None) -> int:
+        now = now or time.time()
+        self._last_compact = now
+        cutoff = now - self.retention_days * 86400 if self.retention_days > 0 else None
+        with self._lock:
+            sealed = self._segments[:-1]
+            drop = 0
+            for segment in sealed:
+                over_limit = self.max_segments and len(self._segments) - drop > self.max_segments
+                expired = cutoff is not None and segment.last_ts < cutoff
+                if not (over_limit or expired):
+                    break
+                drop += 1
+            if not drop:
+                return 0
+            removed, self._segments = self._segments[:drop], self._segments[drop:]
+            self._segment_starts = self._segment_starts[drop:]
+            new_start = self._segments[0].first_seq
+            for index in (self._service_index, self._user_index):
+                for key in list(index):
+                    seqs = index[key]
+                    del seqs[:bisect.bisect_left(seqs, new_start)]
+                    if not seqs:
+                        del index[key]
+            cut = bisect.bisect_left(self._time_seqs, new_start)
+            del self._time_keys[:cut]
+            del self._time_seqs[:cut]
+            for segment in removed:
+                fd = self._read_fds.pop(segment.path, None)
+                if fd is not None:
+                    os.close(fd)
+        for segment in removed:
+            for path in (segment.path, segment.index_path):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+        log.info("Compacted activity journal: removed %d segments, oldest event is now #%d",
+                 len(removed), new_start)
+        return len(removed)
+
+    # Background writer
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="ActivityJournal", daemon=True)
+        self._thread.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the writer thread, write whatever is still pending and release files"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+        with self._flush_lock, self._lock:
+            if self._write_fd is not None:
+                os.close(self._write_fd)
+                self._write_fd = None
+            for fd in self._read_fds.values():
+                os.close(fd)
+            self._read_fds.clear()
+
+    def _loop(self) -> None:
+        self.compact()
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            self.flush()
+            if time.time() - self._last_compact >= COMPACT_INTERVAL:
+                self.compact()
+
+
+_journal: Optional[ActivityJournal] = None
+_journal_lock = threading.Lock()
+
+
+def get_activity_journal() -> ActivityJournal:
+    """Return the process-wide journal, opening it and starting its writer on first use"""
+    global _journal
+    if _journal is None:
+        with _journal_lock:
+            if _journal is None:
+                journal = ActivityJournal()
+                journal.start()
+                _journal = journal
+    return _journal
+
+
+def record_activity(kind: str, service: str = "", message: str = "", username: str = "") -> None:
+    """Append to the process-wide journal; never raises into the caller"""
+    try:
+        get_activity_journal().append(kind, service, message, username)
+    except Exception:
+        log.exception("Failed to record %s activity", kind)
+
+
+def close_activity_journal() -> None:
+    """Flush and close the process-wide journal if it was opened"""
+    global _journal
+    with _journal_lock:
+        journal, _journal = _journal, None
+    if journal is not None:
+        journal.close()
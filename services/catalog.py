@@ -0,0 +1,59 @@
+"""
+Service metadata registry.
+
+Describes every integration the dashboard can monitor: display name, icon
+asset, fallback emoji, category and a short description used for search.
+Connector implementations live in ServiceManager; a service can appear in
+the catalog before it has one (connect then uses a placeholder).
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional
+
+
+class ServiceInfo:
+    def __init__(self, name: str, icon: str = None, fallback_icon: str = "🔌",
+                 category: str = "Other", description: str = "", display_name: str = None):
+        self.name = name
+        self.display_name = display_name or name
+        self.icon = icon                  # asset key, see ui.assets
+        self.fallback_icon = fallback_icon
+        self.category = category
+        self.description = description
+
+    def search_text(self) -> str:
+        return f"{self.name} {self.display_name} {self.category} {self.description}".lower()
+
+
+_registry: Dict[str, ServiceInfo] = {}
+_lock = threading.Lock()
+
+
+def register_service_info(info: ServiceInfo) -> None:
+    """Register or replace the metadata for a service"""
+    with _lock:
+        _registry[info.name] = info
+
+
+def get_service_info(name: str) -> Optional[ServiceInfo]:
+    return _registry.get(name)
+
+
+def catalog(names: Iterable[str] = ()) -> List[ServiceInfo]:
+    """All registered services plus any extra names (e.g. from ServiceManager), in registration order"""
+    with _lock:
+        entries = list(_registry.values())
+    known = {info.name for info in entries}
+    entries.extend(ServiceInfo(name) for name in names if name not in known)
+    return entries
+
+
+for _info in (
+    ServiceInfo("Zoom", "ui/assests/zoom.webp", "🎥", "Meetings", "Video meetings and webinars"),
+    ServiceInfo("Gmail", "ui/assests/gmail.webp", "📧", "Email", "Google mail"),
+    ServiceInfo("GMeet", "ui/assests/gmeet.webp", "👥", "Meetings", "Google Meet video calls"),
+    ServiceInfo("Spotify", "ui/assests/spotify.webp", "🎵", "Media", "Music streaming"),
+    ServiceInfo("YouTube", "ui/assests/youtube.webp", "📺", "Media", "Video streaming"),
+    ServiceInfo("Discord", "ui/assests/discord.webp", "💬", "Chat", "Voice and text chat"),
+):
+    register_service_info(_info)
@@ -0,0 +1,363 @@
+"""
+Out-of-process connector worker.
+
+With SENTINEL_CONNECTOR_MODE=process the service manager hosts its
+services in a child process instead of threads of the GUI process, so
+token encryption, JSON and the Google auth transport never hold the GUI
+process's GIL. The child is started with `python -m
+services.connector_worker <factory>` and imports only the services; it
+builds them from the same factory as thread mode (SENTINEL_CONNECTOR_FACTORY).
+
+Requests and results are pickled frames (4-byte length + payload) on the
+child's stdin and stdout. Each request carries an id, so calls are
+multiplexed: the child runs them on its own thread pool and answers in
+completion order, and a slow OAuth connect does not hold up health checks.
+
+The child runs in the parent's working directory, so relative paths
+(credentials.json, token.json) resolve to the same files in both modes.
+There is one worker per application process (get_connector_worker()),
+started by the first call, whatever the number of service managers.
+
+ConnectorWorker is the parent-side supervisor:
+
+- call() returns a concurrent.futures.Future, like the thread pool did
+- at most MAX_IN_FLIGHT requests are sent at once; up to MAX_QUEUED more
+  wait in the parent, and anything beyond that fails at once with
+  ConnectorBusy instead of piling up behind a stuck worker
+- if the child exits, its in-flight calls fail with ConnectorCrashed and
+  it is restarted with backoff (queued calls are sent to the new child);
+  after MAX_RESTARTS within RESTART_WINDOW seconds it is given up on
+"""
+
+import importlib
+import itertools
+import logging
+import os
+import pickle
+import struct
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, BinaryIO, Callable, Deque, Dict, Optional, Tuple
+
+from config.app_paths import PROJECT_ROOT
+from config.logging_config import LoggingConfig
+from diagnostics import tracing
+
+log = logging.getLogger(__name__)
+
+# "module:callable" returning {name: zero-argument service constructor}
+SERVICE_FACTORY = os.getenv('SENTINEL_CONNECTOR_FACTORY', 'services.service_manager:default_services')
+WORKER_THREADS = int(os.getenv('SENTINEL_CONNECTOR_THREADS', '4'))
+MAX_IN_FLIGHT = int(os.getenv('SENTINEL_CONNECTOR_MAX_IN_FLIGHT', '32'))
+MAX_QUEUED = int(os.getenv('SENTINEL_CONNECTOR_MAX_QUEUED', '256'))
+MAX_RESTARTS = int(os.getenv('SENTINEL_CONNECTOR_MAX_RESTARTS', '5'))
+RESTART_WINDOW = 300.0
+RESTART_BACKOFF_MAX = 10.0
+
+# Only these service methods can be called in the worker
+METHODS = ("connect", "disconnect", "health")
+
+_HEADER = struct.Struct(">I")
+
+
+class ConnectorError(RuntimeError):
+    pass
+
+
+class ConnectorBusy(ConnectorError):
+    """Too many calls are waiting for the worker"""
+
+
+class ConnectorCrashed(ConnectorError):
+    """The worker exited before answering"""
+
+
+def load_factory(spec: str) -> Callable[[], Dict[str, Callable[[], Any]]]:
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def _write_frame(stream: BinaryIO, message: Tuple) -> None:
+    payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    stream.write(_HEADER.pack(len(payload)) + payload)
+    stream.flush()
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> Optional[bytes]:
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def _read_frame(stream: BinaryIO) -> Optional[Tuple]:
+    """Next message, or None at end of stream"""
+    header = _read_exactly(stream, _HEADER.size)
+    if header is None:
+        return None
+    payload = _read_exactly(stream, _HEADER.unpack(header)[0])
+    return None if payload is None else pickle.loads(payload)
+
+
+class ConnectorWorker:
+    """Parent-side handle of the connector process; see the module docstring"""
+
+    def __init__(self, factory: str = SERVICE_FACTORY):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._ids = itertools.count(1)
+        # request id -> (future, service, method, sent at); sent and awaiting a result
+        self._in_flight: Dict[int, Tuple[Future, str, str, float]] = {}
+        # (request id, future, service, method) waiting for an in-flight slot or a restarted worker
+        self._queued: Deque[Tuple[int, Future, str, str]] = deque()
+        self._restarts: Deque[float] = deque()
+        self._closed = False
+        self._failed: Optional[str] = None
+        self._start()
+
+    def call(self, service: str, method: str) -> Future:
+        """Run service.method() in the worker; the future resolves to its result.
+
+        Raises RuntimeError after stop(), like a shut-down executor.
+        """
+        future: Future = Future()
+        error = None
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Connector worker has been stopped")
+            if self._failed:
+                error = ConnectorError(self._failed)
+            elif self._process is not None and not self._queued and len(self._in_flight) < MAX_IN_FLIGHT:
+                self._send_locked(next(self._ids), future, service, method)
+            elif len(self._queued) < MAX_QUEUED:
+                self._queued.append((next(self._ids), future, service, method))
+            else:
+                error = ConnectorBusy(f"{len(self._queued)} connector calls already waiting")
+        # Outside the lock: done callbacks may call back into call()
+        if error is not None:
+            future.set_exception(error)
+        return future
+
+    def stop(self) -> None:
+        """Stop accepting calls and let the worker exit; calls still running fail"""
+        with self._lock:
+            self._closed = True
+            process = self._process
+        if process is not None:
+            try:
+                _write_frame(process.stdin, ("stop",))
+                process.stdin.close()
+            except OSError:
+                pass
+
+    # Process management
+
+    def _start(self) -> None:
+        env = dict(os.environ)
+        # Importable from any working directory
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+        # One writer per log file; the worker logs next to the application log
+        if LoggingConfig.LOG_FILE:
+            env["SENTINEL_LOG_FILE"] = os.path.join(os.path.dirname(LoggingConfig.LOG_FILE), "connector-worker.log")
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                process = subprocess.Popen(
+                    [sys.executable, "-m", "services.connector_worker", self._factory],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env,
+                )
+            except OSError as exc:
+                log.error("Could not start connector worker: %s", exc)
+                self._failed = f"Connector worker could not be started: {exc}"
+                stranded = self._take_queued_locked()
+                process = None
+            else:
+                self._process = process
+                self._drain_locked()
+        if process is None:
+            self._fail_all(stranded, ConnectorError(self._failed))
+            return
+        log.info("Connector worker started (pid %s)", process.pid)
+        threading.Thread(target=self._read_results, args=(process,), name="ConnectorWorkerReader",
+                         daemon=True).start()
+
+    def _send_locked(self, request_id: int, future: Future, service: str, method: str) -> None:
+        self._in_flight[request_id] = (future, service, method, time.perf_counter())
+        try:
+            _write_frame(self._process.stdin, ("call", request_id, service, method))
+        except OSError:
+            # The worker is gone; the reader sees it exit and fails this call
+            pass
+
+    def _drain_locked(self) -> None:
+        while self._queued and len(self._in_flight) < MAX_IN_FLIGHT:
+            self._send_locked(*self._queued.popleft())
+
+    def _take_queued_locked(self):
+        queued = [future for _id, future, _service, _method in self._queued]
+        self._queued.clear()
+        return queued
+
+    def _read_results(self, process: subprocess.Popen) -> None:
+        try:
+            while True:
+                message = _read_frame(process.stdout)
+                if message is None:
+                    break
+                _kind, request_id, ok, value = message
+                with self._lock:
+                    entry = self._in_flight.pop(request_id, None)
+                    if process is self._process:
+                        self._drain_locked()
+                if entry is None:
+                    continue
+                future, service, method, sent_at = entry
+                tracing.record_complete(f"connector.{method}", time.perf_counter() - sent_at, "worker",
+                                        service=service)
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(ConnectorError(value))
+        except Exception:
+            log.exception("Connector worker protocol error")
+            process.kill()
+        self._on_exit(process)
+
+    def _on_exit(self, process: subprocess.Popen) -> None:
+        code = process.wait()
+        restart_in = None
+        with self._lock:
+            if process is not self._process:
+                return
+            self._process = None
+            crashed = [future for future, _service, _method, _sent in self._in_flight.values()]
+            self._in_flight.clear()
+            stranded = []
+            if self._closed:
+                stranded = self._take_queued_locked()
+            else:
+                now = time.monotonic()
+                while self._restarts and now - self._restarts[0] > RESTART_WINDOW:
+                    self._restarts.popleft()
+                if len(self._restarts) >= MAX_RESTARTS:
+                    self._failed = f"Connector worker keeps exiting (last exit code {code}); not restarting"
+                    stranded = self._take_queued_locked()
+                else:
+                    self._restarts.append(now)
+                    restart_in = min(0.5 * 2 ** (len(self._restarts) - 1), RESTART_BACKOFF_MAX)
+
+        if self._closed:
+            log.info("Connector worker exited")
+        elif restart_in is not None:
+            log.warning("Connector worker exited with code %s; restarting in %.1f s", code, restart_in)
+        else:
+            log.error(self._failed)
+        self._fail_all(crashed, ConnectorCrashed(f"Connector worker exited with code {code}"))
+        self._fail_all(stranded, ConnectorError(self._failed or "Connector worker has been stopped"))
+        if restart_in is not None:
+            timer = threading.Timer(restart_in, self._start)
+            timer.daemon = True
+            timer.start()
+
+    @staticmethod
+    def _fail_all(futures, error: Exception) -> None:
+        for future in futures:
+            future.set_exception(error)
+
+
+_worker: Optional[ConnectorWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_connector_worker() -> ConnectorWorker:
+    """Return the process-wide connector worker, starting its process on first use"""
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = ConnectorWorker()
+    return _worker
+
+
+def stop_connector_worker() -> None:
+    """Stop the process-wide connector worker if it was started"""
+    global _worker
+    with _worker_lock:
+        worker, _worker = _worker, None
+    if worker is not None:
+        worker.stop()
+
+
+class RemoteService:
+    """Blocking stand-in for a service hosted in the worker, for code that holds service objects"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def connect(self) -> Tuple[bool, str]:
+        return get_connector_worker().call(self.name, "connect").result()
+
+    def disconnect(self) -> Tuple[bool, str]:
+        return get_connector_worker().call(self.name, "disconnect").result()
+
+    def health(self) -> Tuple[bool, str]:
+        return get_connector_worker().call(self.name, "health").result()
+
+
+# Worker process
+
+def _worker_main(factory: str) -> None:
+    # Frames go to a private copy of stdout; anything services print goes to stderr
+    out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    from config.logging_config import setup_logging, shutdown_logging
+    setup_logging()
+    services = {name: make() for name, make in load_factory(factory)().items()}
+    log.info("Connector worker ready with %s", ", ".join(services) or "no services")
+
+    send_lock = threading.Lock()
+
+    def send(message: Tuple) -> None:
+        with send_lock:
+            _write_frame(out, message)
+
+    def run(request_id: int, service: str, method: str) -> None:
+        try:
+            if method not in METHODS or service not in services:
+                raise LookupError(f"Unknown call {service}.{method}")
+            value = getattr(services[service], method)()
+            pickle.dumps(value)     # fail here, not in send(), if the result cannot be sent
+            message = ("result", request_id, True, value)
+        except Exception as exc:
+            message = ("result", request_id, False, f"{type(exc).__name__}: {exc}")
+        try:
+            send(message)
+        except OSError:
+            pass    # the parent is gone
+
+    pool = ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix="connector")
+    stdin = sys.stdin.buffer
+    while True:
+        message = _read_frame(stdin)
+        if message is None or message[0] == "stop":
+            break
+        _kind, request_id, service, method = message
+        pool.submit(run, request_id, service, method)
+    # Do not wait for calls still running (e.g. an OAuth flow waiting for the browser)
+    shutdown_logging()
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    _worker_main(sys.argv[1] if len(sys.argv) > 1 else SERVICE_FACTORY)
@@ -0,0 +1,65 @@
+"""
+Last-known dashboard state per user.
+
+A small JSON file in DATA_DIR/snapshots holding the services that were
+connected and the statistics windows. The dashboard renders from it as
+soon as a user is bound (marked stale) and revalidates each entry in the
+background. Recent activity is not included: the activity journal is
+already persistent and opens in milliseconds.
+"""
+
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, Dict, Optional
+
+from config.app_paths import AppPaths
+
+log = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+# Older snapshots are ignored rather than shown as stale
+MAX_AGE = float(os.getenv('SENTINEL_SNAPSHOT_MAX_AGE', str(7 * 86400)))
+
+# path -> state last written, so periodic saves skip unchanged state
+_last_saved: Dict[str, str] = {}
+
+
+def snapshot_path(username: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", username.lower())
+    return AppPaths.data_path("snapshots", f"dashboard-{safe}.json")
+
+
+def save_snapshot(username: str, state: Dict[str, Any]) -> bool:
+    """Write the snapshot atomically; returns False if it is unchanged or could not be written"""
+    path = snapshot_path(username)
+    content = json.dumps(state, separators=(",", ":"), sort_keys=True)
+    if _last_saved.get(path) == content:
+        return False
+    try:
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(f'{{"version":{SNAPSHOT_VERSION},"saved_at":{time.time()},"state":{content}}}')
+        os.replace(path + ".tmp", path)
+    except OSError as exc:
+        log.warning("Could not save dashboard snapshot for %s: %s", username, exc)
+        return False
+    _last_saved[path] = content
+    return True
+
+
+def load_snapshot(username: str) -> Optional[Dict[str, Any]]:
+    """The saved state, or None if there is none or it is unreadable, from another version, or too old"""
+    try:
+        with open(snapshot_path(username), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+        return None
+    age = time.time() - data.get("saved_at", 0)
+    if age > MAX_AGE:
+        log.debug("Ignoring dashboard snapshot for %s (%.0f s old)", username, age)
+        return None
+    return data.get("state")
@@ -0,0 +1,209 @@
+"""
+Background health checks for connected services.
+
+Each watched service is probed with Service.health() through the service
+manager, so checks share the worker budget with connect and disconnect
+calls. The interval adapts per service: it doubles after every
+healthy probe (MIN_INTERVAL up to MAX_INTERVAL) and drops to
+FAILURE_INTERVAL after a failure, backing off again while failures
+continue. The last result and probe latency are cached; listeners are
+only called when a service's health changes.
+"""
+
+import heapq
+import logging
+import os
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+MIN_INTERVAL = float(os.getenv('SENTINEL_HEALTH_MIN_INTERVAL', '30'))
+MAX_INTERVAL = float(os.getenv('SENTINEL_HEALTH_MAX_INTERVAL', '600'))
+FAILURE_INTERVAL = float(os.getenv('SENTINEL_HEALTH_FAILURE_INTERVAL', '5'))
+# Spread probes so services watched together do not stay in lockstep
+JITTER = 0.1
+
+
+class HealthState:
+    def __init__(self):
+        self.healthy: Optional[bool] = None     # None until the first probe
+        self.message = ""
+        self.latency_ms: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.interval = MIN_INTERVAL
+        self.failures = 0
+
+    def copy(self) -> "HealthState":
+        state = HealthState()
+        state.__dict__.update(self.__dict__)
+        return state
+
+
+class HealthMonitor:
+    """Polls watched services on an adaptive schedule and reports health changes"""
+
+    def __init__(self, service_manager, min_interval: float = None, max_interval: float = None,
+                 failure_interval: float = None):
+        self._manager = service_manager
+        self.min_interval = min_interval or MIN_INTERVAL
+        self.max_interval = max_interval or MAX_INTERVAL
+        self.failure_interval = failure_interval or FAILURE_INTERVAL
+
+        self._cond = threading.Condition()
+        self._states: Dict[str, HealthState] = {}
+        self._generation: Dict[str, int] = {}       # bumped on watch/unwatch; stale results are dropped
+        self._in_flight: Dict[str, int] = {}
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._listeners: List[Callable[[str, HealthState], None]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    # Watching
+
+    def watch(self, name: str) -> None:
+        """Start polling a service (first probe after min_interval); safe from any thread"""
+        service = self._manager.get_service(name)
+        if service is None or not hasattr(service, "health"):
+            return
+        with self._cond:
+            if self._stopped:
+                return
+            generation = self._generation.get(name, 0) + 1
+            self._generation[name] = generation
+            state = HealthState()
+            state.interval = self.min_interval
+            self._states[name] = state
+            heapq.heappush(self._schedule, (time.monotonic() + self._jittered(state.interval), generation, name))
+            self._cond.notify()
+        self._ensure_thread()
+
+    def unwatch(self, name: str) -> None:
+        with self._cond:
+            if name in self._generation:
+                self._generation[name] += 1
+            self._states.pop(name, None)
+
+    def status(self, name: str) -> Optional[HealthState]:
+        """Last known health of a watched service (a copy), or None"""
+        with self._cond:
+            state = self._states.get(name)
+            return state.copy() if state else None
+
+    def add_listener(self, listener: Callable[[str, HealthState], None]) -> None:
+        """Called on a worker thread whenever a service turns healthy or unhealthy"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, HealthState], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._schedule.clear()
+            self._cond.notify()
+
+    # Scheduling
+
+    def _jittered(self, interval: float) -> float:
+        return interval * random.uniform(1 - JITTER, 1 + JITTER)
+
+    def _ensure_thread(self) -> None:
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name="HealthMonitor", daemon=True)
+                self._thread.start()
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                due = self._next_due()
+            if due is None:
+                return
+            # Outside the lock: call() may start the connector worker, and a
+            # future that is already done runs _on_result inline
+            self._submit(*due)
+
+    def _next_due(self) -> Optional[Tuple[str, int]]:
+        """Wait for the next due probe and mark it in flight; None once stopped (caller holds _cond)"""
+        while not self._stopped:
+            if not self._schedule:
+                self._cond.wait()
+                continue
+            due, generation, name = self._schedule[0]
+            delay = due - time.monotonic()
+            if delay > 0:
+                self._cond.wait(delay)
+                continue
+            heapq.heappop(self._schedule)
+            # Unwatched or re-watched since this entry was scheduled, or still probing
+            if self._generation.get(name) != generation or self._in_flight.get(name) == generation:
+                continue
+            self._in_flight[name] = generation
+            return name, generation
+        return None
+
+    def _submit(self, name: str, generation: int) -> None:
+        started = time.perf_counter()
+        try:
+            # On the manager's pool, or in the connector worker process
+            future = self._manager.call(name, "health")
+        except RuntimeError:
+            # Executor already shut down
+            with self._cond:
+                self._in_flight.pop(name, None)
+            return
+        except Exception:
+            log.exception("Could not submit health check for %s", name)
+            with self._cond:
+                if self._in_flight.get(name) == generation:
+                    del self._in_flight[name]
+                state = self._states.get(name)
+                if not self._stopped and state is not None and self._generation.get(name) == generation:
+                    heapq.heappush(self._schedule,
+                                   (time.monotonic() + self._jittered(state.interval), generation, name))
+                    self._cond.notify()
+            return
+        future.add_done_callback(lambda fut: self._on_result(name, generation, fut, started))
+
+    def _on_result(self, name: str, generation: int, future, started: float) -> None:
+        latency_ms = (time.perf_counter() - started) * 1000
+        try:
+            healthy, message = future.result()
+        except Exception as exc:
+            healthy, message, latency_ms = False, f"Health check failed: {exc}", None
+
+        with self._cond:
+            if self._in_flight.get(name) == generation:
+                del self._in_flight[name]
+            state = self._states.get(name)
+            if self._stopped or state is None or self._generation.get(name) != generation:
+                return
+            previous = state.healthy
+            changed = previous != healthy
+            state.healthy, state.message = healthy, message
+            state.latency_ms, state.checked_at = latency_ms, time.time()
+            if healthy:
+                state.failures = 0
+                # Stretch: first healthy probe after a failure starts over at min_interval
+                state.interval = self.min_interval if previous is False else min(state.interval * 2, self.max_interval)
+            else:
+                state.failures += 1
+                # Tighten: re-check soon, backing off while the failure persists
+                state.interval = min(self.failure_interval * 2 ** (state.failures - 1), self.min_interval)
+            heapq.heappush(self._schedule, (time.monotonic() + self._jittered(state.interval), generation, name))
+            self._cond.notify()
+            snapshot = state.copy()
+
+        log.debug("Health %s: %s (%s) in %s ms, next check in %.0f s",
+                  name, "ok" if healthy else "failing", message, latency_ms, snapshot.interval)
+        # A healthy first probe confirms what connect already reported; nothing to push
+        if changed and not (previous is None and healthy):
+            for listener in list(self._listeners):
+                try:
+                    listener(name, snapshot)
+                except Exception:
+                    log.exception("Health listener failed for %s", name)
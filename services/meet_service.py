@@ -4,18 +4,36 @@ import os
 import traceback
 import logging
 import json
+import threading
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
 from services.token_store import TokenStore
+from diagnostics.tracing import span, traced
 
 log = logging.getLogger(__name__)
 
 # If modifying these scopes, delete the file token.json.
 SCOPES = ['https://www.googleapis.com/auth/meetings.space.created']
 
+# Answers 400 for an access token that is expired or has been revoked
+TOKENINFO_URL = 'https://oauth2.googleapis.com/tokeninfo'
+HEALTH_TIMEOUT = 5
+
+_auth_request = None
+_auth_request_lock = threading.Lock()
+
+
+def get_auth_request() -> Request:
+    """Shared google-auth transport, so token refreshes reuse one HTTPS session and its connections"""
+    global _auth_request
+    with _auth_request_lock:
+        if _auth_request is None:
+            _auth_request = Request()
+        return _auth_request
+
 
 class MeetService:
     """Service wrapper for Google Meet auth/token flow.
@@ -31,6 +49,7 @@ class MeetService:
         # token storage helper
         self._token_store = TokenStore()
 
+    @traced("MeetService.connect", "services")
     def connect(self):
         """Run the OAuth flow or refresh tokens. Returns (success: bool, message: str)."""
         try:
@@ -42,13 +61,15 @@ class MeetService:
             log.debug("MeetService.connect: credentials_path=%s token_path=%s", creds_path, token_path)
 
             if os.path.exists(token_path):
-                creds = Credentials.from_authorized_user_file(token_path, self.scopes)
+                with span("google.load_token_file", "services"):
+                    creds = Credentials.from_authorized_user_file(token_path, self.scopes)
 
             if not creds or not creds.valid:
                 # try refresh
                 if creds and creds.expired and creds.refresh_token:
                     try:
-                        creds.refresh(Request())
+                        with span("google.oauth.refresh", "services"):
+                            creds.refresh(get_auth_request())
                         with open(token_path, 'w') as token:
                             token.write(creds.to_json())
                         # save token to DB
@@ -69,9 +90,10 @@ class MeetService:
                     return False, msg
 
                 try:
-                    flow = InstalledAppFlow.from_client_secrets_file(creds_path, self.scopes)
-                    # explicit open_browser=True, port defaults to 0 (random free port)
-                    creds = flow.run_local_server(port=0, open_browser=True)
+                    with span("google.oauth.flow", "services"):
+                        flow = InstalledAppFlow.from_client_secrets_file(creds_path, self.scopes)
+                        # explicit open_browser=True, port defaults to 0 (random free port)
+                        creds = flow.run_local_server(port=0, open_browser=True)
                     with open(token_path, 'w') as token:
                         token.write(creds.to_json())
                     # save token to DB
@@ -98,4 +120,33 @@ class MeetService:
         except Exception as exc:
             tb = traceback.format_exc()
             log.exception("Unexpected MeetService error: %s", exc)
-            return False, f"Meet auth failed: {exc}\n{tb}"
\ No newline at end of file
+            return False, f"Meet auth failed: {exc}\n{tb}"
+
+    @traced("MeetService.health", "services")
+    def health(self):
+        """Check that the stored token is still accepted by Google. Returns (healthy: bool, message: str)."""
+        token_path = os.path.abspath(self.token_path)
+        if not os.path.exists(token_path):
+            return False, "Not authorized (token.json missing)."
+        try:
+            creds = Credentials.from_authorized_user_file(token_path, self.scopes)
+            if not creds.valid:
+                if not (creds.expired and creds.refresh_token):
+                    return False, "Token expired and cannot be refreshed."
+                # Fails with invalid_grant once access has been revoked
+                with span("google.oauth.refresh", "services"):
+                    creds.refresh(get_auth_request())
+                with open(token_path, 'w') as token:
+                    token.write(creds.to_json())
+
+            # A revoked access token still looks valid locally until it expires
+            with span("google.oauth.tokeninfo", "services"):
+                response = get_auth_request().session.get(
+                    TOKENINFO_URL, params={"access_token": creds.token}, timeout=HEALTH_TIMEOUT
+                )
+            if response.status_code != 200:
+                return False, "Token rejected by Google (revoked or expired)."
+            return True, "Token valid."
+        except Exception as exc:
+            log.debug("MeetService.health failed: %s", exc)
+            return False, f"Health check failed: {exc}"
@@ -1,16 +1,24 @@
 import logging
+import os
 import time
 from concurrent.futures import ThreadPoolExecutor, Future
-from typing import Dict, Tuple, Callable
+from typing import Dict, Tuple, Callable, Optional
 
+from .connector_worker import RemoteService, SERVICE_FACTORY, get_connector_worker, load_factory
+from .health_monitor import HealthMonitor
 from .meet_service import MeetService
+from diagnostics import tracing, profiler
 
 log = logging.getLogger(__name__)
 
+# "thread" runs services on a pool in this process; "process" hosts them in a
+# supervised connector worker process (services.connector_worker)
+CONNECTOR_MODE = os.getenv('SENTINEL_CONNECTOR_MODE', 'thread').lower()
+
 class Service:
     """Base service - implement real connect/disconnect logic per service.
 
-    connect() / disconnect() must return (bool, message).
+    connect() / disconnect() / health() must return (bool, message).
     """
 
     def connect(self) -> Tuple[bool, str]:
@@ -22,37 +30,69 @@ class Service:
         time.sleep(0.5)
         return True, "Disconnected (default service)"
 
+    def health(self) -> Tuple[bool, str]:
+        """Cheap probe that the connection still works; must return (bool, message)"""
+        return True, "OK (default service)"
+
+
+def default_services() -> Dict[str, Callable[[], Service]]:
+    """Service constructors by name; the default SENTINEL_CONNECTOR_FACTORY"""
+    return {
+        "GMeet": MeetService,
+        # register other services here as they are implemented
+    }
+
+
 class ServiceManager:
-    """Run service connect/disconnect logic in background threads."""
+    """Run service connect/disconnect logic in background threads or a connector worker process."""
 
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, mode: Optional[str] = None):
+        # Local services, health checks and submit() run here
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
-        # register default implementations here
-        self._services: Dict[str, Service] = {
-            "GMeet": MeetService(),
-            # register other services here as they are implemented
-        }
+        factories = load_factory(SERVICE_FACTORY)()
+        if (mode or CONNECTOR_MODE) == "process":
+            # Hosted by the shared worker process, which the first call starts
+            self._services: Dict[str, Service] = {name: RemoteService(name) for name in factories}
+        else:
+            self._services = {name: make() for name, make in factories.items()}
+        # Polls connected services; see watch()/unwatch()
+        self.health_monitor = HealthMonitor(self)
 
     def register_service(self, name: str, service: Service) -> None:
-        """Register or replace a service implementation."""
+        """Register or replace a service implementation (always run in this process)."""
         self._services[name] = service
 
-    def connect(self, service_name: str) -> Future:
+    def call(self, service_name: str, method: str) -> Future:
+        """Run connect/disconnect/health of a service in the background; resolves to (bool, message)"""
         svc = self._services.get(service_name)
         if not svc:
             fut = Future()
             fut.set_exception(RuntimeError(f"Unknown service: {service_name}"))
             return fut
-        # svc.connect must return (bool, message)
-        return self._executor.submit(svc.connect)
+        if isinstance(svc, RemoteService):
+            return get_connector_worker().call(service_name, method)
+        fn = getattr(svc, method)
+        if method == "connect":
+            fn = profiler.wrap_action(f"connect.{service_name}", fn)
+        return self._executor.submit(tracing.wrap(fn))
+
+    def connect(self, service_name: str) -> Future:
+        return self.call(service_name, "connect")
 
     def disconnect(self, service_name: str) -> Future:
-        svc = self._services.get(service_name)
-        if not svc:
-            fut = Future()
-            fut.set_exception(RuntimeError(f"Unknown service: {service_name}"))
-            return fut
-        return self._executor.submit(svc.disconnect)
+        return self.call(service_name, "disconnect")
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Run fn on the service worker pool (trace context is carried over)"""
+        return self._executor.submit(tracing.wrap(fn), *args)
+
+    def get_service(self, name: str):
+        return self._services.get(name)
 
     def list_services(self):
-        return list(self._services.keys())
\ No newline at end of file
+        return list(self._services.keys())
+
+    def shutdown(self) -> None:
+        """Stop accepting work; running connect/disconnect calls finish in the background."""
+        self.health_monitor.stop()
+        self._executor.shutdown(wait=False)
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+Incremental dashboard statistics.
+
+Every event updates a few counters in O(1); nothing rescans the activity
+journal or the service list. Rates and means are taken over rolling time
+windows made of fixed buckets: a bucket that falls out of the window is
+cleared when time reaches it again, so totals are maintained incrementally
+and reading a statistic costs as much as one update.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Set
+
+
+class RollingWindow:
+    """Count and sum of values over the last window_seconds, in buckets of window/buckets seconds"""
+
+    def __init__(self, window_seconds: float, buckets: int = 60):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = window_seconds / buckets
+        self._counts = [0] * buckets
+        self._sums = [0.0] * buckets
+        self._count = 0
+        self._sum = 0.0
+        self._current: Optional[int] = None    # bucket number of the newest slot
+
+    def _advance(self, now: float) -> int:
+        bucket = int(now // self.bucket_seconds)
+        if self._current is None:
+            self._current = bucket
+        elif bucket > self._current:
+            # Clear the slots skipped since the last event; at most one full pass
+            size = len(self._counts)
+            for stale in range(self._current + 1, min(bucket, self._current + size) + 1):
+                slot = stale % size
+                self._count -= self._counts[slot]
+                self._sum -= self._sums[slot]
+                self._counts[slot] = 0
+                self._sums[slot] = 0.0
+            self._current = bucket
+        return bucket
+
+    def add(self, value: float = 0.0, now: float = None) -> None:
+        now = time.time() if now is None else now
+        bucket = self._advance(now)
+        if bucket < self._current - len(self._counts) + 1:
+            return    # older than the window
+        slot = bucket % len(self._counts)
+        self._counts[slot] += 1
+        self._sums[slot] += value
+        self._count += 1
+        self._sum += value
+
+    def count(self, now: float = None) -> int:
+        self._advance(time.time() if now is None else now)
+        return self._count
+
+    def total(self, now: float = None) -> float:
+        self._advance(time.time() if now is None else now)
+        return self._sum
+
+    def mean(self, now: float = None) -> Optional[float]:
+        now = time.time() if now is None else now
+        count = self.count(now)
+        return self._sum / count if count else None
+
+    def state(self) -> Dict:
+        """Non-empty buckets, for persisting; see restore()"""
+        size = len(self._counts)
+        buckets = []
+        if self._current is not None:
+            for bucket in range(self._current - size + 1, self._current + 1):
+                slot = bucket % size
+                if self._counts[slot]:
+                    buckets.append([bucket, self._counts[slot], self._sums[slot]])
+        return {"bucket_seconds": self.bucket_seconds, "buckets": buckets}
+
+    def restore(self, state: Dict, now: float = None) -> None:
+        """Add buckets saved by state(); those already outside the window are ignored"""
+        if state.get("bucket_seconds") != self.bucket_seconds:
+            return
+        now = time.time() if now is None else now
+        current = self._advance(now)
+        size = len(self._counts)
+        for bucket, count, total in state.get("buckets", ()):
+            if current - size < bucket <= current:
+                slot = bucket % size
+                self._counts[slot] += count
+                self._sums[slot] += total
+                self._count += count
+                self._sum += total
+
+
+class StatsAggregator:
+    """Live dashboard statistics fed by service results and activity events.
+
+    - active connections: services currently connected (from status changes)
+    - success rate and mean latency of connect attempts over results_window
+    - activity events per minute over the last 60 seconds
+    """
+
+    _WINDOWS = ("attempts", "successes", "latency", "events")
+
+    def __init__(self, results_window: float = 900.0):
+        self._lock = threading.Lock()
+        self._connected: Set[str] = set()
+        self._attempts = RollingWindow(results_window)
+        self._successes = RollingWindow(results_window)
+        self._latency = RollingWindow(results_window)
+        self._events = RollingWindow(60.0)
+
+    def record_status(self, service: str, status: str) -> None:
+        with self._lock:
+            if status == "connected":
+                self._connected.add(service)
+            else:
+                self._connected.discard(service)
+
+    def record_connect(self, service: str, ok: bool, latency: float, now: float = None) -> None:
+        """One finished connect attempt; latency in seconds"""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._attempts.add(now=now)
+            if ok:
+                self._successes.add(now=now)
+                self._latency.add(latency, now=now)
+
+    def record_event(self, now: float = None) -> None:
+        """One activity event (used as an ActivityJournal listener)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._events.add(now=now)
+
+    def state(self) -> Dict[str, Dict]:
+        """Rolling windows as plain data, so statistics survive a restart"""
+        with self._lock:
+            return {name: getattr(self, f"_{name}").state() for name in self._WINDOWS}
+
+    def restore(self, state: Dict[str, Dict], now: float = None) -> None:
+        with self._lock:
+            for name in self._WINDOWS:
+                if name in state:
+                    getattr(self, f"_{name}").restore(state[name], now)
+
+    def snapshot(self, now: float = None) -> Dict[str, Optional[float]]:
+        now = time.time() if now is None else now
+        with self._lock:
+            attempts = self._attempts.count(now)
+            latency = self._latency.mean(now)
+            return {
+                "active_connections": len(self._connected),
+                "success_rate": self._successes.count(now) / attempts if attempts else None,
+                "mean_latency_ms": latency * 1000 if latency is not None else None,
+                "events_per_minute": self._events.count(now) * 60.0 / self._events.window_seconds,
+            }
@@ -3,9 +3,10 @@ import json
 import logging
 from datetime import datetime
 
-from pymongo import MongoClient
 from config.database_config import DatabaseConfig
+from database.connection import tokens_collection
 from bson import ObjectId
+from diagnostics.tracing import traced
 
 log = logging.getLogger(__name__)
 
@@ -19,10 +20,8 @@ except Exception:
 class TokenStore:
     def __init__(self):
         self.config = DatabaseConfig()
-        params = self.config.get_connection_params()
-        self._client = MongoClient(**params)
-        self._db = self._client[self.config.MONGODB_DATABASE]
-        self._col = self._db[self.config.MONGODB_COLLECTION_TOKENS]
+        # shared client using the offline-tolerant profile (relaxed write concern)
+        self._col = tokens_collection()
         # Load encryption key from env if provided (base64 urlsafe)
         self._enc_key = os.getenv('TOKEN_ENCRYPTION_KEY')
         if self._enc_key and not CRYPTO_AVAILABLE:
@@ -41,6 +40,7 @@ class TokenStore:
         f = Fernet(self._enc_key.encode() if isinstance(self._enc_key, str) else self._enc_key)
         return f.decrypt(ciphertext)
 
+    @traced("TokenStore.save_token", "mongo")
     def save_token(self, service_name: str, token_dict: dict, user_id: str = None, encrypt: bool = False) -> dict:
         """
         Save token JSON (dict) to DB linked to user_id (if provided).
@@ -76,7 +76,5 @@ class TokenStore:
             return {"ok": False, "error": str(exc)}
 
     def close(self):
-        try:
-            self._client.close()
-        except Exception:
-            pass
\ No newline at end of file
+        # The client is shared process-wide (database.connection.close_client)
+        self._col = None
\ No newline at end of file
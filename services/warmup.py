@@ -0,0 +1,208 @@
+"""
+Backend warm-up at application start.
+
+Each backend pays a cold-start cost on first use: keyring (Secret Service
+connection and unlock), MongoDB (SRV/DNS resolution, TLS handshake, server
+selection) and the Google auth HTTPS transport. The orchestrator runs these
+warm-ups concurrently on daemon threads as soon as the QApplication exists,
+respecting dependencies between tasks and a per-task timeout.
+
+Every task has a readiness future (ready(name)) that resolves when the
+warm-up finishes, fails or times out; callers can add_done_callback() on
+it. A timing report is logged once all tasks have settled.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Any, Iterable, Optional
+
+from diagnostics.tracing import span
+
+log = logging.getLogger(__name__)
+
+
+class WarmupError(RuntimeError):
+    pass
+
+
+class _Task:
+    def __init__(self, name: str, fn: Callable[[], Any], deps: Iterable[str], timeout: float):
+        self.name = name
+        self.fn = fn
+        self.deps = tuple(deps)
+        self.timeout = timeout
+        self.future: Future = Future()
+        self.submitted_at: Optional[float] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.timer: Optional[threading.Timer] = None
+        self.status = "pending"
+
+
+class WarmupOrchestrator:
+    """Runs named warm-up tasks concurrently with dependencies and timeouts"""
+
+    def __init__(self):
+        self._tasks: Dict[str, _Task] = {}
+        self._lock = threading.Lock()
+        self._started_at: Optional[float] = None
+        self._remaining = 0
+
+    def add(self, name: str, fn: Callable[[], Any], deps: Iterable[str] = (), timeout: float = 10.0) -> Future:
+        """Register a task; returns its readiness future"""
+        if self._started_at is not None:
+            raise RuntimeError("Cannot add warm-up tasks after start()")
+        task = _Task(name, fn, deps, timeout)
+        self._tasks[name] = task
+        return task.future
+
+    def ready(self, name: str) -> Future:
+        """Future resolved with the task's result, or failed with its error or a TimeoutError"""
+        return self._tasks[name].future
+
+    def start(self) -> None:
+        for task in self._tasks.values():
+            unknown = [dep for dep in task.deps if dep not in self._tasks]
+            if unknown:
+                raise ValueError(f"Warm-up task '{task.name}' depends on unknown task(s): {', '.join(unknown)}")
+        self._started_at = time.perf_counter()
+        self._remaining = len(self._tasks)
+        for task in self._tasks.values():
+            task.submitted_at = self._started_at
+            if not task.deps:
+                self._launch(task)
+            else:
+                for dep in task.deps:
+                    self._tasks[dep].future.add_done_callback(lambda _f, t=task: self._dependency_done(t))
+
+    def _dependency_done(self, task: _Task) -> None:
+        with self._lock:
+            if task.status != "pending" or not all(self._tasks[d].future.done() for d in task.deps):
+                return
+            task.status = "scheduled"
+        failed = [d for d in task.deps if self._tasks[d].future.exception() is not None]
+        if failed:
+            self._finish(task, exc=WarmupError(f"dependency failed: {', '.join(failed)}"), status="skipped")
+        else:
+            self._launch(task)
+
+    def _launch(self, task: _Task) -> None:
+        task.status = "running"
+        task.started_at = time.perf_counter()
+        threading.Thread(target=self._run, args=(task,), name=f"Warmup-{task.name}", daemon=True).start()
+        task.timer = threading.Timer(task.timeout, self._timed_out, args=(task,))
+        task.timer.daemon = True
+        task.timer.start()
+
+    def _run(self, task: _Task) -> None:
+        try:
+            with span(f"warmup.{task.name}", "startup"):
+                result = task.fn()
+        except Exception as exc:
+            self._finish(task, exc=exc, status="failed")
+        else:
+            self._finish(task, result=result, status="ok")
+
+    def _timed_out(self, task: _Task) -> None:
+        # The worker thread cannot be interrupted; it keeps running but its result is dropped
+        self._finish(task, exc=TimeoutError(f"warm-up '{task.name}' exceeded {task.timeout:.1f} s"),
+                     status="timeout")
+
+    def _finish(self, task: _Task, result: Any = None, exc: BaseException = None, status: str = "ok") -> None:
+        with self._lock:
+            if task.finished_at is not None:
+                return
+            task.status = status
+            task.finished_at = time.perf_counter()
+            self._remaining -= 1
+            all_done = self._remaining == 0
+        if task.timer is not None:
+            task.timer.cancel()
+        if exc is not None:
+            log.debug("Warm-up %s %s: %s", task.name, status, exc)
+            task.future.set_exception(exc)
+        else:
+            task.future.set_result(result)
+        if all_done:
+            self._log_report()
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Per-task status, time waiting on dependencies and run time in ms"""
+        report = {}
+        for task in self._tasks.values():
+            entry: Dict[str, Any] = {"status": task.status, "deps": list(task.deps)}
+            if task.started_at is not None and task.submitted_at is not None:
+                entry["wait_ms"] = round((task.started_at - task.submitted_at) * 1000, 1)
+            if task.finished_at is not None and task.started_at is not None:
+                entry["run_ms"] = round((task.finished_at - task.started_at) * 1000, 1)
+            if task.future.done() and task.future.exception() is not None:
+                entry["error"] = str(task.future.exception())
+            report[task.name] = entry
+        return report
+
+    def _log_report(self) -> None:
+        total_ms = (time.perf_counter() - self._started_at) * 1000
+        lines = []
+        for name, entry in self.report().items():
+            line = f"  {name:<18} {entry['status']:<8} run={entry.get('run_ms', '-')} ms wait={entry.get('wait_ms', '-')} ms"
+            if "error" in entry:
+                line += f" ({entry['error']})"
+            lines.append(line)
+        log.info("Backend warm-up finished in %.0f ms:\n%s", total_ms, "\n".join(lines))
+
+
+def _warm_config() -> None:
+    # .env is parsed when config.database_config is first imported (normally
+    # already done by main.py); this builds the client options Mongo needs
+    from config.database_config import DatabaseConfig
+    DatabaseConfig.get_connection_params("interactive")
+
+
+def _warm_keyring() -> None:
+    import keyring
+    from auth.keyring_auth import USER_SERVICE_NAME
+    # Opens the backend connection and triggers any unlock prompt now, not at login
+    keyring.get_keyring()
+    keyring.get_password(USER_SERVICE_NAME, "__warmup__")
+
+
+def _warm_mongo() -> None:
+    from database.connection import get_client
+    # Clients are created for every profile used at startup; the ping pays
+    # DNS/SRV, TLS and server selection for the interactive one
+    for profile in ("offline_tolerant", "batch"):
+        get_client(profile)
+    get_client("interactive").admin.command("ping")
+
+
+def _warm_google_transport() -> None:
+    from services.meet_service import get_auth_request
+    request = get_auth_request()
+    # Only open a TLS connection if Google is configured on this machine
+    if os.path.exists(os.path.abspath("token.json")):
+        request.session.head("https://oauth2.googleapis.com/token", timeout=5)
+
+
+_orchestrator: Optional[WarmupOrchestrator] = None
+
+
+def get_warmup() -> Optional[WarmupOrchestrator]:
+    """The orchestrator started by start_warmup(), if any"""
+    return _orchestrator
+
+
+def start_warmup() -> WarmupOrchestrator:
+    """Register the default backend warm-ups and start them (idempotent)"""
+    global _orchestrator
+    if _orchestrator is None:
+        warmup = WarmupOrchestrator()
+        warmup.add("config", _warm_config, timeout=5)
+        warmup.add("keyring", _warm_keyring, timeout=15)
+        warmup.add("mongo", _warm_mongo, deps=("config",), timeout=15)
+        warmup.add("google_transport", _warm_google_transport, timeout=10)
+        warmup.start()
+        _orchestrator = warmup
+    return _orchestrator
@@ -0,0 +1,203 @@
+"""
+Packed UI assets.
+
+Icons, images and QSS files are packed by a build step into one indexed
+archive that is memory-mapped at startup:
+
+    python -m ui.assets build [--output PATH]
+    python -m ui.assets list
+
+Layout: 8-byte magic, little-endian u32 manifest length, JSON manifest
+({"entries": {key: [offset, size, mtime]}}), then the file contents.
+Keys are project-relative POSIX paths such as "ui/assests/zoom.webp".
+
+Lookups go through the in-memory manifest, so views never probe the
+filesystem and paths do not depend on the working directory. Without a
+bundle (or with SENTINEL_ASSETS=dir) the asset directories are scanned once
+and files are read on demand, which is what you want while editing assets.
+"""
+
+import argparse
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PyQt5.QtGui import QIcon, QPixmap
+
+from config.app_paths import PROJECT_ROOT, AppPaths
+
+log = logging.getLogger(__name__)
+
+# Project-relative directories that are packed
+ASSET_DIRS = ("icons", "assets", "ui/assests", "ui/qss")
+BUNDLE_PATH = os.getenv('SENTINEL_ASSET_BUNDLE', AppPaths.project_path("ui", "assets.bundle"))
+BUNDLE_MAGIC = b"SNTLAST1"
+_HEADER = struct.Struct("<8sI")
+
+
+def _scan(root: str) -> Dict[str, Tuple[str, int, float]]:
+    """Return {key: (path, size, mtime)} for every file under ASSET_DIRS"""
+    found = {}
+    for directory in ASSET_DIRS:
+        base = os.path.join(root, *directory.split("/"))
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                key = os.path.relpath(path, root).replace(os.sep, "/")
+                stat = os.stat(path)
+                found[key] = (path, stat.st_size, stat.st_mtime)
+    return found
+
+
+class AssetBundle:
+    """Read-only view of a packed bundle through mmap"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, manifest_len = _HEADER.unpack_from(self._mmap, 0)
+        if magic != BUNDLE_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not an asset bundle")
+        manifest = json.loads(self._mmap[_HEADER.size:_HEADER.size + manifest_len])
+        self._data_start = _HEADER.size + manifest_len
+        self._entries: Dict[str, List] = manifest["entries"]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def keys(self) -> Iterable[str]:
+        return self._entries.keys()
+
+    def mtime(self, key: str) -> float:
+        return self._entries[key][2]
+
+    def read(self, key: str) -> bytes:
+        offset, size, _ = self._entries[key]
+        start = self._data_start + offset
+        return self._mmap[start:start + size]
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+class DirectoryAssets:
+    """Same interface over the source directories (manifest built by one scan)"""
+
+    def __init__(self, root: str = PROJECT_ROOT):
+        self.path = root
+        self._entries = _scan(root)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def keys(self) -> Iterable[str]:
+        return self._entries.keys()
+
+    def mtime(self, key: str) -> float:
+        return self._entries[key][2]
+
+    def read(self, key: str) -> bytes:
+        with open(self._entries[key][0], "rb") as f:
+            return f.read()
+
+    def close(self) -> None:
+        pass
+
+
+def build_bundle(output: str = BUNDLE_PATH, root: str = PROJECT_ROOT) -> int:
+    """Pack every asset under root into output; returns the number of entries"""
+    files = _scan(root)
+    files.pop(os.path.relpath(output, root).replace(os.sep, "/"), None)
+    entries, offset = {}, 0
+    for key, (_, size, mtime) in files.items():
+        entries[key] = [offset, size, mtime]
+        offset += size
+    manifest = json.dumps({"entries": entries}, separators=(",", ":")).encode("utf-8")
+
+    tmp_path = output + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(BUNDLE_MAGIC, len(manifest)))
+        f.write(manifest)
+        for key, (path, _, _) in files.items():
+            with open(path, "rb") as src:
+                f.write(src.read())
+    os.replace(tmp_path, output)
+    return len(entries)
+
+
+_assets = None
+
+
+def get_assets():
+    """Shared asset source: the packed bundle if present, else the source directories"""
+    global _assets
+    if _assets is None:
+        if os.getenv('SENTINEL_ASSETS', '') != 'dir' and os.path.exists(BUNDLE_PATH):
+            try:
+                _assets = AssetBundle(BUNDLE_PATH)
+            except (OSError, ValueError) as exc:
+                log.warning("Could not open asset bundle %s (%s); using asset directories", BUNDLE_PATH, exc)
+        if _assets is None:
+            _assets = DirectoryAssets()
+    return _assets
+
+
+def asset_exists(key: str) -> bool:
+    return key in get_assets()
+
+
+def asset_bytes(key: str) -> Optional[bytes]:
+    assets = get_assets()
+    return assets.read(key) if key in assets else None
+
+
+def asset_text(key: str) -> Optional[str]:
+    data = asset_bytes(key)
+    return data.decode("utf-8") if data is not None else None
+
+
+def load_pixmap(key: str) -> Optional[QPixmap]:
+    """Decode an image asset; None if the asset is missing or cannot be decoded"""
+    data = asset_bytes(key)
+    if data is None:
+        return None
+    pixmap = QPixmap()
+    if not pixmap.loadFromData(data):
+        log.warning("Could not decode image asset %s", key)
+        return None
+    return pixmap
+
+
+def load_icon(key: str) -> Optional[QIcon]:
+    pixmap = load_pixmap(key)
+    return QIcon(pixmap) if pixmap is not None else None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ui.assets", description="Build or inspect the UI asset bundle")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Pack icons, images and QSS into one bundle")
+    build.add_argument("--output", default=BUNDLE_PATH)
+    sub.add_parser("list", help="List the assets the app would load")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        count = build_bundle(args.output)
+        print(f"[SUCCESS] Packed {count} assets into {args.output} ({os.path.getsize(args.output)} bytes)")
+    else:
+        assets = get_assets()
+        print(f"Source: {assets.path}")
+        for key in sorted(assets.keys()):
+            print(f"  {key}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
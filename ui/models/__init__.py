@@ -0,0 +1,11 @@
+"""
+Sentinel AI Models Module
+
+This module contains the Qt item models behind the views.
+"""
+
+from .activity_feed_model import ActivityFeedModel
+from .service_catalog_model import ServiceCatalogModel, ServiceFilterProxyModel
+from .service_status_hub import ServiceStatusHub
+
+__all__ = ['ActivityFeedModel', 'ServiceCatalogModel', 'ServiceFilterProxyModel', 'ServiceStatusHub']
@@ -0,0 +1,188 @@
+import bisect
+from array import array
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt, QTimer, pyqtSignal
+
+from services.activity_journal import ActivityEvent, ActivityJournal
+
+# Rows fetched per journal read, and how many such pages are kept
+PAGE_SIZE = 128
+MAX_PAGES = 8
+
+# New events are picked up at most this often, however fast they are appended
+SYNC_INTERVAL_MS = 100
+
+KIND_ICONS = {
+    "connect": "🟢",
+    "disconnect": "⚪",
+    "error": "🔴",
+    "login": "🔑",
+    "logout": "🚪",
+    "upload": "📄",
+}
+
+
+class ActivityFeedModel(QAbstractListModel):
+    """Newest-first view of the activity journal, read a page at a time.
+
+    Rows map directly to journal seqs, so the row count costs nothing and
+    only MAX_PAGES pages of PAGE_SIZE events are held in memory however long
+    the history is. set_username() and set_service() restrict the feed to
+    one user's and/or one service's events through the journal's indexes.
+    """
+
+    EventRole = Qt.UserRole + 1
+
+    # Emitted from the appending thread; queued to the model's thread
+    _journal_changed = pyqtSignal()
+
+    def __init__(self, journal: ActivityJournal, parent=None):
+        super().__init__(parent)
+        self._journal = journal
+        self._service: Optional[str] = None
+        self._username: Optional[str] = None
+        self._seqs: Optional[array] = None      # filtered seqs, oldest first
+        self._start = journal.start_seq
+        self._end = journal.end_seq
+        self._pages: "OrderedDict[int, Dict[int, ActivityEvent]]" = OrderedDict()
+
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(SYNC_INTERVAL_MS)
+        self._sync_timer.timeout.connect(self._sync)
+        self._journal_changed.connect(self._schedule_sync)
+        # Kept so the same callable can be removed again in close()
+        self._listener = self._journal_changed.emit
+        journal.add_listener(self._listener)
+
+    def close(self) -> None:
+        """Stop following the journal (call before the model is discarded)"""
+        self._journal.remove_listener(self._listener)
+        self._sync_timer.stop()
+
+    def set_service(self, service: Optional[str]) -> None:
+        """Show only one service's events, or all of them with None"""
+        self._service = service or None
+        self._reset()
+
+    def set_username(self, username: Optional[str]) -> None:
+        """Show only the events recorded for one user, or everyone's with None"""
+        self._username = username or None
+        self._reset()
+
+    def _reset(self) -> None:
+        self.beginResetModel()
+        self._start = self._journal.start_seq
+        self._end = self._journal.end_seq
+        self._seqs = self._filtered_seqs(0)
+        self._pages.clear()
+        self.endResetModel()
+
+    def _filtered_seqs(self, start: int) -> Optional[array]:
+        """Seqs (>= start) matching the filters, oldest first; None when unfiltered"""
+        seqs = self._journal.service_seqs(self._service, start) if self._service else None
+        if self._username:
+            user_seqs = self._journal.user_seqs(self._username, start)
+            if seqs is None:
+                seqs = user_seqs
+            else:
+                wanted = set(user_seqs)
+                seqs = array("Q", (seq for seq in seqs if seq in wanted))
+        return seqs
+
+    # Qt model interface
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._seqs) if self._seqs is not None else self._end - self._start
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole, self.EventRole):
+            return None
+        event = self.event_at(index.row())
+        if event is None:
+            return None
+        if role == self.EventRole:
+            return event
+        when = datetime.fromtimestamp(event.timestamp)
+        if role == Qt.ToolTipRole:
+            return f"{when:%Y-%m-%d %H:%M:%S} · {event.username or 'system'}"
+        subject = event.service or event.username
+        text = f"{when:%H:%M:%S}  {KIND_ICONS.get(event.kind, '•')} {subject}"
+        return f"{text} — {event.message}" if event.message else text
+
+    # Paging
+
+    def event_at(self, row: int) -> Optional[ActivityEvent]:
+        if not 0 <= row < self.rowCount():
+            return None
+        page_no = row // PAGE_SIZE
+        page = self._pages.get(page_no)
+        if page is None:
+            page = self._load_page(page_no)
+            self._pages[page_no] = page
+            if len(self._pages) > MAX_PAGES:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_no)
+        return page.get(self._seq_for_row(row))
+
+    def _seq_for_row(self, row: int) -> int:
+        if self._seqs is not None:
+            return self._seqs[len(self._seqs) - 1 - row]
+        return self._end - 1 - row
+
+    def _load_page(self, page_no: int) -> Dict[int, ActivityEvent]:
+        first_row = page_no * PAGE_SIZE
+        last_row = min(first_row + PAGE_SIZE, self.rowCount()) - 1
+        if self._seqs is None:
+            # One contiguous range of seqs: a single read
+            events = self._journal.read_range(self._seq_for_row(last_row), self._seq_for_row(first_row) + 1)
+        else:
+            events = filter(None, (self._journal.read(self._seq_for_row(row))
+                                   for row in range(first_row, last_row + 1)))
+        return {event.seq: event for event in events}
+
+    # Following the journal
+
+    def _schedule_sync(self) -> None:
+        if not self._sync_timer.isActive():
+            self._sync_timer.start()
+
+    def _sync(self) -> None:
+        start, end = self._journal.start_seq, self._journal.end_seq
+        if self._seqs is None:
+            removed = max(0, start - self._start)
+            added = max(0, end - self._end)
+        else:
+            removed = bisect.bisect_left(self._seqs, start)
+            new_seqs = self._filtered_seqs(self._end)
+            new_seqs = new_seqs[:bisect.bisect_left(new_seqs, end)]
+            added = len(new_seqs)
+
+        # Compaction removes the oldest events, which are the last rows
+        if removed:
+            count = self.rowCount()
+            removed = min(removed, count)
+            self.beginRemoveRows(QModelIndex(), count - removed, count - 1)
+            if self._seqs is None:
+                self._start = start
+            else:
+                del self._seqs[:removed]
+            self._pages.clear()
+            self.endRemoveRows()
+
+        # New events go on top; every row index shifts, so cached pages are dropped
+        if added:
+            self.beginInsertRows(QModelIndex(), 0, added - 1)
+            if self._seqs is not None:
+                self._seqs.extend(new_seqs)
+            self._end = end
+            self._pages.clear()
+            self.endInsertRows()
+        else:
+            self._end = end
@@ -0,0 +1,118 @@
+from typing import Dict, List, Set
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+
+from services.catalog import ServiceInfo
+
+# Connection states and the status text shown for each
+STATUS_TEXT = {
+    "disconnected": "🔴 Disconnected",
+    "connecting": "🟡 Connecting...",
+    "connected": "🟢 Connected",
+    "disconnecting": "🔴 Disconnecting...",
+    "error": "🔴 Error",
+}
+
+
+class ServiceCatalogModel(QAbstractListModel):
+    """One row per monitored service: catalog metadata plus live connection status"""
+
+    NameRole = Qt.UserRole + 1
+    InfoRole = Qt.UserRole + 2
+    StatusRole = Qt.UserRole + 3
+    StatusTextRole = Qt.UserRole + 4
+    CategoryRole = Qt.UserRole + 5
+    SearchRole = Qt.UserRole + 6
+    StaleRole = Qt.UserRole + 7
+
+    def __init__(self, services: List[ServiceInfo] = (), parent=None):
+        super().__init__(parent)
+        self._services: List[ServiceInfo] = []
+        self._rows: Dict[str, int] = {}
+        self._status: Dict[str, str] = {}
+        self._stale: Set[str] = set()     # restored from a snapshot, not yet revalidated
+        self.set_services(services)
+
+    def set_services(self, services: List[ServiceInfo]) -> None:
+        self.beginResetModel()
+        self._services = list(services)
+        self._rows = {info.name: row for row, info in enumerate(self._services)}
+        self._status = {name: self._status.get(name, "disconnected") for name in self._rows}
+        self._stale &= set(self._rows)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._services)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._services):
+            return None
+        info = self._services[index.row()]
+        if role in (Qt.DisplayRole, self.NameRole):
+            return info.display_name if role == Qt.DisplayRole else info.name
+        if role == self.InfoRole:
+            return info
+        if role == self.StatusRole:
+            return self._status[info.name]
+        if role == self.StatusTextRole:
+            text = STATUS_TEXT.get(self._status[info.name], self._status[info.name])
+            return f"{text} · checking..." if info.name in self._stale else text
+        if role == self.StaleRole:
+            return info.name in self._stale
+        if role == self.CategoryRole:
+            return info.category
+        if role == self.SearchRole:
+            return info.search_text()
+        if role == Qt.ToolTipRole:
+            return info.description or info.display_name
+        return None
+
+    def status(self, name: str) -> str:
+        return self._status.get(name, "disconnected")
+
+    def statuses(self) -> Dict[str, str]:
+        return dict(self._status)
+
+    def is_stale(self, name: str) -> bool:
+        return name in self._stale
+
+    def set_status(self, name: str, status: str, stale: bool = False) -> bool:
+        """Update one service's status; only that row is repainted. Returns False if nothing changed."""
+        row = self._rows.get(name)
+        if row is None or (self._status[name] == status and (name in self._stale) == stale):
+            return False
+        self._status[name] = status
+        if stale:
+            self._stale.add(name)
+        else:
+            self._stale.discard(name)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [self.StatusRole, self.StatusTextRole, self.StaleRole])
+        return True
+
+
+class ServiceFilterProxyModel(QSortFilterProxyModel):
+    """Filters the catalog by free-text search and, optionally, category"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search = ""
+        self._category = None
+        # Status changes must not re-run the filter for every row
+        self.setDynamicSortFilter(False)
+
+    def set_search_text(self, text: str) -> None:
+        self._search = text.strip().lower()
+        self.invalidateFilter()
+
+    def set_category(self, category: str = None) -> None:
+        self._category = category or None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        if self._category and index.data(ServiceCatalogModel.CategoryRole) != self._category:
+            return False
+        if self._search:
+            return all(term in index.data(ServiceCatalogModel.SearchRole) for term in self._search.split())
+        return True
@@ -0,0 +1,66 @@
+import threading
+from typing import Dict, List, Tuple
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from diagnostics.tracing import span
+from ui.models.service_catalog_model import ServiceCatalogModel
+
+# One flush per frame at 60 Hz
+FRAME_MS = 16
+
+
+class ServiceStatusHub(QObject):
+    """Single entry point for service status changes.
+
+    post() may be called from any thread. Changes are queued per service
+    (the latest one wins) and applied to the catalog model once per frame;
+    a change to the status the service already has is dropped. Each flush
+    emits statuses_applied once with the changes that actually happened, so
+    N services finishing together cost one repaint pass and one notification.
+
+    post(..., confirm=True) marks a status that was already shown (restored
+    from a snapshot) as verified; listeners should not treat it as an event.
+    """
+
+    # [(service, status, message, confirm), ...] applied in one flush
+    statuses_applied = pyqtSignal(list)
+
+    # Emitted from post(); queued to the hub's thread when posted from a worker
+    _wake = pyqtSignal()
+
+    def __init__(self, model: ServiceCatalogModel, parent=None):
+        super().__init__(parent)
+        self._model = model
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Tuple[str, str, bool]] = {}
+        self._scheduled = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FRAME_MS)
+        self._timer.timeout.connect(self._flush)
+        self._wake.connect(self._timer.start)
+
+    def post(self, service: str, status: str, message: str = "", confirm: bool = False) -> None:
+        """Queue a status change for the next frame; safe to call from any thread"""
+        with self._lock:
+            self._pending[service] = (status, message, confirm)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._wake.emit()
+
+    def _flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._scheduled = False
+
+        applied: List[Tuple[str, str, str, bool]] = []
+        with span("status_hub.flush", "ui", posted=len(pending)):
+            for service, (status, message, confirm) in pending.items():
+                # Also confirms (un-stales) a status restored from a snapshot
+                if self._model.set_status(service, status):
+                    applied.append((service, status, message, confirm))
+        if applied:
+            self.statuses_applied.emit(applied)
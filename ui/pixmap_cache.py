@@ -0,0 +1,193 @@
+"""
+Shared cache of pre-scaled pixmaps.
+
+Pixmaps are keyed by (asset, size, devicePixelRatio). Lookups go to
+QPixmapCache first, then to a disk cache of pre-scaled PNGs under
+DATA_DIR/cache/pixmaps, and only then decode the asset. Decoding goes
+through QImageReader.setScaledSize, so large art is downsampled while it is
+decoded instead of being decoded at full size and scaled afterwards.
+
+Entries are PNG-encoded and written on a background
+thread. Their names carry the asset's mtime, so rebuilt assets are
+picked up automatically; entries of older mtimes are deleted, and the
+directory is trimmed to DISK_CACHE_MAX_MB, least recently used first.
+
+Must be used from the GUI thread (QPixmap is not thread-safe).
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Set
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QSize, Qt
+from PyQt5.QtGui import QIcon, QImage, QImageReader, QPixmap, QPixmapCache
+
+from config.app_paths import AppPaths
+from ui.assets import asset_bytes, get_assets
+
+log = logging.getLogger(__name__)
+
+DISK_CACHE_DIR = os.path.join(AppPaths.DATA_DIR, 'cache', 'pixmaps')
+DISK_CACHE_ENABLED = os.getenv('SENTINEL_PIXMAP_DISK_CACHE', '1') != '0'
+DISK_CACHE_MAX_MB = float(os.getenv('SENTINEL_PIXMAP_DISK_CACHE_MB', '32'))
+# QPixmapCache limit in KB (Qt's default is 10 MB)
+CACHE_LIMIT_KB = int(os.getenv('SENTINEL_PIXMAP_CACHE_KB', str(32 * 1024)))
+
+QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), CACHE_LIMIT_KB))
+
+_source_sizes: Dict[str, QSize] = {}
+_icons: Dict[str, QIcon] = {}
+
+# PNG encoding and cache maintenance; one thread keeps writes and pruning ordered
+_disk_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PixmapDiskCache")
+_purged_keys: Set[str] = set()
+_purged_lock = threading.Lock()
+
+
+def _open_reader(key: str):
+    data = asset_bytes(key)
+    if data is None:
+        return None, None
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    buffer.open(QIODevice.ReadOnly)
+    # The buffer must outlive the reader
+    return QImageReader(buffer), buffer
+
+
+def source_size(key: str) -> QSize:
+    """Original image size, read from the image header without decoding (invalid if missing)"""
+    size = _source_sizes.get(key)
+    if size is None:
+        reader, _buffer = _open_reader(key)
+        size = reader.size() if reader is not None else QSize()
+        _source_sizes[key] = size
+    return QSize(size)
+
+
+def _disk_prefix(key: str) -> str:
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def _disk_path(key: str, width: int, height: int, dpr: float, mode: int) -> str:
+    # <asset>-<mtime>-<size>: entries of one asset share a prefix, so older mtimes can be found
+    mtime = int(get_assets().mtime(key))
+    return os.path.join(DISK_CACHE_DIR, f"{_disk_prefix(key)}-{mtime}-{width}x{height}-{dpr:g}-{mode}.png")
+
+
+def _write_disk_entry(key: str, path: str, image: QImage) -> None:
+    """Background thread: save one entry, then drop stale and excess entries"""
+    try:
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        if image.save(path + ".tmp", "PNG"):
+            os.replace(path + ".tmp", path)
+        with _purged_lock:
+            purge_stale = key not in _purged_keys
+            _purged_keys.add(key)
+        if purge_stale:
+            _purge_stale_entries(key, os.path.basename(path))
+        _trim_disk_cache()
+    except OSError as exc:
+        log.debug("Could not write pixmap cache entry for %s: %s", key, exc)
+
+
+def _purge_stale_entries(key: str, current: str) -> None:
+    """Delete this asset's entries from older versions of it (other mtimes)"""
+    prefix = _disk_prefix(key) + "-"
+    version = current[:current.index("-", len(prefix)) + 1]
+    for name in os.listdir(DISK_CACHE_DIR):
+        if name.startswith(prefix) and not name.startswith(version):
+            try:
+                os.remove(os.path.join(DISK_CACHE_DIR, name))
+            except OSError:
+                pass
+
+
+def _trim_disk_cache() -> None:
+    limit = DISK_CACHE_MAX_MB * 1024 * 1024
+    entries = []
+    for entry in os.scandir(DISK_CACHE_DIR):
+        if entry.name.endswith(".png"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _mtime, size, _path in entries)
+    # File mtimes are refreshed on every hit, so the oldest are the least recently used
+    for _mtime, size, path in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def _touch(path: str) -> None:
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _decode_scaled(key: str, target: QSize, mode: int) -> Optional[QImage]:
+    reader, _buffer = _open_reader(key)
+    if reader is None:
+        return None
+    original = reader.size()
+    if original.isValid():
+        scaled = original.scaled(target, mode)
+        # Only ever downsample at decode time; upscaling is left to the painter
+        if scaled.width() < original.width():
+            reader.setScaledSize(scaled)
+    image = reader.read()
+    if image.isNull():
+        log.warning("Could not decode image asset %s: %s", key, reader.errorString())
+        return None
+    if image.width() > target.width() or image.height() > target.height():
+        # Formats without scaled decoding: one smooth downscale here, then cached
+        image = image.scaled(target, mode, Qt.SmoothTransformation)
+    return image
+
+
+def scaled_pixmap(key: str, width: int, height: int, dpr: float = 1.0,
+                  mode: int = Qt.KeepAspectRatio) -> Optional[QPixmap]:
+    """Pixmap for asset key fitted to width x height logical pixels at dpr; None if missing"""
+    if key not in get_assets():
+        return None
+    dpr = dpr or 1.0
+    cache_key = f"{key}@{width}x{height}@{dpr:g}/{int(mode)}"
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+
+    pixmap = QPixmap()
+    disk_path = _disk_path(key, width, height, dpr, int(mode)) if DISK_CACHE_ENABLED else None
+    if disk_path and os.path.exists(disk_path) and pixmap.load(disk_path, "PNG"):
+        _disk_writer.submit(_touch, disk_path)
+    else:
+        image = _decode_scaled(key, QSize(round(width * dpr), round(height * dpr)), mode)
+        if image is None:
+            return None
+        pixmap = QPixmap.fromImage(image)
+        if disk_path:
+            # QImage (unlike QPixmap) may be used from another thread
+            _disk_writer.submit(_write_disk_entry, key, disk_path, image)
+
+    pixmap.setDevicePixelRatio(dpr)
+    QPixmapCache.insert(cache_key, pixmap)
+    return pixmap
+
+
+def cached_icon(key: str) -> Optional[QIcon]:
+    """QIcon for an asset, decoded once per process; None if missing"""
+    icon = _icons.get(key)
+    if icon is None:
+        data = asset_bytes(key)
+        pixmap = QPixmap()
+        if data is None or not pixmap.loadFromData(data):
+            return None
+        icon = _icons[key] = QIcon(pixmap)
+    return icon
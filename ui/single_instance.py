@@ -0,0 +1,136 @@
+"""
+Single-instance enforcement over a local socket.
+
+The first launch listens on a per-user QLocalServer. A later launch
+connects to it, sends its command line as one JSON line and exits; the
+running instance raises its window and handles the request. This module
+is imported by main.py before the rest of the application, so it must
+stay light: QtCore, QtNetwork and the standard library only.
+"""
+
+import argparse
+import getpass
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, List
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+from config.app_paths import AppPaths
+
+log = logging.getLogger(__name__)
+
+# How long a second launch waits for the running instance before starting on its own
+CONNECT_TIMEOUT_MS = int(os.getenv('SENTINEL_INSTANCE_TIMEOUT_MS', '500'))
+
+
+def server_name() -> str:
+    """Per user and data directory, so separate profiles (SENTINEL_DATA_DIR) run side by side"""
+    key = f"{getpass.getuser()}|{os.path.abspath(AppPaths.DATA_DIR)}"
+    return "sentinel-ai-" + hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def parse_arguments(argv: List[str]) -> Dict[str, Any]:
+    """Requests on the command line: files to upload and services to connect.
+
+    File paths are made absolute here, since the running instance may have
+    a different working directory. Anything that is not an existing file
+    (such as the value of a Qt option) is ignored.
+    """
+    parser = argparse.ArgumentParser(prog="sentinel-ai", add_help=False)
+    parser.add_argument("--connect", action="append", default=[], metavar="SERVICE")
+    parser.add_argument("files", nargs="*")
+    # Qt's own options (-style, -platform, ...) are left for QApplication
+    args, _unknown = parser.parse_known_args(argv)
+    return {
+        "files": [os.path.abspath(path) for path in args.files if os.path.isfile(path)],
+        "connect": args.connect,
+    }
+
+
+def forward_to_running_instance(request: Dict[str, Any], timeout_ms: int = CONNECT_TIMEOUT_MS) -> bool:
+    """Hand the request to a running instance; returns False if there is none.
+
+    Uses QLocalSocket's blocking calls, which need no QApplication or event loop.
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(server_name())
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.write((json.dumps(request) + "\n").encode("utf-8"))
+    sent = socket.waitForBytesWritten(timeout_ms)
+    socket.disconnectFromServer()
+    if socket.state() != QLocalSocket.UnconnectedState:
+        socket.waitForDisconnected(timeout_ms)
+    return sent
+
+
+class InstanceServer(QObject):
+    """Listens for later launches and emits their requests on the GUI thread"""
+
+    # {"files": [...], "connect": [...]} from another launch
+    request_received = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._buffers: Dict[QLocalSocket, bytes] = {}
+
+    def listen(self) -> bool:
+        """Start listening; returns False if another instance already does"""
+        if self._server.listen(server_name()):
+            return True
+        if self._server.serverError() != QAbstractSocket.AddressInUseError:
+            log.warning("Single-instance server unavailable: %s", self._server.errorString())
+            return True
+        # In use: either a live instance (which won a start-up race) or a socket left by a crash
+        probe = QLocalSocket()
+        probe.connectToServer(server_name())
+        if probe.waitForConnected(CONNECT_TIMEOUT_MS):
+            probe.disconnectFromServer()
+            return False
+        QLocalServer.removeServer(server_name())
+        if not self._server.listen(server_name()):
+            log.warning("Single-instance server unavailable: %s", self._server.errorString())
+        return True
+
+    def close(self) -> None:
+        self._server.close()
+
+    def _on_new_connection(self) -> None:
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            self._buffers[socket] = b""
+            socket.readyRead.connect(lambda s=socket: self._on_ready_read(s))
+            socket.disconnected.connect(lambda s=socket: self._on_disconnected(s))
+
+    def _on_ready_read(self, socket: QLocalSocket) -> None:
+        self._buffers[socket] = self._buffers.get(socket, b"") + bytes(socket.readAll())
+        data = self._buffers[socket]
+        if b"\n" in data:
+            line, self._buffers[socket] = data.split(b"\n", 1)
+            self._dispatch(line)
+
+    def _on_disconnected(self, socket: QLocalSocket) -> None:
+        # Data can arrive together with the disconnect
+        if socket.bytesAvailable():
+            self._on_ready_read(socket)
+        self._buffers.pop(socket, None)
+        socket.deleteLater()
+
+    def _dispatch(self, line: bytes) -> None:
+        try:
+            request = json.loads(line.decode("utf-8"))
+        except ValueError:
+            log.warning("Ignoring malformed request from another instance")
+            return
+        if not isinstance(request, dict):
+            return
+        log.info("Request from another launch: %s", request)
+        self.request_received.emit(request)
+
@@ -0,0 +1,114 @@
+"""
+Application stylesheet management.
+
+All QSS files are merged into one sheet, theme variables (@name tokens) are
+substituted, and the result is cached and applied once on the QApplication.
+Views select rules through object names and dynamic properties instead of
+calling setStyleSheet() on individual widgets, so building a page does not
+re-polish its subtree for every inline sheet.
+"""
+
+import logging
+import os
+import re
+from typing import Dict, Optional, Tuple
+
+from ui.assets import get_assets
+
+log = logging.getLogger(__name__)
+
+# Asset keys merged in this order; later files win on equal specificity
+QSS_FILES = ("ui/qss/style.qss", "ui/qss/dashboard.qss")
+
+THEMES: Dict[str, Dict[str, str]] = {
+    "dark": {
+        "window_bg": "#1e1e1e",
+        "dashboard_bg": "#1a1a1a",
+        "surface": "#2c2c2c",
+        "surface_focus": "#333333",
+        "text": "#ffffff",
+        "text_muted": "#aaaaaa",
+        "text_secondary": "#9ca3af",
+        "text_subdued": "#888888",
+        "accent": "#7d5fff",
+        "accent_light": "#9b5de5",
+        "accent_dark": "#5f27cd",
+        "brand": "#4a67e4",
+        "brand_hover": "#5b79f6",
+        "success": "#10b981",
+        "danger": "#e44a4a",
+        "danger_hover": "#f65b5b",
+        "card_bg": "#2a2a3a",
+        "card_bg_end": "#1f1f2e",
+        "card_border": "#404040",
+        "card_hover": "#4f46e5",
+        "connect": "#059669",
+        "connect_end": "#047857",
+        "disconnect": "#dc2626",
+        "disconnect_end": "#b91c1c",
+    },
+}
+
+_VARIABLE = re.compile(r"@([A-Za-z_][A-Za-z0-9_]*)")
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+
+
+class StyleManager:
+    THEME = os.getenv('SENTINEL_THEME', 'dark')
+
+    # (theme, ((asset key, mtime), ...)) -> compiled stylesheet
+    _cache: Dict[Tuple, str] = {}
+
+    @classmethod
+    def _sources(cls) -> Tuple[Tuple[str, float], ...]:
+        assets = get_assets()
+        sources = []
+        for key in QSS_FILES:
+            if key in assets:
+                sources.append((key, assets.mtime(key)))
+            else:
+                log.warning("Stylesheet %s not found; skipping", key)
+        return tuple(sources)
+
+    @classmethod
+    def compile(cls, theme: Optional[str] = None) -> str:
+        """Return the merged stylesheet for theme, compiling it on first use"""
+        theme = theme or cls.THEME
+        if theme not in THEMES:
+            raise ValueError(f"Unknown theme '{theme}'. Available: {', '.join(THEMES)}")
+        key = (theme, cls._sources())
+        cached = cls._cache.get(key)
+        if cached is not None:
+            return cached
+
+        variables = THEMES[theme]
+        assets = get_assets()
+        parts = [_COMMENT.sub("", assets.read(name).decode("utf-8")) for name, _ in key[1]]
+
+        def substitute(match):
+            name = match.group(1)
+            if name not in variables:
+                raise ValueError(f"Undefined theme variable '@{name}' in theme '{theme}'")
+            return variables[name]
+
+        compiled = _VARIABLE.sub(substitute, "\n\n".join(parts))
+        cls._cache.clear()
+        cls._cache[key] = compiled
+        return compiled
+
+    @classmethod
+    def apply(cls, app, theme: Optional[str] = None) -> None:
+        """Set the merged stylesheet on the QApplication (no-op if already applied)"""
+        stylesheet = cls.compile(theme)
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
+
+    @staticmethod
+    def set_property(widget, name: str, value) -> None:
+        """Change a dynamic property used by selectors and re-polish only that widget"""
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
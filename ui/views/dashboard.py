@@ -1,58 +1,202 @@
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
     QFrame, QMessageBox, QFileDialog, QSpacerItem, QSizePolicy,
-    QGridLayout
+    QMenu, QLineEdit, QListView, QAbstractItemView
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
-from PyQt5.QtGui import QPixmap, QFont, QIcon
-import os
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont
+from auth.remember_me import RememberMe
 from auth.session_manager import SessionManager
 
 from services.service_manager import ServiceManager
-from concurrent.futures import Future, ThreadPoolExecutor
-from services.meet_service import MeetService
+from diagnostics import tracing, profiler
+from diagnostics.tracing import span, traced
+from diagnostics.memory_tracker import get_memory_tracker
+from ui.pixmap_cache import cached_icon, scaled_pixmap
+from ui.styles import StyleManager
+from services.activity_journal import get_activity_journal, record_activity
+from services.catalog import catalog
+from services.dashboard_snapshot import load_snapshot, save_snapshot
+from services.stats_aggregator import StatsAggregator
+from ui.models import ActivityFeedModel, ServiceCatalogModel, ServiceFilterProxyModel, ServiceStatusHub
+from ui.widgets import FlowGridLayout, ServiceCatalogView, ToastOverlay
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import os
+import time
 
-logging.basicConfig(level=logging.DEBUG)
+# Quiet period after the last resize event before compact/normal mode is re-evaluated
+RESIZE_DEBOUNCE_MS = 120
 
-class DashboardPage(QWidget):
-    # signal emitted from worker thread -> handled on main thread
-    service_result = pyqtSignal(str, bool, str)
+# Statistics cards, in display order: aggregator key and caption
+STAT_CARDS = (
+    ("active_connections", "Active Connections"),
+    ("success_rate", "Connect Success Rate"),
+    ("mean_latency_ms", "Mean Connect Latency"),
+    ("events_per_minute", "Events / Minute"),
+)
+
+# Upper bound on how often the statistics cards are redrawn
+STATS_REFRESH_MS = 1000
+
+# How often the dashboard snapshot is saved while a user is logged in
+SNAPSHOT_INTERVAL_MS = 60_000
+
+# Status changes recorded in the activity journal, and the event kind for each
+ACTIVITY_KINDS = {"connected": "connect", "disconnected": "disconnect", "error": "error"}
+
+# Connect results shown individually per status flush; more are summarised in one toast
+MAX_RESULT_TOASTS = 3
 
+
+class DashboardPage(QWidget):
     def __init__(self, main_app=None, username=None):
+        """Build the user-independent page; bind_user() attaches the logged-in user.
+
+        MainApp builds the page ahead of time while the login screen is idle,
+        so passing username here is only needed for a one-step build.
+        """
         super().__init__()
 
         self.main_app = main_app
-        self.username = username
-        self.service_manager = ServiceManager()
-
-        # Check if user is logged in using SessionManager
-        if not self.username or not SessionManager.is_logged_in(self.username):
-            QMessageBox.critical(self, "Access Denied", "Your session has expired or you're not logged in.")
-            if self.main_app:
-                self.main_app.show_login()  
-            return
+        self.username = None
+        self._first_paint_started = None
+        with span("dashboard.ServiceManager", "ui"):
+            self.service_manager = ServiceManager()
 
+        # Styled by the application-level sheet (ui.styles.StyleManager), scoped under #dashboard
         self.setObjectName("dashboard")
-        qss_path = os.path.join(os.path.dirname(__file__), "..", "qss", "dashboard.qss")
-        with open(qss_path, "r") as f:
-            self.setStyleSheet(f.read())
 
         # Initialize responsive variables
         self.is_compact_mode = False
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._check_compact_mode)
 
-        # Background executor and service instance
-        self._executor = ThreadPoolExecutor(max_workers=2)
-        self._service_status_labels = {}   # map service name -> QLabel
+        # Connects and health checks run on the service manager's worker pool
         self._logger = logging.getLogger(__name__)
-        self._meet_service = MeetService()
 
-        # Connect the service_result signal to the _on_service_result slot
-        self.service_result.connect(self._on_service_result)
+        # Statistics are updated per event and only read back at STATS_REFRESH_MS
+        self._stats = StatsAggregator()
+        get_activity_journal().add_listener(self._stats.record_event)
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(STATS_REFRESH_MS)
+        self._stats_timer.timeout.connect(self.refresh_statistics)
 
         self.setup_layout()
+        self._stats_timer.start()
+
+        # Saved for the next launch on shutdown and every SNAPSHOT_INTERVAL_MS while a user is bound
+        self._stale_services = set()
+        self._snapshot_timer = QTimer(self)
+        self._snapshot_timer.setInterval(SNAPSHOT_INTERVAL_MS)
+        self._snapshot_timer.timeout.connect(self.save_snapshot)
+
+        # Connected services are re-checked in the background; changes go through the status hub
+        self.service_manager.health_monitor.add_listener(self._on_health_changed)
+
+        # Connect results are reported without blocking the UI
+        self._toasts = ToastOverlay(self)
+
+        if username is not None:
+            self.bind_user(username)
+
+    def bind_user(self, username, session_verified=False) -> bool:
+        """Attach the logged-in user; returns False if the session is not valid.
+
+        session_verified skips the keyring session check when the caller has
+        just checked it (remember-me start-up).
+        """
+        if not username or not (session_verified or SessionManager.is_logged_in(username)):
+            QMessageBox.critical(self, "Access Denied", "Your session has expired or you're not logged in.")
+            if self.main_app:
+                self.main_app.show_login()
+            return False
+
+        self.username = username
+        self._user_name_button.setText(username.title())
+        self._welcome_title.setText(f"Welcome back, {username.title()}!")
+        # The journal is shared by every local account; show only this user's events
+        self._activity_model.set_username(username)
+
+        # Last-known state first, then revalidated in the background
+        self.restore_snapshot()
+        self._snapshot_timer.start()
+        return True
+
+    def restore_snapshot(self):
+        """Show the services and statistics saved for this user, marked stale until revalidated"""
+        state = load_snapshot(self.username)
+        if not state:
+            return
+        self._stats.restore(state.get("stats", {}))
+        for service, status in state.get("services", {}).items():
+            if self._service_model.set_status(service, status, stale=True):
+                self._stats.record_status(service, status)
+                self._stale_services.add(service)
+        if self._stale_services:
+            self._set_statistics_stale(True)
+            self.refresh_statistics()
+            for service in self._stale_services:
+                self._revalidate(service)
+
+    def _revalidate(self, service):
+        """Check a restored connection without user interaction; all services are checked concurrently"""
+        impl = self.service_manager.get_service(service)
+        if impl is None:
+            # Placeholder services have nothing to check
+            self._status_hub.post(service, "disconnected", "Previous session could not be verified", confirm=True)
+            return
+
+        def _done(fut, svc=service):
+            try:
+                ok, message = fut.result()
+            except Exception as exc:
+                ok, message = False, str(exc)
+            if ok:
+                # Not a new connection: no journal entry, statistics event or toast
+                self._status_hub.post(svc, "connected", "Previous session is still valid", confirm=True)
+                self.service_manager.health_monitor.watch(svc)
+            else:
+                self._status_hub.post(svc, "error", message)
 
+        self.service_manager.call(service, "health").add_done_callback(_done)
+
+    def save_snapshot(self):
+        """Persist connected services and statistics for the next launch (skipped if unchanged)"""
+        if not self.username:
+            return
+        statuses = self._service_model.statuses()
+        save_snapshot(self.username, {
+            "services": {service: status for service, status in statuses.items() if status == "connected"},
+            "stats": self._stats.state(),
+        })
+
+    def measure_first_paint(self, started: float, label: str) -> None:
+        """Log the time from started (perf_counter) to this page's next paint"""
+        self._first_paint_started = (started, label)
+        self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._first_paint_started is not None:
+            started, label = self._first_paint_started
+            self._first_paint_started = None
+            elapsed = time.perf_counter() - started
+            tracing.record_complete("dashboard.time_to_first_paint", elapsed, "ui", path=label)
+            self._logger.info("Time to dashboard (%s): %.1f ms", label, elapsed * 1000)
+
+    def shutdown(self) -> None:
+        """Stop background work before the page is discarded"""
+        self._snapshot_timer.stop()
+        self.save_snapshot()
+        self._activity_model.close()
+        get_activity_journal().remove_listener(self._stats.record_event)
+        self._stats_timer.stop()
+        self.service_manager.health_monitor.remove_listener(self._on_health_changed)
+        self.service_manager.shutdown()
+
+    @traced("DashboardPage.setup_layout", "ui")
     def setup_layout(self):
         """Setup the main layout"""
         main_layout = QVBoxLayout(self)
@@ -64,7 +208,8 @@ class DashboardPage(QWidget):
         top_section.setContentsMargins(0, 0, 0, 0)
 
         # Enhanced Sidebar
-        sidebar = self.create_enhanced_sidebar()
+        with span("dashboard.sidebar", "ui"):
+            sidebar = self.create_enhanced_sidebar()
         top_section.addWidget(sidebar)
 
         # ----- Main Content -----
@@ -73,23 +218,28 @@ class DashboardPage(QWidget):
         content_wrapper.setSpacing(25)
 
         # Dashboard Header
-        header_section = self.create_dashboard_header()
+        with span("dashboard.header", "ui"):
+            header_section = self.create_dashboard_header()
         content_wrapper.addWidget(header_section)
 
         # Statistics Cards Row
-        stats_section = self.create_statistics_section()
+        with span("dashboard.statistics", "ui"):
+            stats_section = self.create_statistics_section()
         content_wrapper.addWidget(stats_section)
 
         # Quick Actions Section
-        quick_actions = self.create_quick_actions_section()
+        with span("dashboard.quick_actions", "ui"):
+            quick_actions = self.create_quick_actions_section()
         content_wrapper.addWidget(quick_actions)
 
         # Enhanced Connection Panel
-        connection_section = self.create_responsive_connection_section()
+        with span("dashboard.connections", "ui"):
+            connection_section = self.create_responsive_connection_section()
         content_wrapper.addWidget(connection_section)
 
         # Recent Activity Section
-        activity_section = self.create_recent_activity_section()
+        with span("dashboard.activity", "ui"):
+            activity_section = self.create_recent_activity_section()
         content_wrapper.addWidget(activity_section)
 
         top_section.addLayout(content_wrapper)
@@ -104,8 +254,11 @@ class DashboardPage(QWidget):
     def resizeEvent(self, event):
         """Handle window resize events for responsive design"""
         super().resizeEvent(event)
-        current_width = self.width()
-        should_be_compact = current_width < 1200
+        # Layouts reflow on every resize; mode changes wait until resizing pauses
+        self._resize_timer.start()
+
+    def _check_compact_mode(self):
+        should_be_compact = self.width() < 1200
 
         if should_be_compact != self.is_compact_mode:
             self.is_compact_mode = should_be_compact
@@ -119,6 +272,8 @@ class DashboardPage(QWidget):
         if sidebar:
             sidebar_width = 200 if self.is_compact_mode else 250
             sidebar.setFixedWidth(sidebar_width)
+        self._stats_layout.set_compact(self.is_compact_mode)
+        self.apply_connection_section_mode()
 
     def create_enhanced_sidebar(self):
         """Create an enhanced sidebar with icons and better styling"""
@@ -134,12 +289,12 @@ class DashboardPage(QWidget):
         header_layout = QHBoxLayout()
         logo_label = QLabel()
         # Try to load logo, fallback to shield emoji if not found
-        logo_path = "icons/sentinel_logo.png"
-        if os.path.exists(logo_path):
-            logo_label.setPixmap(QPixmap(logo_path).scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        logo = scaled_pixmap("icons/sentinel_logo.png", 32, 32, self.devicePixelRatioF())
+        if logo is not None:
+            logo_label.setPixmap(logo)
         else:
             logo_label.setText("🛡️")
-            logo_label.setStyleSheet("font-size: 24px;")
+            logo_label.setProperty("fallback", True)
         logo_label.setObjectName("logo_label")
 
         title_label = QLabel("Sentinel AI")
@@ -165,32 +320,32 @@ class DashboardPage(QWidget):
         # Navigation Buttons
         self.home_button = QPushButton("Home")
         self.home_button.setObjectName("home_button")
-        icon_path = "icons/home_icon.png"
-        if os.path.exists(icon_path):
-            self.home_button.setIcon(QIcon(icon_path))
+        icon = cached_icon("icons/home_icon.png")
+        if icon is not None:
+            self.home_button.setIcon(icon)
         self.home_button.setCheckable(True)
         self.home_button.setChecked(True)
         self.home_button.clicked.connect(lambda: self.handle_sidebar_click("home"))
 
         self.tasks_button = QPushButton("Tasks")
         self.tasks_button.setObjectName("tasks_button")
-        icon_path = "icons/tasks_icon.png"
-        if os.path.exists(icon_path):
-            self.tasks_button.setIcon(QIcon(icon_path))
+        icon = cached_icon("icons/tasks_icon.png")
+        if icon is not None:
+            self.tasks_button.setIcon(icon)
         self.tasks_button.clicked.connect(lambda: self.handle_sidebar_click("tasks"))
 
         self.agents_button = QPushButton("Agents")
         self.agents_button.setObjectName("agents_button")
-        icon_path = "icons/agents_icon.png"
-        if os.path.exists(icon_path):
-            self.agents_button.setIcon(QIcon(icon_path))
+        icon = cached_icon("icons/agents_icon.png")
+        if icon is not None:
+            self.agents_button.setIcon(icon)
         self.agents_button.clicked.connect(lambda: self.handle_sidebar_click("agents"))
 
         self.settings_button = QPushButton("Settings")
         self.settings_button.setObjectName("settings_button")
-        icon_path = "icons/settings_icon.png"
-        if os.path.exists(icon_path):
-            self.settings_button.setIcon(QIcon(icon_path))
+        icon = cached_icon("icons/settings_icon.png")
+        if icon is not None:
+            self.settings_button.setIcon(icon)
         self.settings_button.clicked.connect(lambda: self.handle_sidebar_click("settings"))
 
         navigation_layout.addWidget(self.home_button)
@@ -205,17 +360,18 @@ class DashboardPage(QWidget):
         user_layout.setContentsMargins(0, 0, 0, 0)
         user_layout.setSpacing(10)
 
-        user_name_button = QPushButton(self.username.title() if self.username else "User")
+        user_name_button = QPushButton("User")
+        self._user_name_button = user_name_button
         user_name_button.setObjectName("user_name_button")
-        icon_path = "icons/user_icon.png"
-        if os.path.exists(icon_path):
-            user_name_button.setIcon(QIcon(icon_path))
+        icon = cached_icon("icons/user_icon.png")
+        if icon is not None:
+            user_name_button.setIcon(icon)
         user_name_button.setDisabled(True)
 
         my_profile_button = QPushButton("My Profile")
         my_profile_button.setObjectName("my_profile_button")
-        if os.path.exists(icon_path):
-            my_profile_button.setIcon(QIcon(icon_path))
+        if icon is not None:
+            my_profile_button.setIcon(icon)
 
         user_layout.addWidget(user_name_button)
         user_layout.addWidget(my_profile_button)
@@ -223,9 +379,9 @@ class DashboardPage(QWidget):
         # Logout Button
         logout_button = QPushButton("Logout")
         logout_button.setObjectName("logout_button")
-        icon_path = "icons/logout_icon.png"
-        if os.path.exists(icon_path):
-            logout_button.setIcon(QIcon(icon_path))
+        icon = cached_icon("icons/logout_icon.png")
+        if icon is not None:
+            logout_button.setIcon(icon)
         logout_button.clicked.connect(self.logout_user)
 
         # Add all sections to the main layout
@@ -247,7 +403,8 @@ class DashboardPage(QWidget):
 
         # Welcome section
         welcome_layout = QVBoxLayout()
-        welcome_title = QLabel(f"Welcome back, {self.username.title()}!")
+        welcome_title = QLabel("Welcome back!")
+        self._welcome_title = welcome_title
         welcome_title.setObjectName("welcome_title")
         welcome_subtitle = QLabel("Monitor and manage your AI security systems")
         welcome_subtitle.setObjectName("welcome_subtitle")
@@ -277,19 +434,49 @@ class DashboardPage(QWidget):
         stats_frame = QFrame()
         stats_frame.setObjectName("stats_section")
 
-        # Use grid layout for responsive design
-        if self.is_compact_mode:
-            # 2x2 grid for compact mode
-            stats_layout = QGridLayout(stats_frame)
-            stats_layout.setSpacing(15)
-            cols = 2
-        else:
-            # Horizontal layout for normal mode
-            stats_layout = QHBoxLayout(stats_frame)
-            stats_layout.setSpacing(20)
-            cols = 4
-
-        stats_layout.setContentsMargins(0, 0, 0, 0) 
+        # Four columns when there is room; 2x2 in compact mode, a single column when narrower still
+        stats_layout = FlowGridLayout(stats_frame, min_column_width=180, max_columns=4, spacing=20,
+                                      compact_max_columns=2)
+        self._stats_layout = stats_layout
+
+        self._stat_labels = {}
+        for key, title in STAT_CARDS:
+            card = QFrame()
+            card.setObjectName("stat_card")
+            card_layout = QVBoxLayout(card)
+            card_layout.setContentsMargins(18, 15, 18, 15)
+            card_layout.setSpacing(4)
+
+            value = QLabel("–")
+            value.setObjectName("stat_value")
+            caption = QLabel(title)
+            caption.setObjectName("stat_title")
+            card_layout.addWidget(value)
+            card_layout.addWidget(caption)
+
+            self._stat_labels[key] = value
+            stats_layout.addWidget(card)
+
+        self.refresh_statistics()
+        return stats_frame
+
+    def _set_statistics_stale(self, stale):
+        for label in self._stat_labels.values():
+            StyleManager.set_property(label, "stale", stale)
+
+    def refresh_statistics(self):
+        """Show the aggregator's current values; labels are only touched when their text changes"""
+        stats = self._stats.snapshot()
+        texts = {
+            "active_connections": str(stats["active_connections"]),
+            "success_rate": "–" if stats["success_rate"] is None else f"{stats['success_rate']:.0%}",
+            "mean_latency_ms": "–" if stats["mean_latency_ms"] is None else f"{stats['mean_latency_ms']:.0f} ms",
+            "events_per_minute": f"{stats['events_per_minute']:.0f}",
+        }
+        for key, text in texts.items():
+            label = self._stat_labels[key]
+            if label.text() != text:
+                label.setText(text)
 
     def create_quick_actions_section(self):
         """Create quick action buttons for common tasks"""
@@ -320,7 +507,9 @@ class DashboardPage(QWidget):
             btn.setObjectName(btn_id)
             btn.setCursor(Qt.PointingHandCursor)
             if btn_id == "upload_btn":
-                btn.clicked.connect(self.open_file)
+                btn.clicked.connect(lambda: self.open_file())
+            elif btn_id == "settings_btn":
+                btn.setMenu(self.create_diagnostics_menu(btn))
             buttons_layout.addWidget(btn)
 
         actions_layout.addLayout(buttons_layout)
@@ -332,106 +521,51 @@ class DashboardPage(QWidget):
         connection_frame = QFrame()
         connection_frame.setObjectName("connection_section")
         connection_layout = QVBoxLayout(connection_frame)
-        padding = 15 if self.is_compact_mode else 20
-        connection_layout.setContentsMargins(padding, 12, padding, 12)
-        connection_layout.setSpacing(15 if self.is_compact_mode else 20)
+        self._connection_layout = connection_layout
 
-        # Section title
+        # Section title and search
+        title_row = QHBoxLayout()
         title = QLabel("Application Monitoring")
         title.setObjectName("section_title")
-        connection_layout.addWidget(title)
-
-        # Services in responsive grid
-        services_frame = QWidget()
-        if self.is_compact_mode:
-            # 2 columns for compact mode
-            services_layout = QGridLayout(services_frame)
-            services_layout.setSpacing(15)
-            cols = 2
-        else:
-            # 3 columns for normal mode
-            services_layout = QGridLayout(services_frame)
-            services_layout.setSpacing(20)
-            cols = 3
-
-        services = [
-            ("Zoom", "ui/assests/zoom.webp", "🎥"),
-            ("Gmail", "ui/assests/gmail.webp", "📧"),
-            ("GMeet", "ui/assests/gmeet.webp", "👥"),
-            ("Spotify", "ui/assests/spotify.webp", "🎵"),
-            ("YouTube", "ui/assests/youtube.webp", "📺"),
-            ("Discord", "ui/assests/discord.webp", "💬"),
-        ]
-
-        for i, (service, icon_path, fallback_icon) in enumerate(services):
-            service_card = QFrame()
-            service_card.setObjectName("service_card")
-            card_layout = QVBoxLayout(service_card)
-            card_padding = 12 if self.is_compact_mode else 15
-            card_layout.setContentsMargins(card_padding, 15, card_padding, 15)
-            card_layout.setSpacing(10 if self.is_compact_mode else 12)
-            card_layout.setAlignment(Qt.AlignCenter)
-
-            # Service icon
-            icon_label = QLabel()
-            icon_size = 40 if self.is_compact_mode else 48
-            if os.path.exists(icon_path):
-                icon_pixmap = QPixmap(icon_path).scaled(icon_size, icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                icon_label.setPixmap(icon_pixmap)
-            else:
-                icon_label.setText(fallback_icon)
-                icon_label.setStyleSheet(f"font-size: {icon_size-8}px;")
-            icon_label.setAlignment(Qt.AlignCenter)
-            icon_label.setObjectName("service_icon")
-
-            # Service name
-            name_label = QLabel(service)
-            name_label.setObjectName("service_name")
-            name_label.setAlignment(Qt.AlignCenter)
-
-            # Status indicator
-            status_label = QLabel("🔴 Disconnected")
-            status_label.setObjectName("service_status")
-            status_label.setAlignment(Qt.AlignCenter)
-
-            # store label by service name (reliable lookup)
-            self._service_status_labels[service] = status_label
-
-            # Action buttons
-            button_layout = QHBoxLayout()
-            button_spacing = 6 if self.is_compact_mode else 8
-            button_layout.setSpacing(button_spacing)
-
-            connect_btn = QPushButton("Connect")
-            connect_btn.setObjectName("connect_btn")
-            connect_btn.setCursor(Qt.PointingHandCursor)
-            connect_btn.setProperty("service", service)
-            connect_btn.setProperty("status_label", status_label)
-            connect_btn.clicked.connect(self.on_connect_clicked)
-
-            disconnect_btn = QPushButton("Stop")
-            disconnect_btn.setObjectName("disconnect_btn")
-            disconnect_btn.setCursor(Qt.PointingHandCursor)
-            disconnect_btn.setProperty("service", service)
-            disconnect_btn.setProperty("status_label", status_label)
-            disconnect_btn.clicked.connect(self.on_disconnect_clicked)
-
-            button_layout.addWidget(connect_btn)
-            button_layout.addWidget(disconnect_btn)
-
-            card_layout.addWidget(icon_label)
-            card_layout.addWidget(name_label)
-            card_layout.addWidget(status_label)
-            card_layout.addLayout(button_layout)
-
-            # Add to grid
-            row = i // cols
-            col = i % cols
-            services_layout.addWidget(service_card, row, col)
-
-        connection_layout.addWidget(services_frame)
+        search = QLineEdit()
+        search.setObjectName("service_search")
+        search.setPlaceholderText("Search services...")
+        search.setClearButtonEnabled(True)
+        search.setMaximumWidth(260)
+        title_row.addWidget(title)
+        title_row.addStretch(1)
+        title_row.addWidget(search)
+        connection_layout.addLayout(title_row)
+
+        # Catalog metadata plus any implementation registered with the service manager
+        self._service_model = ServiceCatalogModel(catalog(self.service_manager.list_services()), self)
+        # Every status change goes through the hub: coalesced per frame, repeats dropped
+        self._status_hub = ServiceStatusHub(self._service_model, self)
+        self._status_hub.statuses_applied.connect(self._on_statuses_applied)
+        self._service_proxy = ServiceFilterProxyModel(self)
+        self._service_proxy.setSourceModel(self._service_model)
+        search.textChanged.connect(self._service_proxy.set_search_text)
+
+        # Cards are painted by a delegate; only the visible ones are ever laid out or drawn
+        self._service_view = ServiceCatalogView()
+        self._service_view.setModel(self._service_proxy)
+        self._service_view.connect_requested.connect(self.connect_service)
+        self._service_view.disconnect_requested.connect(self.disconnect_service)
+
+        # Paddings and card size for the current mode
+        self.apply_connection_section_mode()
+
+        connection_layout.addWidget(self._service_view)
         return connection_frame
 
+    def apply_connection_section_mode(self):
+        """Apply compact/normal paddings and card size to the service catalog"""
+        compact = self.is_compact_mode
+        padding = 15 if compact else 20
+        self._connection_layout.setContentsMargins(padding, 12, padding, 12)
+        self._connection_layout.setSpacing(15 if compact else 20)
+        self._service_view.set_compact(compact)
+
     def create_recent_activity_section(self):
         """Create recent activity log section"""
         activity_frame = QFrame()
@@ -445,12 +579,32 @@ class DashboardPage(QWidget):
         title.setObjectName("section_title")
         activity_layout.addWidget(title)
 
-        # Activity placeholder
+        # Newest first, paged from the activity journal
+        self._activity_model = ActivityFeedModel(get_activity_journal(), self)
+        activity_list = QListView()
+        activity_list.setObjectName("activity_list")
+        activity_list.setModel(self._activity_model)
+        activity_list.setUniformItemSizes(True)
+        activity_list.setSelectionMode(QAbstractItemView.NoSelection)
+        activity_list.setMinimumHeight(180)
+        activity_layout.addWidget(activity_list)
+
+        # Shown instead of the list until something has happened
         activity_text = QLabel("No recent activity to display.")
-        activity_text.setStyleSheet("color: #888888; font-style: italic; padding: 20px;")
+        activity_text.setObjectName("activity_placeholder")
         activity_text.setAlignment(Qt.AlignCenter)
         activity_layout.addWidget(activity_text)
 
+        def update_placeholder():
+            empty = self._activity_model.rowCount() == 0
+            activity_list.setVisible(not empty)
+            activity_text.setVisible(empty)
+
+        self._activity_model.rowsInserted.connect(update_placeholder)
+        self._activity_model.rowsRemoved.connect(update_placeholder)
+        self._activity_model.modelReset.connect(update_placeholder)
+        update_placeholder()
+
         return activity_frame
 
     def handle_sidebar_click(self, button_name):
@@ -478,28 +632,47 @@ class DashboardPage(QWidget):
     def logout_user(self):
         if self.username:
             SessionManager.delete_session(self.username)  
+            record_activity("logout", username=self.username)
+            # Logging out on purpose means the next launch asks for credentials
+            RememberMe.forget(self.username)
         if self.main_app:
             self.main_app.show_login()
+        get_memory_tracker().checkpoint("logout")
 
-    def open_file(self):
-        file_name, _ = QFileDialog.getOpenFileName(self, "Select File")
+    def open_file(self, file_name=None):
+        """Upload file_name, or one picked in a file dialog"""
+        if file_name is None:
+            file_name, _ = QFileDialog.getOpenFileName(self, "Select File")
         if file_name:
             print("Training agent on file:", file_name)
-
-    def on_connect_clicked(self):
-        sender = self.sender()
-        service = sender.property("service")
-        label = self._service_status_labels.get(service)
-        self._logger.debug("Connect clicked for service=%s label=%s", service, bool(label))
-        if label:
-            label.setText("🟡 Connecting...")
-            label.repaint()
-        self._logger.debug("Registered service keys: %s", list(self._service_status_labels.keys()))
-
-        if service == "GMeet":
-            future = self._executor.submit(self._meet_service.connect)
-        else:
-            future = self._executor.submit(lambda: (True, "Connected (placeholder)"))
+            record_activity("upload", message=os.path.basename(file_name), username=self.username or "")
+
+    def create_diagnostics_menu(self, parent):
+        """Profiling captures (written to the profiles folder in the data directory)"""
+        menu = QMenu(parent)
+        menu.addAction("Profile Next Action", profiler.arm_next_action)
+        menu.addAction("Profile Next 10 Seconds", lambda: self.profile_window(10))
+        return menu
+
+    def profile_window(self, seconds):
+        capture = profiler.start_capture("window")
+        if capture is None:
+            self._logger.info("A profile capture is already running")
+            return
+        # Stopped from the UI thread, which is the thread cProfile was enabled on
+        QTimer.singleShot(int(seconds * 1000), lambda: profiler.stop_capture(capture))
+
+    def connect_service(self, service):
+        self._logger.debug("Connect requested for service=%s", service)
+        started = time.perf_counter()
+        self._status_hub.post(service, "connecting")
+
+        # span + wrap() link the click to the worker in exported traces
+        with span("dashboard.connect_clicked", "ui", service=service):
+            if self.service_manager.get_service(service) is not None:
+                future = self.service_manager.connect(service)
+            else:
+                future = self.service_manager.submit(lambda: (True, "Connected (placeholder)"))
 
         def _done(fut, svc=service):
             try:
@@ -507,38 +680,63 @@ class DashboardPage(QWidget):
             except Exception as exc:
                 ok, message = False, str(exc)
             self._logger.debug("Worker finished for %s ok=%s msg=%s", svc, ok, message)
-            # emit Qt signal — safe across threads
-            try:
-                self.service_result.emit(svc, ok, message)
-            except Exception:
-                self._logger.exception("Failed emitting service_result for %s", svc)
+            self._stats.record_connect(svc, ok, time.perf_counter() - started)
+            # The hub is thread-safe; the change is applied on the UI thread with the next frame
+            self._status_hub.post(svc, "connected" if ok else "error", message)
+            if ok:
+                self.service_manager.health_monitor.watch(svc)
 
         future.add_done_callback(_done)
 
-    @pyqtSlot(str, bool, str)
-    def _on_service_result(self, service: str, ok: bool, message: str):
-        self._logger.debug("_on_service_result called service=%s ok=%s", service, ok)
-        label = self._service_status_labels.get(service)
-        if label:
-            label.setText("🟢 Connected" if ok else "🔴 Error")
-            label.repaint()
-            label.update()
-        else:
-            self._logger.warning("No status label found for service=%s", service)
+    def request_connect(self, name):
+        """Connect a service named on the command line (case-insensitive); False if unknown"""
+        statuses = self._service_model.statuses()
+        service = next((svc for svc in statuses if svc.lower() == name.lower()), None)
+        if service is None:
+            self._toasts.show_message(f"Unknown service: {name}", "error")
+            return False
+        if statuses[service] not in ("connected", "connecting"):
+            self.connect_service(service)
+        return True
+
+    def disconnect_service(self, service):
+        self.service_manager.health_monitor.unwatch(service)
+        self._status_hub.post(service, "disconnecting")
+        # Simple no-op disconnect for now
+        QTimer.singleShot(200, lambda: self._status_hub.post(service, "disconnected"))
 
-        if ok:
-            QMessageBox.information(self, service, message)
+    def _on_health_changed(self, service, state):
+        """Health monitor listener (worker thread): a connected service failed or recovered"""
+        if state.healthy:
+            self._status_hub.post(service, "connected", "Connection healthy again")
         else:
-            QMessageBox.warning(self, f"{service} error", message)
-
-    def on_disconnect_clicked(self):
-        sender = self.sender()
-        service = sender.property("service")
-        status_label = sender.property("status_label")
-        if status_label:
-            status_label.setText("🔴 Disconnecting...")
-        # Simple no-op disconnect for now
-        def _update():
-            if status_label:
-                status_label.setText("🔴 Disconnected")
-        QTimer.singleShot(200, _update)
\ No newline at end of file
+            self._status_hub.post(service, "error", state.message)
+
+    def _on_statuses_applied(self, changes):
+        """Journal settled status changes and report connect results as non-modal toasts"""
+        for service, status, message, confirm in changes:
+            self._stats.record_status(service, status)
+            if service in self._stale_services:
+                self._stale_services.discard(service)
+                if not self._stale_services:
+                    self._set_statistics_stale(False)
+            kind = ACTIVITY_KINDS.get(status)
+            if kind and not confirm:
+                record_activity(kind, service, message, self.username or "")
+
+        results = [(service, status, message) for service, status, message, confirm in changes
+                   if status in ("connected", "error") and not confirm]
+        if not results:
+            return
+        if len(results) <= MAX_RESULT_TOASTS:
+            for service, status, message in results:
+                if status == "connected":
+                    self._toasts.show_message(f"{service}: {message or 'Connected'}", "success")
+                else:
+                    self._toasts.show_message(f"{service} error: {message}", "error")
+            return
+        failed = [service for service, status, _ in results if status == "error"]
+        text = f"{len(results) - len(failed)} services connected"
+        if failed:
+            text += f", {len(failed)} failed ({', '.join(failed)})"
+        self._toasts.show_message(text, "error" if failed else "success")
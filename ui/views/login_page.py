@@ -2,11 +2,18 @@ from PyQt5.QtWidgets import (
     QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout, QFrame, QMessageBox, QCheckBox
 )
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap
-import os
+import logging
 
 from auth.keyring_auth import KeyringAuthFixed
+from auth.remember_me import RememberMe
 from auth.session_manager import SessionManager
+from database.login_activity import get_login_recorder
+from services.activity_journal import record_activity
+from diagnostics.profiler import profile_action
+from ui.widgets import ScaledPixmapLabel
+
+log = logging.getLogger(__name__)
+
 
 class LoginPage(QWidget):
     def __init__(self, switch_to_signup=None, switch_to_dashboard=None):
@@ -22,18 +29,14 @@ class LoginPage(QWidget):
         image_box = QFrame(self)
         image_box.setFrameShape(QFrame.StyledPanel)
         image_box.setLineWidth(2)
-        image_box.setStyleSheet("border-radius: 10px; border: 1px solid #7d5fff;")
-
-        image_label = QLabel(image_box)
-        image_path = os.path.join("ui", "assests", "image.png")
-        if os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            image_label.setPixmap(pixmap)
-        else:
+        image_box.setObjectName("imageBox")
+
+        # Painted from the shared pre-scaled pixmap cache
+        image_label = ScaledPixmapLabel(parent=image_box)
+        if not image_label.set_asset("ui/assests/image.png"):
             image_label.setText("Image\nNot Found")
-            image_label.setStyleSheet("color: #666; text-align: center;")
+            image_label.setProperty("fallback", True)
         image_label.setAlignment(Qt.AlignCenter)
-        image_label.setScaledContents(True)
         image_box.setLayout(QVBoxLayout())
         image_box.layout().addWidget(image_label)
 
@@ -58,7 +61,7 @@ class LoginPage(QWidget):
         # Remember Me and Forgot Password layout
         remember_forgot_row = QHBoxLayout()
         self.remember_checkbox = QCheckBox("Remember Me")
-        self.remember_checkbox.setStyleSheet("color: white;")
+        self.remember_checkbox.setObjectName("rememberCheckbox")
         
         self.forgot_label = QLabel("<a href='#' style='color: white; text-decoration: none;'>Forgot Password</a>")
         self.forgot_label.setObjectName("forgotPassword")
@@ -116,17 +119,31 @@ class LoginPage(QWidget):
             return
 
         try:
-            success, message, user_data = KeyringAuthFixed.authenticate_user(username, password)
+            with profile_action("login"):
+                success, message, user_data = KeyringAuthFixed.authenticate_user(username, password)
 
             if not success:
                 QMessageBox.critical(self, "Login Failed", message)
                 return
 
+            # Buffered; written to MongoDB in the background
+            get_login_recorder().record_login(user_data["username"])
+            record_activity("login", username=user_data["username"])
+
+            # Device-bound session that skips this page on the next launch
+            try:
+                if self.remember_checkbox.isChecked():
+                    RememberMe.remember(user_data["username"])
+                else:
+                    RememberMe.forget(user_data["username"])
+            except Exception as exc:
+                log.warning("Could not update remember-me session: %s", exc)
+
             QMessageBox.information(self, "Login Successful", f"Welcome {user_data['fullname']}!")
 
             # Redirect to dashboard
             if self.switch_to_dashboard:
-                self.switch_to_dashboard(username)
+                self.switch_to_dashboard(user_data["username"])
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred during login: {str(e)}")
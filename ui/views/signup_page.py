@@ -3,10 +3,11 @@ from PyQt5.QtWidgets import (
     QPushButton, QLineEdit, QFrame, QMessageBox
 )
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap
-import os
+import bcrypt
 from auth.keyring_auth import KeyringAuthFixed
 from database.user_service import UserService  # Add this import
+from diagnostics.tracing import span
+from ui.widgets import ScaledPixmapLabel
 
 
 class SignupPage(QWidget):
@@ -23,18 +24,14 @@ class SignupPage(QWidget):
         image_box = QFrame(self)
         image_box.setFrameShape(QFrame.StyledPanel)
         image_box.setLineWidth(2)
-        image_box.setStyleSheet("border-radius: 10px; border: 1px solid #7d5fff;")
-
-        image_label = QLabel(image_box)
-        image_path = os.path.join("ui", "assests", "image.png")
-        if os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            image_label.setPixmap(pixmap)
-        else:
+        image_box.setObjectName("imageBox")
+
+        # Painted from the shared pre-scaled pixmap cache
+        image_label = ScaledPixmapLabel(parent=image_box)
+        if not image_label.set_asset("ui/assests/image.png"):
             image_label.setText("Image\nNot Found")
-            image_label.setStyleSheet("color: #666; text-align: center;")
+            image_label.setProperty("fallback", True)
         image_label.setAlignment(Qt.AlignCenter)
-        image_label.setScaledContents(True)
         image_box.setLayout(QVBoxLayout())  # To ensure the layout works for the QLabel
         image_box.layout().addWidget(image_label)
 
@@ -126,16 +123,23 @@ class SignupPage(QWidget):
             return
 
         try:
+            # Hash once for both stores so the records can be kept in sync
+            with span("bcrypt.hashpw", "auth"):
+                password_bcrypt = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+
             # Register with KeyringAuth (local storage)
-            success, message = KeyringAuthFixed.register_user(username, fullname, phone, email, password)
+            success, message = KeyringAuthFixed.register_user(username, fullname, phone, email, password,
+                                                              password_bcrypt=password_bcrypt.decode('utf-8'))
 
             if not success:
                 QMessageBox.warning(self, "Signup Failed", message)
                 return
 
-            # Save to MongoDB Atlas
+            # Save to MongoDB Atlas (under the same normalized username as the keyring)
             user_service = UserService()
-            mongo_success, mongo_message = user_service.save_user(username, fullname, phone, email, password)
+            username = KeyringAuthFixed._clean_username(username)
+            mongo_success, mongo_message = user_service.save_user(username, fullname, phone, email, password,
+                                                                  hashed_password=password_bcrypt)
             
             if not mongo_success:
                 QMessageBox.warning(self, "Database Warning", 
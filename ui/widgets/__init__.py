@@ -0,0 +1,12 @@
+"""
+Sentinel AI Widgets Module
+
+This module contains reusable widgets shared by the views.
+"""
+
+from .flow_grid_layout import FlowGridLayout
+from .scaled_pixmap_label import ScaledPixmapLabel
+from .service_catalog_view import ServiceCardDelegate, ServiceCatalogView
+from .toast import ToastOverlay
+
+__all__ = ['FlowGridLayout', 'ScaledPixmapLabel', 'ServiceCardDelegate', 'ServiceCatalogView', 'ToastOverlay']
@@ -0,0 +1,113 @@
+from typing import List
+
+from PyQt5.QtCore import QPoint, QRect, QSize, Qt
+from PyQt5.QtWidgets import QLayout, QLayoutItem
+
+
+class FlowGridLayout(QLayout):
+    """Grid whose column count follows the available width.
+
+    Columns = as many as fit at min_column_width, capped at max_columns, or
+    at compact_max_columns while set_compact(True) is in effect (the owner's
+    breakpoint, which the width alone would not reproduce); items fill the
+    row left to right and share the width equally. A resize
+    only moves the existing widgets, so nothing has to be rebuilt when the
+    window crosses a breakpoint. Supports height-for-width, so the parent
+    grows or shrinks as rows are added or removed.
+    """
+
+    def __init__(self, parent=None, min_column_width: int = 220, max_columns: int = 0, spacing: int = 20,
+                 compact_max_columns: int = 0):
+        super().__init__(parent)
+        self._items: List[QLayoutItem] = []
+        self.min_column_width = min_column_width
+        self.max_columns = max_columns
+        self.compact_max_columns = compact_max_columns
+        self._compact = False
+        self.setSpacing(spacing)
+        self.setContentsMargins(0, 0, 0, 0)
+
+    def __del__(self):
+        while self.takeAt(0) is not None:
+            pass
+
+    def set_compact(self, compact: bool) -> None:
+        """Apply compact_max_columns instead of max_columns"""
+        if compact != self._compact:
+            self._compact = compact
+            self.invalidate()
+
+    # QLayout interface
+
+    def addItem(self, item: QLayoutItem) -> None:
+        self._items.append(item)
+
+    def count(self) -> int:
+        return len(self._items)
+
+    def itemAt(self, index: int):
+        return self._items[index] if 0 <= index < len(self._items) else None
+
+    def takeAt(self, index: int):
+        return self._items.pop(index) if 0 <= index < len(self._items) else None
+
+    def expandingDirections(self):
+        return Qt.Orientations(Qt.Horizontal)
+
+    def hasHeightForWidth(self) -> bool:
+        return True
+
+    def heightForWidth(self, width: int) -> int:
+        return self._arrange(QRect(0, 0, width, 0), move=False)
+
+    def setGeometry(self, rect: QRect) -> None:
+        super().setGeometry(rect)
+        self._arrange(rect, move=True)
+
+    def sizeHint(self) -> QSize:
+        return self.minimumSize()
+
+    def minimumSize(self) -> QSize:
+        size = QSize(self.min_column_width, 0)
+        for item in self._visible_items():
+            size = size.expandedTo(item.minimumSize())
+        margins = self.contentsMargins()
+        return size + QSize(margins.left() + margins.right(), margins.top() + margins.bottom())
+
+    # Layout logic
+
+    def columns_for_width(self, width: int) -> int:
+        spacing = self.spacing()
+        columns = max(1, (width + spacing) // (self.min_column_width + spacing))
+        limit = self.compact_max_columns if self._compact and self.compact_max_columns else self.max_columns
+        if limit:
+            columns = min(columns, limit)
+        return columns
+
+    def _visible_items(self) -> List[QLayoutItem]:
+        return [item for item in self._items if not item.isEmpty()]
+
+    def _arrange(self, rect: QRect, move: bool) -> int:
+        margins = self.contentsMargins()
+        area = rect.adjusted(margins.left(), margins.top(), -margins.right(), -margins.bottom())
+        items = self._visible_items()
+        if not items:
+            return margins.top() + margins.bottom()
+
+        spacing = self.spacing()
+        columns = min(self.columns_for_width(area.width()), len(items))
+        column_width = max(1, (area.width() - spacing * (columns - 1)) // columns)
+
+        y = area.y()
+        for row_start in range(0, len(items), columns):
+            row = items[row_start:row_start + columns]
+            row_height = max(
+                item.heightForWidth(column_width) if item.hasHeightForWidth() else item.sizeHint().height()
+                for item in row
+            )
+            if move:
+                for column, item in enumerate(row):
+                    x = area.x() + column * (column_width + spacing)
+                    item.setGeometry(QRect(QPoint(x, y), QSize(column_width, row_height)))
+            y += row_height + spacing
+        return y - spacing - rect.y() + margins.bottom()
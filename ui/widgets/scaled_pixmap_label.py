@@ -0,0 +1,84 @@
+from PyQt5.QtCore import QSize, Qt, QTimer
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import QFrame, QLabel
+
+from ui.pixmap_cache import scaled_pixmap, source_size
+
+
+class ScaledPixmapLabel(QLabel):
+    """Label that fills its area with an image asset, like setScaledContents(True).
+
+    Instead of scaling the full-size pixmap on every paint, it paints a
+    pixmap from the shared cache made at exactly the label's size, unscaled.
+    While the label is being resized it stretches the pixmap it already has
+    (a fast, unsmoothed blit) and only fetches the exact size once the size
+    has been stable for RESIZE_SETTLE_MS, so a window drag decodes nothing.
+    """
+
+    RESIZE_SETTLE_MS = 150
+
+    def __init__(self, asset_key: str = None, parent=None):
+        super().__init__(parent)
+        self._asset_key = None
+        self._pixmap = None
+        self._pixmap_size = QSize()
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(self.RESIZE_SETTLE_MS)
+        self._settle_timer.timeout.connect(self.update)
+        if asset_key:
+            self.set_asset(asset_key)
+
+    def set_asset(self, asset_key: str) -> bool:
+        """Show asset_key; returns False (and shows nothing) if it is missing"""
+        self._asset_key = asset_key if source_size(asset_key).isValid() else None
+        self._pixmap = None
+        self.updateGeometry()
+        self.update()
+        return self._asset_key is not None
+
+    def has_image(self) -> bool:
+        return self._asset_key is not None
+
+    def sizeHint(self) -> QSize:
+        if self._asset_key:
+            return source_size(self._asset_key)
+        return super().sizeHint()
+
+    def minimumSizeHint(self) -> QSize:
+        if self._asset_key:
+            return QSize(0, 0)
+        return super().minimumSizeHint()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._asset_key:
+            self._settle_timer.start()
+
+    def _exact_pixmap(self, size: QSize):
+        dpr = self.devicePixelRatioF()
+        if self._pixmap is None or self._pixmap_size != size or self._pixmap.devicePixelRatio() != dpr:
+            pixmap = scaled_pixmap(self._asset_key, size.width(), size.height(), dpr, Qt.IgnoreAspectRatio)
+            if pixmap is not None:
+                self._pixmap, self._pixmap_size = pixmap, QSize(size)
+        return self._pixmap
+
+    def paintEvent(self, event):
+        if not self._asset_key:
+            super().paintEvent(event)
+            return
+        # Frame and stylesheet border only; the image replaces QLabel's contents
+        QFrame.paintEvent(self, event)
+        rect = self.contentsRect()
+        if rect.isEmpty():
+            return
+        resizing = self._settle_timer.isActive() and self._pixmap is not None
+        pixmap = self._pixmap if resizing else self._exact_pixmap(rect.size())
+        if pixmap is None:
+            return
+        painter = QPainter(self)
+        if self._pixmap_size == rect.size():
+            painter.drawPixmap(rect.topLeft(), pixmap)
+        else:
+            painter.drawPixmap(rect, pixmap)
+        painter.end()
@@ -0,0 +1,171 @@
+from PyQt5.QtCore import QEvent, QRect, QRectF, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QBrush, QColor, QFont, QLinearGradient, QPainter, QPen
+from PyQt5.QtWidgets import QAbstractItemView, QListView, QStyle, QStyledItemDelegate
+
+from ui.models.service_catalog_model import ServiceCatalogModel
+from ui.pixmap_cache import scaled_pixmap
+from ui.styles import StyleManager, THEMES
+
+
+class ServiceCardDelegate(QStyledItemDelegate):
+    """Paints a service card (icon, name, status, Connect/Stop buttons) for one model row.
+
+    Cards are not widgets: the view only asks the delegate to paint rows that
+    are visible, so hundreds of services cost nothing until scrolled into view.
+    Button clicks are hit-tested in editorEvent and re-emitted as signals.
+    """
+
+    connect_requested = pyqtSignal(str)
+    disconnect_requested = pyqtSignal(str)
+
+    MARGIN = 8
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.compact = False
+        self._theme = THEMES[StyleManager.THEME]
+
+    def card_size(self) -> QSize:
+        return QSize(220, 180) if self.compact else QSize(260, 200)
+
+    def sizeHint(self, option, index) -> QSize:
+        # The item fills its grid cell; the card is drawn inset by MARGIN
+        return self.card_size() + QSize(2 * self.MARGIN, 2 * self.MARGIN)
+
+    def _button_rects(self, card: QRect):
+        spacing = 6 if self.compact else 8
+        padding = 12 if self.compact else 15
+        height = 30
+        width = (card.width() - 2 * padding - spacing) // 2
+        top = card.bottom() - padding - height
+        left = QRect(card.left() + padding, top, width, height)
+        right = QRect(left.right() + 1 + spacing, top, width, height)
+        return left, right
+
+    def _card_rect(self, option) -> QRect:
+        return option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+
+    def paint(self, painter: QPainter, option, index) -> None:
+        info = index.data(ServiceCatalogModel.InfoRole)
+        status = index.data(ServiceCatalogModel.StatusRole)
+        theme = self._theme
+        card = self._card_rect(option)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        gradient = QLinearGradient(card.topLeft(), card.bottomRight())
+        gradient.setColorAt(0, QColor(theme["card_bg"]))
+        gradient.setColorAt(1, QColor(theme["card_bg_end"]))
+        painter.setBrush(QBrush(gradient))
+        painter.setPen(QPen(QColor(theme["card_hover"] if hovered else theme["card_border"]), 1))
+        painter.drawRoundedRect(QRectF(card), 16, 16)
+
+        # Icon
+        icon_size = 40 if self.compact else 48
+        icon_rect = QRect(card.center().x() - icon_size // 2, card.top() + 15, icon_size, icon_size)
+        pixmap = scaled_pixmap(info.icon, icon_size, icon_size, painter.device().devicePixelRatioF()) if info.icon else None
+        if pixmap is not None:
+            size = pixmap.size() / pixmap.devicePixelRatio()
+            painter.drawPixmap(icon_rect.x() + (icon_size - size.width()) // 2,
+                               icon_rect.y() + (icon_size - size.height()) // 2, pixmap)
+        else:
+            font = QFont(option.font)
+            font.setPixelSize(icon_size - 8)
+            painter.setFont(font)
+            painter.drawText(icon_rect, Qt.AlignCenter, info.fallback_icon)
+
+        # Name and status
+        text_top = icon_rect.bottom() + 10
+        font = QFont(option.font)
+        font.setPixelSize(14)
+        font.setWeight(QFont.DemiBold)
+        painter.setFont(font)
+        painter.setPen(QColor(theme["text"]))
+        painter.drawText(QRect(card.left(), text_top, card.width(), 20), Qt.AlignCenter, info.display_name)
+
+        font.setPixelSize(11)
+        font.setWeight(QFont.Medium)
+        painter.setFont(font)
+        if index.data(ServiceCatalogModel.StaleRole):
+            status_color = theme["text_subdued"]
+        else:
+            status_color = theme["success"] if status == "connected" else theme["text_secondary"]
+        painter.setPen(QColor(status_color))
+        painter.drawText(QRect(card.left(), text_top + 22, card.width(), 18), Qt.AlignCenter,
+                         index.data(ServiceCatalogModel.StatusTextRole))
+
+        # Buttons
+        font.setPixelSize(12)
+        font.setWeight(QFont.DemiBold)
+        painter.setFont(font)
+        for rect, text, start, end in zip(
+            self._button_rects(card), ("Connect", "Stop"),
+            (theme["connect"], theme["disconnect"]), (theme["connect_end"], theme["disconnect_end"]),
+        ):
+            gradient = QLinearGradient(rect.topLeft(), rect.topRight())
+            gradient.setColorAt(0, QColor(start))
+            gradient.setColorAt(1, QColor(end))
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QBrush(gradient))
+            painter.drawRoundedRect(QRectF(rect), 8, 8)
+            painter.setPen(QColor(theme["text"]))
+            painter.drawText(rect, Qt.AlignCenter, text)
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            connect_rect, disconnect_rect = self._button_rects(self._card_rect(option))
+            name = index.data(ServiceCatalogModel.NameRole)
+            if connect_rect.contains(event.pos()):
+                self.connect_requested.emit(name)
+                return True
+            if disconnect_rect.contains(event.pos()):
+                self.disconnect_requested.emit(name)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class ServiceCatalogView(QListView):
+    """Virtualized grid of service cards painted by ServiceCardDelegate"""
+
+    connect_requested = pyqtSignal(str)
+    disconnect_requested = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("service_catalog")
+        self._delegate = ServiceCardDelegate(self)
+        self._delegate.connect_requested.connect(self.connect_requested)
+        self._delegate.disconnect_requested.connect(self.disconnect_requested)
+        self.setItemDelegate(self._delegate)
+
+        self.setViewMode(QListView.IconMode)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        # Every card has the same size: the view never has to measure rows it does not show
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(100)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setMouseTracking(True)
+        self.setCursor(Qt.PointingHandCursor)
+        self._apply_grid()
+
+    def set_compact(self, compact: bool) -> None:
+        if compact != self._delegate.compact:
+            self._delegate.compact = compact
+            self._apply_grid()
+
+    def _apply_grid(self) -> None:
+        size = self._delegate.card_size()
+        margin = ServiceCardDelegate.MARGIN
+        self.setGridSize(QSize(size.width() + 2 * margin, size.height() + 2 * margin))
+        # Room for two rows before scrolling
+        self.setMinimumHeight(2 * (size.height() + 2 * margin) + 4)
+        self.doItemsLayout()
@@ -0,0 +1,70 @@
+from PyQt5.QtCore import QEvent, Qt, QTimer
+from PyQt5.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from ui.styles import StyleManager
+
+
+class ToastOverlay(QWidget):
+    """Non-modal notifications stacked in the bottom-right corner of the parent.
+
+    Toasts never block input or start an event loop; each one disappears
+    after timeout_ms, and only the newest max_visible are kept. Styled via
+    #toast and its kind property ("info", "success", "error").
+    """
+
+    def __init__(self, parent: QWidget, timeout_ms: int = 4000, max_visible: int = 4, margin: int = 20):
+        super().__init__(parent)
+        self.setObjectName("toast_overlay")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.timeout_ms = timeout_ms
+        self.max_visible = max_visible
+        self.margin = margin
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(8)
+        self._toasts = []
+
+        parent.installEventFilter(self)
+        self.hide()
+
+    def show_message(self, text: str, kind: str = "info") -> None:
+        toast = QLabel(text, self)
+        toast.setObjectName("toast")
+        toast.setWordWrap(True)
+        toast.setMaximumWidth(360)
+        StyleManager.set_property(toast, "kind", kind)
+        self._layout.addWidget(toast)
+        self._toasts.append(toast)
+        # Owned by the toast, so it dies with it if the overlay goes first
+        timer = QTimer(toast)
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda t=toast: self._dismiss(t))
+        timer.start(self.timeout_ms)
+
+        while len(self._toasts) > self.max_visible:
+            self._dismiss(self._toasts[0])
+        self._reposition()
+        self.show()
+        self.raise_()
+
+    def _dismiss(self, toast: QLabel) -> None:
+        if toast not in self._toasts:
+            return
+        self._toasts.remove(toast)
+        self._layout.removeWidget(toast)
+        toast.deleteLater()
+        if self._toasts:
+            self._reposition()
+        else:
+            self.hide()
+
+    def _reposition(self) -> None:
+        self.adjustSize()
+        parent = self.parentWidget()
+        self.move(parent.width() - self.width() - self.margin, parent.height() - self.height() - self.margin)
+
+    def eventFilter(self, obj, event) -> bool:
+        if obj is self.parentWidget() and event.type() == QEvent.Resize and self._toasts:
+            self._reposition()
+        return super().eventFilter(obj, event)